@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Jinja2 backend against the ahead-of-time compiled backend.
+
+Compiles the bundled templates to a temporary module, then times validated rendering
+of each of the 14 sample slide types with both backends.
+
+Usage:
+    python scripts/bench_compiled.py [--number 5000]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from slide_renderer import SlideRenderer
+from slide_renderer.compiler import compile_templates
+
+
+def mean_us(renderer: SlideRenderer, slide_type: str, content, number: int) -> float:
+    """Mean wall time of render(validate=False) on a validated model, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(number):
+        renderer.render(slide_type, content, validate=False)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    """Run the backend benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=5000, help="Renders per slide type")
+    args = parser.parse_args()
+
+    sample_file = Path(__file__).parent.parent / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        sample_data = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        module = compile_templates(output=Path(tmp) / "compiled_templates.py")
+        jinja = SlideRenderer(production=True, backend="jinja2")
+        compiled = SlideRenderer(production=True, backend="compiled", compiled_module=module)
+
+    print(f"{'slide type':<28}{'jinja2 us':>10}{'compiled us':>12}{'speedup':>9}")
+    totals = [0.0, 0.0]
+    for slide_type, content in sample_data.items():
+        model = jinja.validate_content(slide_type, content)
+        row = (
+            mean_us(jinja, slide_type, model, args.number),
+            mean_us(compiled, slide_type, model, args.number),
+        )
+        totals = [t + r for t, r in zip(totals, row)]
+        print(f"{slide_type:<28}{row[0]:>10.2f}{row[1]:>12.2f}{row[0] / row[1]:>8.2f}x")
+
+    print(f"{'TOTAL':<28}{totals[0]:>10.2f}{totals[1]:>12.2f}{totals[0] / totals[1]:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
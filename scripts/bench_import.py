@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark import time of the package entry points against a budget.
+
+Each statement runs in a fresh interpreter under ``python -X importtime``;
+the cumulative time of the modules it imports (interpreter startup
+excluded) is compared with the budget in BUDGETS_MS. Best of --rounds
+runs is kept, after one warm-up run that compiles the .pyc files.
+    - slide_renderer:  bare package import (all public names are lazy)
+    - types:           SlideTypeEnum, metadata not loaded yet
+    - cli:             the slide-renderer console script module
+    - SlideRenderer:   renderer with Jinja2 and the pydantic schemas
+
+Exits with status 1 if any statement is over budget.
+
+Usage:
+    python scripts/bench_import.py [--rounds 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Statement → (label, budget in milliseconds)
+BUDGETS_MS = {
+    "import slide_renderer": ("slide_renderer", 15),
+    "import slide_renderer.types": ("types", 30),
+    "import slide_renderer.cli": ("cli", 80),
+    "from slide_renderer import SlideRenderer": ("SlideRenderer", 600),
+}
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Top-level modules imported by a statement → cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR)},
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and not match.group(3):
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def measure(statement: str, startup: set[str], rounds: int) -> float:
+    """Best import time of a statement over `rounds` runs, in milliseconds."""
+    import_times(statement)  # warm-up: write .pyc files
+
+    best = float("inf")
+    for _ in range(rounds):
+        times = import_times(statement)
+        total = sum(us for module, us in times.items() if module not in startup)
+        best = min(best, total)
+    return best / 1000
+
+
+def main():
+    """Run the import time benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    # Modules the interpreter imports before running any statement
+    startup = set(import_times("pass"))
+
+    over_budget = []
+    print(f"{'import':<16}{'ms':>9}{'budget':>9}")
+    for statement, (label, budget) in BUDGETS_MS.items():
+        ms = measure(statement, startup, args.rounds)
+        status = "✅" if ms <= budget else "❌"
+        print(f"{label:<16}{ms:>9.1f}{budget:>9} {status}")
+        if ms > budget:
+            over_budget.append(label)
+
+    if over_budget:
+        print(f"❌ Over import budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON deck loading: stdlib json vs. orjson vs. pydantic validate_json.
+
+Scales sample_slides.json (all 14 slide types) up to a large deck, writes it
+to a temporary file and times:
+    - text+json:      open in text mode, json.load, deck-level validation
+    - json.loads:     read bytes, stdlib json.loads (parse only)
+    - orjson:         read bytes, orjson.loads (parse only; needs orjson)
+    - validate_json:  read bytes, validate straight from bytes with pydantic
+    - from_file:      SlideRenderer.render_from_file, validate=True (end to end,
+                      including rendering)
+    - from_file-nv:   SlideRenderer.render_from_file, validate=False
+
+Usage:
+    python scripts/bench_json.py [--repeat 2000] [--rounds 5]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from slide_renderer import SlideRenderer, _json
+from slide_renderer.schemas import validate_presentation, validate_presentation_json
+
+
+def load_deck(repeat: int) -> list[dict]:
+    """Build a deck of 14 * repeat slides from the sample data."""
+    sample_file = Path(__file__).parent.parent / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        data = json.load(f)
+
+    slides = [{"type": k, "content": v} for k, v in data.items()]
+    return slides * repeat
+
+
+def best_of(func, rounds: int) -> float:
+    """Return the best wall time of `rounds` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the JSON loading benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000, help="Copies of the 14-slide deck")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    slides = load_deck(args.repeat)
+    renderer = SlideRenderer(production=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "deck.json"
+        path.write_text(json.dumps(slides, ensure_ascii=False), encoding="utf-8")
+        size = path.stat().st_size
+
+        def text_json():
+            with open(path, encoding="utf-8") as f:
+                validate_presentation(json.load(f))
+
+        def stdlib_loads():
+            json.loads(path.read_bytes())
+
+        def orjson_loads():
+            _json.orjson.loads(path.read_bytes())
+
+        results = [
+            ("text+json", best_of(text_json, args.rounds)),
+            ("json.loads", best_of(stdlib_loads, args.rounds)),
+        ]
+        if _json.orjson is not None:
+            results.append(("orjson", best_of(orjson_loads, args.rounds)))
+        results += [
+            (
+                "validate_json",
+                best_of(lambda: validate_presentation_json(path.read_bytes()), args.rounds),
+            ),
+            ("from_file", best_of(lambda: renderer.render_from_file(path), args.rounds)),
+            (
+                "from_file-nv",
+                best_of(lambda: renderer.render_from_file(path, validate=False), args.rounds),
+            ),
+        ]
+
+    baseline = results[0][1]
+    print(f"Deck: {len(slides)} slides, {size / 1024 / 1024:.1f} MiB JSON")
+    print(f"JSON backend: {_json.BACKEND}")
+    print(f"{'path':<15}{'ms/deck':>10}{'us/slide':>10}{'speedup':>9}")
+    for name, ms in results:
+        print(f"{name:<15}{ms:>10.2f}{ms * 1000 / len(slides):>10.2f}{baseline / ms:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
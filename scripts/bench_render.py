@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark single-slide rendering with validation enabled.
+
+Compares, for each of the 14 sample slide types:
+    - dump:  validate → model_dump() → template.render(**dict)  (previous path)
+    - model: validate → template.render(**model fields)         (current path)
+
+Reports mean latency per render and peak bytes allocated per render
+(tracemalloc, measured on a separate untimed pass).
+
+Usage:
+    python scripts/bench_render.py [--number 2000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from slide_renderer import SlideRenderer
+
+
+def render_dump(renderer: SlideRenderer, slide_type: str, content: dict) -> str:
+    """Previous path: validated model is dumped to a fresh dict tree."""
+    validated = renderer.validate_content(slide_type, content)
+    return renderer._get_template(slide_type).render(**validated.model_dump())
+
+
+def render_model(renderer: SlideRenderer, slide_type: str, content: dict) -> str:
+    """Current path: validated model is passed to the template directly."""
+    return renderer.render(slide_type, content, validate=True)
+
+
+def mean_us(func, renderer, slide_type, content, number: int) -> float:
+    """Mean wall time per call, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func(renderer, slide_type, content)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def peak_bytes(func, renderer, slide_type, content) -> int:
+    """Peak traced memory during one call, in bytes."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        func(renderer, slide_type, content)
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    """Run the render benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="Renders per slide type")
+    args = parser.parse_args()
+
+    sample_file = Path(__file__).parent.parent / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        sample_data = json.load(f)
+
+    renderer = SlideRenderer()
+
+    print(f"{'slide type':<28}{'dump us':>9}{'model us':>10}{'dump B':>9}{'model B':>9}")
+    totals = [0.0, 0.0, 0, 0]
+    for slide_type, content in sample_data.items():
+        # Warm up templates and validators
+        render_dump(renderer, slide_type, content)
+        render_model(renderer, slide_type, content)
+
+        row = (
+            mean_us(render_dump, renderer, slide_type, content, args.number),
+            mean_us(render_model, renderer, slide_type, content, args.number),
+            peak_bytes(render_dump, renderer, slide_type, content),
+            peak_bytes(render_model, renderer, slide_type, content),
+        )
+        totals = [t + r for t, r in zip(totals, row)]
+        print(f"{slide_type:<28}{row[0]:>9.1f}{row[1]:>10.1f}{row[2]:>9}{row[3]:>9}")
+
+    print(f"{'TOTAL':<28}{totals[0]:>9.1f}{totals[1]:>10.1f}{totals[2]:>9}{totals[3]:>9}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
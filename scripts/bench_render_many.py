@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch throughput of render_many from 1 to N worker processes.
+
+Renders a backlog of independent decks (each the 14 sample slide types,
+repeated) and reports decks/second and speedup over a single process.
+Worker start-up (template loading, validator build) is included.
+
+Usage:
+    python scripts/bench_render_many.py [--decks 400] [--repeat 10] [--max-workers N]
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from slide_renderer.batch import render_many
+
+
+def main():
+    """Run the batch scaling benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=400, help="Number of decks")
+    parser.add_argument("--repeat", type=int, default=10, help="Copies of 14 slides per deck")
+    parser.add_argument("--chunksize", type=int, default=4, help="Decks per worker task")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    sample_file = Path(__file__).parent.parent / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        data = json.load(f)
+
+    deck = [{"type": k, "content": v} for k, v in data.items()] * args.repeat
+    decks = [deck] * args.decks
+
+    print(f"{args.decks} decks x {len(deck)} slides, chunksize={args.chunksize}")
+    print(f"{'workers':>7}{'seconds':>10}{'decks/s':>10}{'speedup':>9}")
+
+    # 1, 2, 4, ... up to and including max_workers
+    worker_counts = sorted(
+        {min(2**i, args.max_workers) for i in range(args.max_workers.bit_length() + 1)}
+    )
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = list(render_many(decks, workers=workers, chunksize=args.chunksize))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.ok for r in results)
+        baseline = baseline or elapsed
+        decks_per_s = args.decks / elapsed
+        print(f"{workers:>7}{elapsed:>10.2f}{decks_per_s:>10.1f}{baseline / elapsed:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark deck validation: per-slide models vs. the deck-level TypeAdapter.
+
+Builds a deck from sample_slides.json (all 14 slide types, repeated) and times:
+    - per-slide:    get_content_model(type)(**content).model_dump() per slide
+    - adapter:      validate_presentation(slides) - one pydantic-core call
+    - json+slide:   json.loads(bytes) followed by the per-slide path
+    - adapter-json: validate_presentation_json(bytes) - no json.loads at all
+
+Usage:
+    python scripts/bench_validation.py [--repeat 100] [--rounds 20]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from slide_renderer.schemas import (
+    get_content_model,
+    validate_presentation,
+    validate_presentation_json,
+)
+
+
+def load_deck(repeat: int) -> list[dict]:
+    """Build a deck of 14 * repeat slides from the sample data."""
+    sample_file = Path(__file__).parent.parent / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        data = json.load(f)
+
+    slides = [{"type": k, "content": v} for k, v in data.items()]
+    return slides * repeat
+
+
+def per_slide(slides: list[dict]) -> None:
+    """Validate slide by slide, as SlideRenderer did before the adapter."""
+    for slide in slides:
+        model_class = get_content_model(slide["type"])
+        model_class(**slide["content"]).model_dump()
+
+
+def best_of(func, arg, rounds: int) -> float:
+    """Return the best wall time of `rounds` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=100, help="Copies of the 14-slide deck")
+    parser.add_argument("--rounds", type=int, default=20, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    slides = load_deck(args.repeat)
+    data = json.dumps(slides).encode()
+
+    results = [
+        ("per-slide", best_of(per_slide, slides, args.rounds)),
+        ("adapter", best_of(validate_presentation, slides, args.rounds)),
+        ("json+slide", best_of(lambda b: per_slide(json.loads(b)), data, args.rounds)),
+        ("adapter-json", best_of(validate_presentation_json, data, args.rounds)),
+    ]
+
+    baseline = results[0][1]
+    print(f"Deck: {len(slides)} slides, {len(data) / 1024:.1f} KiB JSON")
+    print(f"{'path':<14}{'ms/deck':>10}{'us/slide':>10}{'speedup':>9}")
+    for name, ms in results:
+        print(f"{name:<14}{ms:>10.2f}{ms * 1000 / len(slides):>10.2f}{baseline / ms:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -3,8 +3,8 @@ Main converter: Orchestrates paper to presentation conversion.
 """
 
 from .planning import phase1_plan_presentation
-from .generator import phase2_generate_all_slides
-from .renderer import render_slides_to_markdown
+from .generator import phase2_start_slide_tasks
+from .renderer import arender_slides_as_completed
 from .utils import build_figure_id_to_url_map
 
 
@@ -40,9 +40,10 @@ async def convert_paper_to_presentation(
     plan = phase1_plan_presentation(paper_data, max_slides, target_language)
 
     # Phase 2: Generate slides asynchronously
-    slides = await phase2_generate_all_slides(plan, paper_data, target_language)
+    slide_tasks = phase2_start_slide_tasks(plan, paper_data, target_language)
 
-    # Render to Markdown (with figure_map for ID to URL conversion)
-    markdown = render_slides_to_markdown(slides, output_file, figure_map)
+    # Render each slide to Markdown as soon as it is generated
+    # (with figure_map for ID to URL conversion)
+    markdown = await arender_slides_as_completed(slide_tasks, output_file, figure_map)
 
     return markdown
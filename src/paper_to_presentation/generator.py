@@ -8,6 +8,8 @@ import os
 from typing import List
 from openai import AsyncOpenAI
 
+from slide_renderer.schemas.json_schema import model_schema_json
+
 from .models import PresentationPlan, SlideOutline, SLIDE_TYPE_MODELS
 from .utils import extract_paper_section_text, extract_figures_from_sections
 
@@ -67,8 +69,8 @@ async def phase2_generate_slide(
     }
     lang_name = lang_names.get(target_language, target_language)
 
-    # Get JSON schema
-    schema_info = content_model.model_json_schema()
+    # Get JSON schema (generated and serialized once per slide type)
+    schema_text = model_schema_json(content_model)
 
     prompt = f"""Generate slide content following the plan.
 
@@ -104,7 +106,7 @@ async def phase2_generate_slide(
   * If this slide type requires images but no suitable figures exist, report error
 - Output valid JSON matching the schema
 
-**Schema**: {json.dumps(schema_info, ensure_ascii=False)}
+**Schema**: {schema_text}
 
 Generate the slide as JSON now.
 """
@@ -173,13 +175,17 @@ Regenerate the slide with ALL validation errors fixed.
                 return None
 
 
-async def phase2_generate_all_slides(
+def phase2_start_slide_tasks(
     plan: PresentationPlan,
     paper_data: dict,
     target_language: str = "ko"
-) -> List[dict]:
+) -> List[asyncio.Task]:
     """
-    Phase 2: Generate all slides asynchronously.
+    Phase 2: Start generating all slides concurrently.
+
+    Must be called from a running event loop. Each task resolves to the slide
+    content dict (or None if generation failed), so callers can consume slides
+    as they finish instead of waiting for the whole batch.
 
     Args:
         plan: Presentation plan from Phase 1
@@ -187,7 +193,7 @@ async def phase2_generate_all_slides(
         target_language: Target language code
 
     Returns:
-        List of generated slide contents (excluding failed slides)
+        One task per planned slide, in plan order
     """
     api_key = os.getenv("UPSTAGE_API_KEY")
     if not api_key:
@@ -201,11 +207,32 @@ async def phase2_generate_all_slides(
     print(f"🚀 Generating {len(plan.slides)} slides in parallel...")
 
     # Create async tasks for all slides
-    tasks = [
-        phase2_generate_slide(client, slide_outline, paper_data, target_language)
+    return [
+        asyncio.create_task(
+            phase2_generate_slide(client, slide_outline, paper_data, target_language)
+        )
         for slide_outline in plan.slides
     ]
 
+
+async def phase2_generate_all_slides(
+    plan: PresentationPlan,
+    paper_data: dict,
+    target_language: str = "ko"
+) -> List[dict]:
+    """
+    Phase 2: Generate all slides asynchronously.
+
+    Args:
+        plan: Presentation plan from Phase 1
+        paper_data: Full paper data
+        target_language: Target language code
+
+    Returns:
+        List of generated slide contents (excluding failed slides)
+    """
+    tasks = phase2_start_slide_tasks(plan, paper_data, target_language)
+
     # Execute all tasks concurrently
     slides = await asyncio.gather(*tasks, return_exceptions=True)
 
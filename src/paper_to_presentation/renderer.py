@@ -2,14 +2,30 @@
 Markdown rendering with figure ID to URL conversion.
 """
 
+import asyncio
 import json
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from slide_renderer import SlideRenderer
+from slide_renderer.renderer import MARP_FRONTMATTER, SLIDE_SEPARATOR
+from slide_renderer.writer import write_atomic
 from .utils import convert_figure_ids_to_urls
 
 
+def _to_renderer_slide(slide: dict) -> dict:
+    """Convert a generated slide dict to slide-renderer's {"type", "content"} format."""
+    slide = dict(slide)
+    slide_type = slide.pop("type")  # Extract type (Enum)
+    # Convert Enum to string value if needed
+    if hasattr(slide_type, 'value'):
+        slide_type = slide_type.value
+    return {
+        "type": slide_type,
+        "content": slide  # Rest is content
+    }
+
+
 def render_slides_to_markdown(slides: List[dict], output_file: str, figure_map: dict = None) -> str:
     """
     Render slides to Marp markdown.
@@ -33,16 +49,7 @@ def render_slides_to_markdown(slides: List[dict], output_file: str, figure_map:
 
     # Convert slides to slide-renderer format
     # Format: [{"type": slide_type_string, "content": {...}}]
-    slides_data = []
-    for slide in slides:
-        slide_type = slide.pop("type")  # Extract type (Enum)
-        # Convert Enum to string value if needed
-        if hasattr(slide_type, 'value'):
-            slide_type = slide_type.value
-        slides_data.append({
-            "type": slide_type,
-            "content": slide  # Rest is content
-        })
+    slides_data = [_to_renderer_slide(slide) for slide in slides]
 
     print(f"   Rendering {len(slides_data)} slides...")
 
@@ -51,10 +58,8 @@ def render_slides_to_markdown(slides: List[dict], output_file: str, figure_map:
     try:
         markdown = renderer.render_presentation(slides_data, validate=True)
 
-        # Save to file
-        output_path = Path(output_file)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        # Save to file (temp file + rename: no partial file on a crash)
+        write_atomic(Path(output_file), markdown)
 
         print(f"\n✅ Markdown generated: {output_file}")
         print(f"   File size: {len(markdown)} characters")
@@ -66,3 +71,84 @@ def render_slides_to_markdown(slides: List[dict], output_file: str, figure_map:
         print("\nGenerated slides data:")
         print(json.dumps(slides_data, indent=2, ensure_ascii=False))
         raise
+
+
+async def arender_slides_as_completed(
+    slide_tasks: List[asyncio.Task],
+    output_file: str,
+    figure_map: dict = None
+) -> str:
+    """
+    Render slides to Marp markdown as each generation task finishes.
+
+    Each slide is validated and rendered (off the event loop) as soon as its
+    task completes, overlapping rendering with the slides still being
+    generated. Slides keep their plan order; failed slides are skipped. If a
+    slide fails validation, the error is raised and every slide still being
+    generated or rendered is cancelled.
+
+    Args:
+        slide_tasks: Generation tasks in plan order (see phase2_start_slide_tasks)
+        output_file: Output markdown file path
+        figure_map: Optional dict mapping figure_id to absolute_url
+
+    Returns:
+        Generated markdown content
+    """
+    renderer = SlideRenderer()
+
+    async def render_when_ready(number: int, task: asyncio.Task) -> Optional[str]:
+        try:
+            slide = await task
+        except Exception as e:
+            print(f"   ⚠️  Slide {number} exception: {str(e)[:60]}")
+            return None
+
+        if slide is None:
+            print(f"   ⚠️  Slide {number} returned None")
+            return None
+
+        # Convert Figure IDs to URLs if figure_map provided
+        if figure_map:
+            slide = convert_figure_ids_to_urls([slide], figure_map)[0]
+
+        slide_data = _to_renderer_slide(slide)
+        try:
+            return await renderer.arender(slide_data["type"], slide_data["content"])
+        except ValueError as e:
+            print(f"\n❌ Validation error: {e}")
+            print("\nGenerated slide data:")
+            print(json.dumps(slide_data, indent=2, ensure_ascii=False))
+            raise
+
+    # Slides are rendered as soon as each one is generated
+    print("\n" + "=" * 70)
+    print("RENDERING TO MARKDOWN")
+    print("=" * 70)
+
+    renders = [
+        asyncio.ensure_future(render_when_ready(number, task))
+        for number, task in enumerate(slide_tasks, 1)
+    ]
+    try:
+        rendered = await asyncio.gather(*renders)
+    finally:
+        # On the first failure (or if we're cancelled), stop the slides still
+        # being generated or rendered instead of leaving them running
+        pending = [task for task in (*renders, *slide_tasks) if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    rendered_slides = [markdown for markdown in rendered if markdown is not None]
+
+    print(f"\n✅ Generated {len(rendered_slides)}/{len(slide_tasks)} slides successfully")
+
+    markdown = MARP_FRONTMATTER + SLIDE_SEPARATOR.join(rendered_slides)
+
+    # Save to file atomically, without blocking the event loop
+    await asyncio.to_thread(write_atomic, Path(output_file), markdown)
+
+    print(f"\n✅ Markdown generated: {output_file}")
+    print(f"   File size: {len(markdown)} characters")
+
+    return markdown
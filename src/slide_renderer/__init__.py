@@ -13,50 +13,97 @@ Usage:
 
     renderer = SlideRenderer()
     markdown = renderer.render_presentation(slides_data, validate=True)
+
+Public names are resolved lazily (PEP 562): ``import slide_renderer`` loads
+nothing heavy, and Jinja2 / pydantic are only imported once a name that
+needs them (``SlideRenderer``, a schema, ...) is first accessed.
 """
 
-__version__ = "0.1.0"
+import importlib
 
-from slide_renderer.renderer import SlideRenderer
-from slide_renderer.types import SlideTypeEnum
+__version__ = "0.1.0"
 
-# Content schemas
-from slide_renderer.schemas import (
-    SLIDE_CONTENT_MODELS,
-    HighlightContent,
-    Horizontal3ColumnListContent,
-    Horizontal4ColumnListContent,
-    ImageItem,
-    ImageWithDescription2Content,
-    ImageWithDescription3Content,
-    ListItem,
-    MetricsGridContent,
-    MetricValue,
-    MetricWithDescription,
-    QuoteContent,
-    SectionTitleContent,
-    SingleContentWithImageContent,
-    ThreeColumnMetricsContent,
-    TitleSlideContent,
-    TwoColumnListContent,
-    TwoColumnsWithGridContent,
-    VerticalListContent,
-    get_all_schemas,
-    get_content_model,
-    get_json_schema,
-)
+# Public name → module defining it, imported on first attribute access
+_LAZY_IMPORTS = {
+    # Core renderer
+    "AssetCache": "slide_renderer.assets",
+    "AssetStats": "slide_renderer.assets",
+    "CacheStats": "slide_renderer.cache",
+    "RenderCache": "slide_renderer.cache",
+    "IncrementalRenderer": "slide_renderer.incremental",
+    "RenderPatch": "slide_renderer.incremental",
+    "TextEdit": "slide_renderer.incremental",
+    "PresentationReport": "slide_renderer.renderer",
+    "SlideRenderer": "slide_renderer.renderer",
+    "SlideTypeEnum": "slide_renderer.types",
+    "ThemePoolStats": "slide_renderer.themes",
+    "ThemeRegistry": "slide_renderer.themes",
+    # Content schemas
+    "SLIDE_CONTENT_MODELS": "slide_renderer.schemas.content",
+    "HighlightContent": "slide_renderer.schemas.content",
+    "Horizontal3ColumnListContent": "slide_renderer.schemas.content",
+    "Horizontal4ColumnListContent": "slide_renderer.schemas.content",
+    "ImageItem": "slide_renderer.schemas.content",
+    "ImageWithDescription2Content": "slide_renderer.schemas.content",
+    "ImageWithDescription3Content": "slide_renderer.schemas.content",
+    "ListItem": "slide_renderer.schemas.content",
+    "MetricsGridContent": "slide_renderer.schemas.content",
+    "MetricValue": "slide_renderer.schemas.content",
+    "MetricWithDescription": "slide_renderer.schemas.content",
+    "QuoteContent": "slide_renderer.schemas.content",
+    "SectionTitleContent": "slide_renderer.schemas.content",
+    "SingleContentWithImageContent": "slide_renderer.schemas.content",
+    "ThreeColumnMetricsContent": "slide_renderer.schemas.content",
+    "TitleSlideContent": "slide_renderer.schemas.content",
+    "TwoColumnListContent": "slide_renderer.schemas.content",
+    "TwoColumnsWithGridContent": "slide_renderer.schemas.content",
+    "VerticalListContent": "slide_renderer.schemas.content",
+    "get_all_schemas": "slide_renderer.schemas.content",
+    "get_content_model": "slide_renderer.schemas.content",
+    "get_json_schema": "slide_renderer.schemas.content",
+    "get_json_schema_text": "slide_renderer.schemas.content",
+    # Deck-level validation
+    "PRESENTATION_ADAPTER": "slide_renderer.schemas.presentation",
+    "SLIDE_MODELS": "slide_renderer.schemas.presentation",
+    "Presentation": "slide_renderer.schemas.presentation",
+    "Slide": "slide_renderer.schemas.presentation",
+    "SlideError": "slide_renderer.schemas.presentation",
+    "collect_slide_errors": "slide_renderer.schemas.presentation",
+    "validate_presentation": "slide_renderer.schemas.presentation",
+    "validate_presentation_json": "slide_renderer.schemas.presentation",
+}
 
 __all__ = [
     # Version
     "__version__",
     # Core renderer
     "SlideRenderer",
+    "PresentationReport",
     "SlideTypeEnum",
+    "RenderCache",
+    "CacheStats",
+    "IncrementalRenderer",
+    "RenderPatch",
+    "TextEdit",
+    "ThemeRegistry",
+    "ThemePoolStats",
+    "AssetCache",
+    "AssetStats",
     # Validation schemas
     "SLIDE_CONTENT_MODELS",
     "get_content_model",
     "get_json_schema",
+    "get_json_schema_text",
     "get_all_schemas",
+    # Deck-level validation
+    "Slide",
+    "Presentation",
+    "SLIDE_MODELS",
+    "PRESENTATION_ADAPTER",
+    "validate_presentation",
+    "validate_presentation_json",
+    "SlideError",
+    "collect_slide_errors",
     # Slide content models (14 types)
     "TitleSlideContent",
     "SectionTitleContent",
@@ -78,3 +125,19 @@ __all__ = [
     "MetricValue",
     "MetricWithDescription",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name's module on first access and cache the name."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Module attributes, including public names not imported yet."""
+    return sorted(set(globals()) | set(__all__))
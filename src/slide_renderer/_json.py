@@ -0,0 +1,47 @@
+"""
+JSON parsing backend: orjson when installed, stdlib json otherwise.
+
+orjson parses several times faster than the stdlib and accepts bytes
+directly, so files are read as bytes and parsed without decoding to str.
+Install it with ``pip install slide-renderer[fast]``; nothing else changes.
+
+Usage:
+    from pathlib import Path
+
+    from slide_renderer import _json
+
+    slides = _json.loads(Path("huge.json").read_bytes())
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Name of the active backend: "orjson" or "json"
+BACKEND = "orjson" if orjson is not None else "json"
+
+Buffer = Union[str, bytes, bytearray]
+
+
+def loads(data: Buffer) -> Any:
+    """
+    Parse a JSON document with the fastest available backend.
+
+    Args:
+        data: JSON text as str, bytes or bytearray
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the JSON is malformed (orjson's error type
+            subclasses it, so callers catch the same exception either way)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
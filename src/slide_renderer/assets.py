@@ -0,0 +1,517 @@
+"""
+Local cache of the images decks reference, fetched once and shared by decks.
+
+Templates put ``image_url`` and ``images[].url`` straight into ``<img src>``,
+so every export and preview downloads remote images again (e.g. the arXiv
+figure ``absolute_url`` values of paper decks). AssetCache is a stage between
+loading a deck and rendering it:
+    - every distinct http(s):// image URL of a deck is fetched once, in a
+      bounded thread pool; URLs already in the cache aren't fetched at all,
+      and concurrent requests for a URL share one download
+    - only ``image/*`` responses are stored; anything else (an HTML error
+      page, a PDF) fails like an unreachable image
+    - images are stored by content hash (``<sha256>.<ext>``), so identical
+      images behind different URLs, or in different decks, are stored once
+    - the cache is capped in bytes and evicts least recently used images
+    - the slides are returned with those URLs rewritten to the local files
+      (relative paths, or absolute paths); the input is not modified
+
+Relative URLs, ``data:`` URLs and other schemes are left as they are. So
+are ``file://`` URLs unless the cache is opened with ``allow_file=True``:
+a deck could otherwise copy any local file next to the exported HTML. An
+image that can't be fetched keeps its URL and is reported in the result.
+The URL index is stored in the cache directory (``index.json``); several
+processes may read one cache directory, but only one should write to it.
+
+Usage:
+    from slide_renderer.assets import AssetCache
+
+    assets = AssetCache(".slide-assets", max_bytes=256 * 1024 * 1024)
+    report = assets.localize(slides, relative_to="site/")
+    markdown = renderer.render_presentation(report.slides)
+
+Or from the command line:
+    slide-renderer paper.json -o site/paper.html --format html --asset-cache .slide-assets
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from slide_renderer.writer import write_atomic, write_bytes_atomic
+
+PathLike = Union[str, Path]
+
+# Cache size cap in bytes
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Downloads running at once
+DEFAULT_WORKERS = 8
+
+# Largest single image accepted, in bytes
+MAX_IMAGE_BYTES = 50 * 1024 * 1024
+
+# Seconds to wait for a server before giving up on an image
+DEFAULT_TIMEOUT = 30.0
+
+# URL → blob index, inside the cache directory
+INDEX_NAME = "index.json"
+
+# URL schemes fetched into the cache; file:// only with allow_file=True
+FETCHED_SCHEMES = ("http", "https")
+
+# Content types whose guessed extension is unusual
+_EXTENSIONS = {"image/jpeg": ".jpg", "image/svg+xml": ".svg", "image/x-icon": ".ico"}
+
+
+@dataclass
+class AssetStats:
+    """
+    Counters of an AssetCache.
+
+    Attributes:
+        hits: URLs served from the cache without fetching
+        misses: URLs fetched
+        failures: URLs that couldn't be fetched
+        deduplicated: Fetched images whose content was already stored
+        evictions: Images removed to respect max_bytes
+        bytes_fetched: Bytes downloaded
+    """
+
+    hits: int = 0
+    misses: int = 0
+    failures: int = 0
+    deduplicated: int = 0
+    evictions: int = 0
+    bytes_fetched: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class AssetReport:
+    """
+    Result of localizing a deck's images.
+
+    Attributes:
+        slides: Slides with fetched image URLs rewritten to local paths
+        localized: Original URL → local file, for every image now local
+        failed: Original URL → error message, for images left remote
+    """
+
+    slides: list[Any]
+    localized: dict[str, Path] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every fetchable image is now local."""
+        return not self.failed
+
+
+def is_fetchable(url: str, allow_file: bool = False) -> bool:
+    """Whether a URL is fetched into the cache (http or https, and file if allowed)."""
+    scheme = urllib.parse.urlsplit(url).scheme.lower()
+    return scheme in FETCHED_SCHEMES or (allow_file and scheme == "file")
+
+
+def image_urls(slides: Iterable[Any]) -> list[str]:
+    """
+    Image URLs referenced by slides, in order, without duplicates.
+
+    Args:
+        slides: Slide dictionaries with 'type' and 'content' keys
+
+    Returns:
+        Every ``content.image_url`` and ``content.images[].url`` string
+    """
+    urls: dict[str, None] = {}
+    for slide in slides:
+        content = slide.get("content") if isinstance(slide, dict) else None
+        if not isinstance(content, dict):
+            continue
+        if isinstance(content.get("image_url"), str):
+            urls[content["image_url"]] = None
+        images = content.get("images")
+        if isinstance(images, list):
+            for image in images:
+                if isinstance(image, dict) and isinstance(image.get("url"), str):
+                    urls[image["url"]] = None
+    return list(urls)
+
+
+class AssetCache:
+    """
+    Content-addressed, size-capped LRU cache of deck images on disk.
+
+    Attributes:
+        directory: Cache directory (images sharded by the first two hex digits)
+        max_bytes: Size cap of the stored images
+        workers: Downloads running at once
+        timeout: Seconds to wait for a server
+        max_image_bytes: Largest single image accepted
+        allow_file: Whether file:// URLs are fetched
+        stats: Hit/miss/eviction counters
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_image_bytes: int = MAX_IMAGE_BYTES,
+        allow_file: bool = False,
+    ):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            directory: Cache directory; created if missing, and reused across
+                runs and decks
+            max_bytes: Size cap of the stored images (default: 512 MiB). Least
+                recently used images are evicted past it, except the images
+                of calls still in progress.
+            workers: Downloads running at once (default: 8)
+            timeout: Seconds to wait for a server (default: 30)
+            max_image_bytes: Largest single image accepted (default: 50 MiB)
+            allow_file: Also fetch file:// URLs (default: False). Only for
+                trusted decks: any readable local file would be copied into
+                the cache.
+
+        Raises:
+            ValueError: If max_bytes or workers is less than 1
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.timeout = timeout
+        self.max_image_bytes = max_image_bytes
+        self.allow_file = allow_file
+        self.stats = AssetStats()
+
+        # URL → blob name, and blob name → size in least recently used order
+        self._urls: dict[str, str] = {}
+        self._blobs: OrderedDict[str, int] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        # URL → calls in progress that asked for it: a lease that keeps its
+        # image from being evicted by a call that finishes first
+        self._leases: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    # ========================================================================
+    # LOOKUP
+    # ========================================================================
+
+    def fetch(self, url: str) -> Path:
+        """
+        Local file of an image URL, fetching it on a miss.
+
+        Args:
+            url: http(s):// URL, or file:// URL with allow_file=True
+
+        Returns:
+            Path of the cached image
+
+        Raises:
+            ValueError: If the URL's scheme isn't fetched, or the response
+                isn't an image or is larger than max_image_bytes
+            OSError: If the image can't be fetched (urllib.error.URLError
+                and HTTPError are OSErrors)
+        """
+        if not is_fetchable(url, self.allow_file):
+            if urllib.parse.urlsplit(url).scheme.lower() == "file":
+                raise ValueError(f"file:// URLs need allow_file=True: {url}")
+            raise ValueError(f"Not an http(s):// URL: {url}")
+
+        paths, errors = self._fetch_all([url])
+        if url in errors:
+            raise errors[url]
+        return paths[url]
+
+    def fetch_many(self, urls: Iterable[str]) -> tuple[dict[str, Path], dict[str, str]]:
+        """
+        Fetch many image URLs at once, at most ``workers`` downloads at a time.
+
+        Args:
+            urls: Image URLs (duplicates and non-fetchable URLs are skipped)
+
+        Returns:
+            (URL → local file, URL → error message) for the fetchable URLs
+        """
+        paths, errors = self._fetch_all(urls)
+        return paths, {url: f"{type(e).__name__}: {e}" for url, e in errors.items()}
+
+    def localize(
+        self,
+        slides: list[Any],
+        relative_to: Optional[PathLike] = None,
+        strict: bool = False,
+    ) -> AssetReport:
+        """
+        Fetch a deck's images and point its slides at the local copies.
+
+        Args:
+            slides: Slide dictionaries with 'type' and 'content' keys
+                (not modified; changed slides are copied)
+            relative_to: Directory of the rendered document; local paths are
+                written relative to it (default: absolute paths)
+            strict: Raise on the first image that can't be fetched, instead
+                of keeping its URL (default: False)
+
+        Returns:
+            AssetReport with the rewritten slides
+
+        Raises:
+            OSError, ValueError: With strict=True, if an image can't be fetched
+
+        Example:
+            >>> report = assets.localize(slides, relative_to="site/")
+            >>> report.slides[0]["content"]["image_url"]
+            '../.slide-assets/3f/3f9a...c2.png'
+        """
+        paths, errors = self._fetch_all(image_urls(slides))
+        if strict and errors:
+            raise next(iter(errors.values()))
+
+        if relative_to is not None:
+            base = os.path.abspath(relative_to)
+            local = {
+                url: Path(os.path.relpath(os.path.abspath(path), base)).as_posix()
+                for url, path in paths.items()
+            }
+        else:
+            local = {url: Path(os.path.abspath(path)).as_posix() for url, path in paths.items()}
+
+        return AssetReport(
+            slides=[_rewrite_slide(slide, local) for slide in slides],
+            localized=paths,
+            failed={url: f"{type(e).__name__}: {e}" for url, e in errors.items()},
+        )
+
+    def _fetch_all(self, urls: Iterable[str]) -> tuple[dict[str, Path], dict[str, Exception]]:
+        """Local files of the fetchable URLs, and the errors of the failed ones."""
+        paths: dict[str, Path] = {}
+        errors: dict[str, Exception] = {}
+        waiting: dict[str, Future] = {}
+        to_fetch: list[tuple[str, Future]] = []
+        urls = [url for url in dict.fromkeys(urls) if is_fetchable(url, self.allow_file)]
+
+        with self._lock:
+            self._leases.update(urls)
+            for url in urls:
+                name = self._urls.get(url)
+                if name is not None and self._blob_path(name).is_file():
+                    self._blobs.move_to_end(name)
+                    self.stats.hits += 1
+                    paths[url] = self._blob_path(name)
+                elif url in self._inflight:
+                    # Another call is fetching it: wait for that download
+                    waiting[url] = self._inflight[url]
+                else:
+                    future: Future = Future()
+                    self._inflight[url] = future
+                    waiting[url] = future
+                    to_fetch.append((url, future))
+
+        try:
+            if to_fetch:
+                with ThreadPoolExecutor(min(self.workers, len(to_fetch))) as pool:
+                    for url, future in to_fetch:
+                        pool.submit(self._fetch_into, url, future)
+
+            for url, future in waiting.items():
+                try:
+                    paths[url] = self._blob_path(future.result())
+                except Exception as e:
+                    errors[url] = e
+        finally:
+            with self._lock:
+                if to_fetch:
+                    # This call's images are still leased, so they are kept too
+                    self._evict(keep={self._urls[url] for url in self._leases if url in self._urls})
+                    self._save_index()
+                self._leases.subtract(urls)
+                for url in urls:
+                    if self._leases[url] <= 0:
+                        del self._leases[url]
+        return paths, errors
+
+    def _fetch_into(self, url: str, future: Future) -> None:
+        """Download one URL into the cache and resolve its future with the blob name."""
+        try:
+            data, content_type = self._download(url)
+            name = hashlib.sha256(data).hexdigest() + _extension(content_type)
+            path = self._blob_path(name)
+
+            with self._lock:
+                self.stats.misses += 1
+                self.stats.bytes_fetched += len(data)
+                stored = name in self._blobs and path.is_file()
+                if stored:
+                    self.stats.deduplicated += 1
+            if not stored:
+                # Temp file + rename, so readers never see partial images
+                write_bytes_atomic(path, data)
+
+            with self._lock:
+                self._urls[url] = name
+                self._blobs[name] = len(data)
+                self._blobs.move_to_end(name)
+                self._inflight.pop(url, None)
+            future.set_result(name)
+
+        except Exception as e:
+            with self._lock:
+                self.stats.failures += 1
+                self._inflight.pop(url, None)
+            future.set_exception(e)
+
+    def _download(self, url: str) -> tuple[bytes, str]:
+        """Contents and content type of a URL, refusing non-images and oversized images."""
+        from slide_renderer import __version__
+
+        headers = {"User-Agent": f"slide-renderer/{__version__}"}
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            content_type = response.headers.get_content_type()
+            # file:// responses get a content type guessed from the file name
+            if not content_type.startswith("image/"):
+                raise ValueError(f"Not an image ({content_type}): {url}")
+            data = response.read(self.max_image_bytes + 1)
+
+        if len(data) > self.max_image_bytes:
+            raise ValueError(f"Image larger than {self.max_image_bytes} bytes: {url}")
+        return data, content_type
+
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+
+    @property
+    def total_bytes(self) -> int:
+        """Size of the stored images."""
+        return sum(self._blobs.values())
+
+    def __len__(self) -> int:
+        """Number of stored images."""
+        return len(self._blobs)
+
+    def clear(self) -> None:
+        """Remove every image and URL from the cache and reset the stats."""
+        with self._lock:
+            for name in list(self._blobs):
+                self._remove_blob(name)
+            self._urls.clear()
+            self.stats = AssetStats()
+            self._save_index()
+
+    def _blob_path(self, name: str) -> Path:
+        """Path of a stored image, sharded by the first two hex digits."""
+        return self.directory / name[:2] / name
+
+    def _remove_blob(self, name: str) -> None:
+        """Delete a stored image (lock held)."""
+        self._blobs.pop(name, None)
+        try:
+            self._blob_path(name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep: set[str]) -> None:
+        """Remove least recently used images past max_bytes, except keep (lock held)."""
+        total = self.total_bytes
+        for name in list(self._blobs):
+            if total <= self.max_bytes:
+                break
+            if name in keep:
+                continue
+            total -= self._blobs[name]
+            self._remove_blob(name)
+            self.stats.evictions += 1
+
+        if len(self._urls) > len(self._blobs):
+            self._urls = {url: name for url, name in self._urls.items() if name in self._blobs}
+
+    def _load_index(self) -> None:
+        """Read the URL index; a missing or unreadable index starts empty."""
+        try:
+            index = json.loads((self.directory / INDEX_NAME).read_text(encoding="utf-8"))
+            blobs = [(str(name), int(size)) for name, size in index["blobs"]]
+            urls = {str(url): str(name) for url, name in index["urls"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        for name, size in blobs:
+            if self._blob_path(name).is_file():
+                self._blobs[name] = size
+        self._urls = {url: name for url, name in urls.items() if name in self._blobs}
+
+    def _save_index(self) -> None:
+        """Write the URL index atomically (lock held)."""
+        index = {
+            "version": 1,
+            "updated": time.time(),
+            # Least recently used first
+            "blobs": list(self._blobs.items()),
+            "urls": self._urls,
+        }
+        write_atomic(
+            self.directory / INDEX_NAME,
+            json.dumps(index, ensure_ascii=False, separators=(",", ":")),
+            compression="none",
+        )
+
+
+def _extension(content_type: str) -> str:
+    """File suffix of an image from its content type ("" for unknown image types)."""
+    return _EXTENSIONS.get(content_type) or mimetypes.guess_extension(content_type) or ""
+
+
+def _rewrite_slide(slide: Any, local: dict[str, str]) -> Any:
+    """Copy of a slide with its image URLs replaced, or the slide itself if unchanged."""
+    content = slide.get("content") if isinstance(slide, dict) else None
+    if not isinstance(content, dict):
+        return slide
+
+    new_content = None
+    image_url = content.get("image_url")
+    if isinstance(image_url, str) and image_url in local:
+        new_content = dict(content, image_url=local[image_url])
+
+    images = content.get("images")
+    if isinstance(images, list):
+        new_images = []
+        for image in images:
+            url = image.get("url") if isinstance(image, dict) else None
+            if isinstance(url, str) and url in local:
+                image = dict(image, url=local[url])
+            new_images.append(image)
+        if any(new is not old for new, old in zip(new_images, images)):
+            new_content = dict(new_content or content, images=new_images)
+
+    if new_content is None:
+        return slide
+    return dict(slide, content=new_content)
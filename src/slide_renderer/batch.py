@@ -0,0 +1,181 @@
+"""
+Multi-core batch rendering for many independent decks.
+
+Each worker process holds one warm SlideRenderer: templates are loaded and
+the pydantic validators are built once when the worker starts, then reused
+for every deck the worker receives. A failing deck is reported in its
+DeckResult instead of aborting the batch.
+
+Usage:
+    from slide_renderer.batch import render_many
+
+    for result in render_many(decks, workers=4):
+        if result.ok:
+            print(result.index, len(result.markdown))
+        else:
+            print(result.index, result.error)
+
+The ``slide-renderer`` command renders several input files through
+render_many:
+    slide-renderer 'decks/*.json' -o output/ -j 4
+"""
+
+import multiprocessing
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from slide_renderer.cache import RenderCache
+from slide_renderer.renderer import SlideRenderer
+
+# A deck is either a list of slide dictionaries or a path to a JSON/JSONL file
+Deck = Union[list[dict[str, Any]], str, Path]
+
+
+@dataclass
+class DeckResult:
+    """
+    Outcome of rendering one deck in a batch.
+
+    Attributes:
+        index: Position of the deck in the input
+        markdown: Rendered presentation (None if rendering failed)
+        error: Error message (None if rendering succeeded)
+    """
+
+    index: int
+    markdown: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the deck rendered successfully."""
+        return self.error is None
+
+
+# Per-process renderer, created once by _init_worker
+_worker_renderer: Optional[SlideRenderer] = None
+
+
+def _make_renderer(options: dict[str, Any]) -> SlideRenderer:
+    """
+    Build a warm SlideRenderer from ``render_many``'s renderer options.
+
+    ``options["cache"]``, if set, is the (maxsize, directory, max_disk_bytes)
+    of a RenderCache to create: caches hold locks and can't be sent to other
+    processes.
+    """
+    options = dict(options)
+    cache = options.pop("cache", None)
+    if cache is not None:
+        options["cache"] = RenderCache(*cache)
+    # Production mode compiles every template up front, so the first deck
+    # doesn't pay for it and no template file is checked again
+    return SlideRenderer(production=True, **options)
+
+
+def _init_worker(options: dict[str, Any]) -> None:
+    """Create and warm up this worker's SlideRenderer."""
+    global _worker_renderer
+    _worker_renderer = _make_renderer(options)
+
+
+def _render_deck(renderer: SlideRenderer, job: tuple[int, Deck, bool, bool, str]) -> DeckResult:
+    """Render one deck, capturing any error in the result."""
+    index, deck, validate, include_frontmatter, input_format = job
+
+    try:
+        if isinstance(deck, (str, Path)):
+            markdown = renderer.render_from_file(
+                deck,
+                validate=validate,
+                include_frontmatter=include_frontmatter,
+                input_format=input_format,
+            )
+        else:
+            markdown = renderer.render_presentation(
+                deck, validate=validate, include_frontmatter=include_frontmatter
+            )
+    except Exception as e:
+        return DeckResult(index=index, error=f"{type(e).__name__}: {e}")
+
+    return DeckResult(index=index, markdown=markdown)
+
+
+def _render_deck_in_worker(job: tuple[int, Deck, bool, bool, str]) -> DeckResult:
+    """Render one deck with this worker process's warm renderer."""
+    return _render_deck(_worker_renderer, job)
+
+
+def render_many(
+    decks: Iterable[Deck],
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    validate: bool = True,
+    include_frontmatter: bool = True,
+    input_format: str = "auto",
+    template_dir: Union[str, Path, None] = None,
+    renderer_options: Optional[dict[str, Any]] = None,
+) -> Iterator[DeckResult]:
+    """
+    Render many independent decks in parallel worker processes.
+
+    Args:
+        decks: Iterable of decks (slide lists or paths to JSON files)
+        workers: Number of worker processes (default: CPU count).
+            With ``workers=1`` decks are rendered in the calling process.
+        chunksize: Decks sent to a worker per task (default: 1). Larger
+            chunks cut IPC overhead for many small decks.
+        ordered: Yield results in input order (default: True); otherwise
+            yield each result as soon as it completes
+        validate: Whether to validate content (default: True)
+        include_frontmatter: Whether to include Marp frontmatter (default: True)
+        input_format: Format of deck files - "json", "jsonl" or "auto"
+            (default: by file suffix)
+        template_dir: Templates directory for the workers (default: the bundled templates)
+        renderer_options: SlideRenderer arguments for the workers, replacing
+            template_dir (see ``SlideRenderer.render_many``); "cache" is the
+            (maxsize, directory) of a RenderCache each worker creates
+
+    Yields:
+        DeckResult for each deck; ``result.index`` identifies the input deck
+
+    Raises:
+        ValueError: If the renderer options can't be sent to worker
+            processes (e.g. a loader built from a lambda); use workers=1
+
+    Example:
+        >>> results = list(render_many([deck_a, "deck_b.json"], workers=2))
+        >>> [r.ok for r in results]
+        [True, True]
+    """
+    options = renderer_options if renderer_options is not None else {"template_dir": template_dir}
+    jobs = (
+        (i, deck, validate, include_frontmatter, input_format) for i, deck in enumerate(decks)
+    )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        renderer = _make_renderer(options)
+        for job in jobs:
+            yield _render_deck(renderer, job)
+        return
+
+    try:
+        pickle.dumps(options)
+    except Exception as e:
+        raise ValueError(
+            f"Renderer settings can't be sent to worker processes ({e}); use workers=1"
+        ) from e
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(options,)) as pool:
+        if ordered:
+            yield from pool.imap(_render_deck_in_worker, jobs, chunksize=chunksize)
+        else:
+            yield from pool.imap_unordered(_render_deck_in_worker, jobs, chunksize=chunksize)
+
@@ -0,0 +1,285 @@
+"""
+Content-addressed cache of rendered slides.
+
+Entries are keyed on the slide type, a canonical hash of the slide content
+and a fingerprint of the template source, so a cache hit skips both
+validation and Jinja2 rendering, and editing a template naturally misses.
+
+Both tiers are bounded: memory by entry count, disk by total size. Disk
+entries are evicted least recently used first, by file mtime, so the order
+survives restarts.
+
+Usage:
+    from slide_renderer import RenderCache, SlideRenderer
+
+    cache = RenderCache(maxsize=4096, directory=".slide-cache", max_disk_bytes=64 * 1024 * 1024)
+    renderer = SlideRenderer(cache=cache)
+
+    renderer.render_presentation(slides)   # misses, fills the cache
+    renderer.render_presentation(slides)   # hits
+    print(cache.stats)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+from slide_renderer.writer import write_atomic
+
+# Default size cap of the on-disk tier
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for a RenderCache.
+
+    Attributes:
+        hits: Lookups served from memory or disk
+        misses: Lookups not found in any tier
+        evictions: Entries dropped from memory to respect maxsize
+        disk_hits: Subset of hits served from the on-disk tier
+        disk_evictions: Entries deleted from disk to respect max_disk_bytes
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RenderCache:
+    """
+    LRU cache of rendered slide markdown with an optional on-disk tier.
+
+    Attributes:
+        maxsize: Maximum number of entries kept in memory
+        directory: Directory of the on-disk tier (None = memory only)
+        max_disk_bytes: Size cap of the on-disk tier
+        stats: Hit/miss/eviction counters
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        directory: Union[str, Path, None] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        """
+        Initialize a cache, indexing the entries already on disk.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory (default: 1024)
+            directory: Optional directory for a persistent on-disk tier. Disk
+                entries survive restarts and are promoted to memory on a hit.
+            max_disk_bytes: Size cap of the on-disk tier (default: 256 MiB).
+                Least recently used entries are deleted past it.
+
+        Raises:
+            ValueError: If maxsize or max_disk_bytes is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if max_disk_bytes < 1:
+            raise ValueError(f"max_disk_bytes must be at least 1, got {max_disk_bytes}")
+
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # Disk tier index: key → file size, least recently used first. Disk
+        # I/O happens under its own lock so memory hits never wait on it.
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def make_key(
+        slide_type: str,
+        content: Union[dict[str, Any], BaseModel],
+        template_fingerprint: str,
+        validate: bool = True,
+    ) -> str:
+        """
+        Build the cache key for one slide.
+
+        Args:
+            slide_type: Slide type value (e.g., "title_slide")
+            content: Content data dictionary or content model
+            template_fingerprint: Hash of the template source
+            validate: Whether the slide is rendered with validation
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+
+        canonical = json.dumps(
+            content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        key_source = f"{slide_type}\0{template_fingerprint}\0{int(validate)}\0{canonical}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up rendered markdown by key.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached markdown, or None on a miss
+        """
+        with self._lock:
+            rendered = self._entries.get(key)
+            if rendered is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return rendered
+
+        rendered = self._read_disk(key)
+
+        with self._lock:
+            if rendered is None:
+                self.stats.misses += 1
+                return None
+
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._store(key, rendered)
+
+        with self._disk_lock:
+            self._touch_disk(key, rendered)
+        return rendered
+
+    def put(self, key: str, rendered: str) -> None:
+        """
+        Store rendered markdown under a key.
+
+        Args:
+            key: Key from ``make_key``
+            rendered: Rendered slide markdown
+        """
+        with self._lock:
+            self._store(key, rendered)
+
+        self._write_disk(key, rendered)
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk and reset the stats."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+        if self.directory is None:
+            return
+
+        # Under the disk lock, so no write lands between the glob and the reset
+        with self._disk_lock:
+            for path in self.directory.glob("*/*.md"):
+                path.unlink(missing_ok=True)
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    @property
+    def disk_bytes(self) -> int:
+        """Total size of the entries in the on-disk tier."""
+        return self._disk_bytes
+
+    def __len__(self) -> int:
+        """Number of entries held in memory."""
+        return len(self._entries)
+
+    def _store(self, key: str, rendered: str) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        self._entries[key] = rendered
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        """Path of a disk entry, sharded by the first two hex digits."""
+        return self.directory / key[:2] / f"{key}.md"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        """Read an entry from the disk tier, if enabled and present."""
+        if self.directory is None:
+            return None
+
+        try:
+            return self._disk_path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key: str, rendered: str) -> None:
+        """Write an entry to the disk tier atomically, if enabled."""
+        if self.directory is None:
+            return
+
+        with self._disk_lock:
+            # Temp file + rename, so readers never see partial entries
+            write_atomic(self._disk_path(key), rendered, compression="none")
+            self._index_disk(key, len(rendered.encode("utf-8")))
+            self._evict_disk()
+
+    def _touch_disk(self, key: str, rendered: str) -> None:
+        """Mark a disk entry as just used, on disk too (disk lock held)."""
+        try:
+            os.utime(self._disk_path(key))
+        except FileNotFoundError:
+            return  # Evicted or cleared since it was read
+        self._index_disk(key, len(rendered.encode("utf-8")))
+
+    def _index_disk(self, key: str, size: int) -> None:
+        """Record a disk entry as most recently used (disk lock held)."""
+        self._disk_bytes += size - self._disk.pop(key, 0)
+        self._disk[key] = size
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries past max_disk_bytes (disk lock held)."""
+        # The newest entry is kept even if it alone exceeds the cap
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._disk_path(key).unlink(missing_ok=True)
+            self.stats.disk_evictions += 1
+
+    def _load_disk_index(self) -> None:
+        """Index the entries already on disk, oldest mtime first."""
+        entries = []
+        for path in self.directory.glob("*/*.md"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, path.stem, stat.st_size))
+
+        with self._disk_lock:
+            for _, key, size in sorted(entries):
+                self._index_disk(key, size)
+            self._evict_disk()
@@ -0,0 +1,634 @@
+"""
+Command-line interface: render slide JSON to Marp markdown or HTML.
+
+Reads one deck from stdin or a file and streams the presentation to stdout,
+or renders many files (and glob patterns) into an output directory, in
+parallel with ``--jobs``. JSON Lines input (one slide per line) and large
+JSON arrays are parsed incrementally, so huge dumps render in constant memory.
+``--watch`` keeps running and re-renders decks as they or their templates
+change. Heavy imports (Jinja2, pydantic) are deferred until after argument
+parsing, so ``--help`` and usage errors stay instant.
+
+Exit codes:
+    0  Success
+    1  Invalid input: malformed JSON, validation or render error
+    2  Usage error (bad arguments, no input, glob matched nothing)
+    3  I/O error (input file missing or unreadable, output not writable)
+
+Usage:
+    slide-renderer -i slides.json -o presentation.md
+    cat slides.json | slide-renderer > presentation.md
+    export-slides | slide-renderer --input-format jsonl > huge.md
+    slide-renderer 'decks/*.json' -o output/ --jobs 4
+    slide-renderer talk.json -o talk.md --watch
+    slide-renderer talk.json -o talk.html --format html    # no Marp CLI needed
+    slide-renderer talk.json -o talk.html --format html --font-dir fonts/   # offline
+    slide-renderer decks/ -o site/ --jobs 8     # incremental, see directory.py
+    slide-renderer paper.json -o site/ --asset-cache .slide-assets   # local images
+"""
+
+import argparse
+import contextlib
+import glob
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+EXIT_OK = 0
+EXIT_INVALID_INPUT = 1
+EXIT_USAGE = 2
+EXIT_IO_ERROR = 3
+
+STDIN = "-"
+
+# JSON files larger than this are parsed incrementally instead of whole
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# --compress value → suffix appended to output file names in a directory
+_COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class _UsageError(Exception):
+    """Bad command-line usage (exit code 2)."""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="slide-renderer",
+        description="Render JSON slides to Marp markdown presentations.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        metavar="INPUT",
+        help="Slide JSON files, glob patterns or one directory tree "
+        "('-' = stdin, the default)",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        dest="extra_inputs",
+        metavar="INPUT",
+        help="Slide JSON file or glob pattern (repeatable)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Output file for a single input ('-' = stdout, the default), "
+        "or output directory for several inputs",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["markdown", "fragment", "html"],
+        default="markdown",
+        help="markdown: full Marp presentation (default); "
+        "fragment: slides only, without frontmatter; "
+        "html: standalone HTML deck with the theme inlined",
+    )
+    parser.add_argument(
+        "--theme",
+        default=None,
+        metavar="CSS",
+        help="Theme CSS inlined by --format html (default: custom-style.css)",
+    )
+    parser.add_argument(
+        "--shake-css",
+        action="store_true",
+        help="With --format html: inline only the CSS rules the deck's slide types "
+        "need, minified (not with --stream or JSON Lines)",
+    )
+    parser.add_argument(
+        "--font-dir",
+        default=None,
+        metavar="DIR",
+        help="With --format html: embed the theme's fonts from this local directory, "
+        "only the weights used, subset to the deck's characters when fontTools is "
+        "installed (not with --stream or JSON Lines)",
+    )
+    parser.add_argument(
+        "--font-files",
+        action="store_true",
+        help="With --font-dir: write the fonts into fonts/ next to the output "
+        "instead of inlining them",
+    )
+    parser.add_argument(
+        "--font-cache",
+        default=None,
+        metavar="DIR",
+        help="With --font-dir: keep subset fonts in this directory across runs",
+    )
+    parser.add_argument(
+        "--asset-cache",
+        default=None,
+        metavar="DIR",
+        help="Fetch the decks' remote images once into this cache directory and "
+        "point the slides at the local copies (not with --stream, a single JSON "
+        "Lines input, directory inputs or --watch)",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress file outputs (default: by -o suffix, .gz or .zst; "
+        "files in an output directory get the suffix added)",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=["auto", "json", "jsonl"],
+        default="auto",
+        help="json: array of slides; jsonl: one slide per line "
+        "(default: auto, jsonl for .jsonl/.ndjson files)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse JSON input incrementally in constant memory "
+        f"(always on for JSON Lines and files over {STREAM_THRESHOLD >> 20} MiB)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for several inputs (default: 1; 0 = CPU count)",
+    )
+    parser.add_argument("--no-validate", action="store_true", help="Skip schema validation")
+    parser.add_argument(
+        "--template-dir",
+        default=None,
+        help="Templates directory replacing the bundled templates (default: bundled)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With a directory input: re-render every deck, even if unchanged",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render when a deck or template changes",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.1,
+        help="Seconds between file checks in --watch mode (default: 0.1)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Report progress on stderr")
+    return parser
+
+
+def _expand_inputs(patterns: list[str]) -> list[str]:
+    """
+    Expand glob patterns, keeping plain paths and '-' as given.
+
+    Raises:
+        _UsageError: If a glob pattern matches nothing
+        FileNotFoundError: If a plain path doesn't exist
+    """
+    inputs = []
+    for pattern in patterns:
+        if pattern == STDIN:
+            inputs.append(pattern)
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise _UsageError(f"No files match: {pattern}")
+            inputs.extend(matches)
+        elif not os.path.exists(pattern):
+            raise FileNotFoundError(f"JSON file not found: {pattern}")
+        else:
+            inputs.append(pattern)
+
+    return inputs
+
+
+def _read_input(path: str) -> bytes:
+    """Read a whole input as bytes ('-' = stdin)."""
+    if path == STDIN:
+        return sys.stdin.buffer.read()
+
+    return Path(path).read_bytes()
+
+
+def _should_stream(args: argparse.Namespace, input_path: str, input_format: str) -> bool:
+    """Whether to parse an input incrementally rather than all at once."""
+    if args.stream or input_format == "jsonl":
+        return True
+    return input_path != STDIN and os.path.getsize(input_path) > STREAM_THRESHOLD
+
+
+def _output_name(args: argparse.Namespace, input_path: str) -> str:
+    """File name of an input's output inside an output directory."""
+    stem = "presentation" if input_path == STDIN else Path(input_path).stem
+    suffix = ".html" if args.format == "html" else ".md"
+    return stem + suffix + _COMPRESSED_SUFFIXES.get(args.compress, "")
+
+
+def _output_names(args: argparse.Namespace, inputs: list[str]) -> dict[str, str]:
+    """
+    Output file name of each input inside an output directory.
+
+    Raises:
+        _UsageError: If two different inputs map to the same output name
+            (e.g. x/deck.json and y/deck.json, or deck.json and deck.jsonl)
+    """
+    names: dict[str, str] = {}
+    owners: dict[str, str] = {}
+    for input_path in inputs:
+        name = _output_name(args, input_path)
+        owner = owners.setdefault(name, input_path)
+        if os.path.abspath(owner) != os.path.abspath(input_path):
+            raise _UsageError(f"{owner} and {input_path} would both be written to {name}")
+        names[input_path] = name
+    return names
+
+
+def _output_path(args: argparse.Namespace, input_path: str) -> Path:
+    """Output file for a single input: -o FILE, or <stem>.md (.html) inside -o DIR."""
+    output_path = Path(args.output)
+    if args.output.endswith(("/", os.sep)) or output_path.is_dir():
+        output_path = output_path / _output_name(args, input_path)
+    return output_path
+
+
+def _load_theme(args: argparse.Namespace) -> Optional[str]:
+    """Theme CSS for --format html, None for markdown output."""
+    if args.format != "html":
+        return None
+
+    from slide_renderer.htmlexport import load_theme
+
+    return load_theme(args.theme)
+
+
+def _parse_deck(data):
+    """A deck's slide list, or None if its JSON is malformed or not a list."""
+    from slide_renderer import _json
+
+    try:
+        slides = _json.loads(data)
+    except ValueError:
+        # Rendering reports the malformed JSON
+        return None
+    return slides if isinstance(slides, list) else None
+
+
+def _load_deck(args: argparse.Namespace, input_path: str):
+    """Slide list of a deck file (JSON or JSON Lines), or None if unreadable."""
+    from slide_renderer.jsonstream import detect_input_format, iter_slides
+
+    try:
+        if detect_input_format(input_path, args.input_format) == "jsonl":
+            with open(input_path, "rb") as fp:
+                return list(iter_slides(fp, "jsonl"))
+        return _parse_deck(Path(input_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _deck_stylesheet(data, theme_css: str, renderer) -> str:
+    """Theme CSS shaken to the slide types of a deck's JSON (whole CSS if unreadable)."""
+    from slide_renderer.stylesheet import deck_stylesheet
+
+    slides = _parse_deck(data)
+    if slides is None:
+        return theme_css
+
+    slide_types = [slide.get("type") for slide in slides if isinstance(slide, dict)]
+    return deck_stylesheet(slide_types, theme_css, renderer=renderer)
+
+
+def _embed_fonts(args: argparse.Namespace, document: str, output_path: Optional[Path]) -> str:
+    """HTML deck with --font-dir fonts embedded, or written next to output_path."""
+    from slide_renderer.fonts import embed_fonts
+
+    return embed_fonts(
+        document,
+        args.font_dir,
+        output=output_path if args.font_files else None,
+        cache_dir=args.font_cache,
+    )
+
+
+def _localize_images(args: argparse.Namespace, decks: list, relative_to: Optional[Path]) -> list:
+    """Slide lists with their images fetched into --asset-cache and made local."""
+    from slide_renderer.assets import AssetCache
+
+    assets = AssetCache(args.asset_cache)
+    # All decks in one call: one bounded download pool, each URL fetched once
+    slides = [slide for deck in decks if isinstance(deck, list) for slide in deck]
+    report = assets.localize(slides, relative_to=relative_to)
+
+    for url, error in report.failed.items():
+        print(f"⚠️  {url}: {error} (left remote)", file=sys.stderr)
+    if args.verbose:
+        stats = assets.stats
+        print(
+            f"Images: {stats.hits} cached, {stats.misses} fetched, {stats.failures} failed",
+            file=sys.stderr,
+        )
+
+    localized = []
+    rest = iter(report.slides)
+    for deck in decks:
+        localized.append([next(rest) for _ in deck] if isinstance(deck, list) else deck)
+    return localized
+
+
+def _render_one(args: argparse.Namespace, input_path: str) -> int:
+    """Render a single deck, streaming it to stdout or an output file."""
+    from slide_renderer.jsonstream import detect_input_format, iter_slides
+    from slide_renderer.renderer import SlideRenderer
+    from slide_renderer.writer import write_atomic
+
+    # One deck: compile only the templates it uses, on first use. Production
+    # mode compiles every template up front, which pays off only for the
+    # multi-deck path, whose render_many workers each render many decks.
+    renderer = SlideRenderer(args.template_dir)
+    validate = not args.no_validate
+    include_frontmatter = args.format != "fragment"
+    input_format = detect_input_format(input_path, args.input_format)
+    theme_css = _load_theme(args)
+    to_stdout = args.output is None or args.output == STDIN
+    output_path = None if to_stdout else _output_path(args, input_path)
+
+    with contextlib.ExitStack() as stack:
+        if _should_stream(args, input_path, input_format):
+            for option in ("shake_css", "font_dir", "asset_cache"):
+                if getattr(args, option):
+                    raise _UsageError(
+                        f"--{option.replace('_', '-')} needs the whole deck "
+                        "(not --stream or JSON Lines)"
+                    )
+            if input_path == STDIN:
+                fp = sys.stdin.buffer
+            else:
+                fp = stack.enter_context(open(input_path, "rb"))
+            chunks = renderer.render_presentation_iter(
+                iter_slides(fp, input_format),
+                validate=validate,
+                include_frontmatter=include_frontmatter,
+            )
+        else:
+            data = _read_input(input_path)
+            if theme_css is not None and args.shake_css:
+                theme_css = _deck_stylesheet(data, theme_css, renderer)
+            slides = None
+            if args.asset_cache:
+                slides = _localize_images(
+                    args, [_parse_deck(data)], output_path.parent if output_path else None
+                )[0]
+            if isinstance(slides, list):
+                chunks = renderer.render_presentation_iter(
+                    slides, validate=validate, include_frontmatter=include_frontmatter
+                )
+            else:
+                chunks = renderer.render_json_iter(
+                    data,
+                    validate=validate,
+                    include_frontmatter=include_frontmatter,
+                )
+
+        if theme_css is not None:
+            from slide_renderer.htmlexport import iter_html
+
+            chunks = iter_html(chunks, theme_css)
+
+        if args.font_dir:
+            if to_stdout and args.font_files:
+                raise _UsageError("--font-files needs an output file (-o)")
+            chunks = [_embed_fonts(args, "".join(chunks), output_path)]
+
+        if to_stdout:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            sys.stdout.flush()
+            return EXIT_OK
+
+        # Written through a temp file, so a failing deck doesn't leave a
+        # truncated output behind
+        write_atomic(output_path, chunks, compression=args.compress or "auto")
+
+    if args.verbose:
+        print(f"✅ {input_path} → {output_path}", file=sys.stderr)
+    return EXIT_OK
+
+
+def _render_all(args: argparse.Namespace, inputs: list[str]) -> int:
+    """Render several decks into the output directory, in parallel."""
+    from slide_renderer.batch import render_many
+    from slide_renderer.writer import write_atomic
+
+    if args.output is None or args.output == STDIN:
+        raise _UsageError("Several inputs need an output directory (-o DIR)")
+    if STDIN in inputs:
+        raise _UsageError("'-' (stdin) can only be used as the only input")
+
+    output_names = _output_names(args, inputs)
+    theme_css = _load_theme(args)
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Templates scanned for CSS classes by --shake-css (None = bundled)
+    template_renderer = None
+    if args.shake_css and args.template_dir is not None:
+        from slide_renderer.renderer import SlideRenderer
+
+        template_renderer = SlideRenderer(args.template_dir)
+
+    decks = inputs
+    if args.asset_cache:
+        decks = _localize_images(args, [_load_deck(args, path) for path in inputs], output_dir)
+        # Decks that couldn't be loaded are rendered from their file, which reports why
+        decks = [path if deck is None else deck for path, deck in zip(inputs, decks)]
+
+    failed = 0
+    for result in render_many(
+        decks,
+        workers=args.jobs or None,
+        ordered=False,
+        validate=not args.no_validate,
+        include_frontmatter=args.format != "fragment",
+        input_format=args.input_format,
+        template_dir=args.template_dir,
+    ):
+        input_path = Path(inputs[result.index])
+        if not result.ok:
+            failed += 1
+            print(f"❌ {input_path}: {result.error}", file=sys.stderr)
+            continue
+
+        output_path = output_dir / output_names[inputs[result.index]]
+        document = result.markdown
+        if theme_css is not None:
+            from slide_renderer.htmlexport import markdown_to_html
+
+            css = theme_css
+            if args.shake_css:
+                data = Path(input_path).read_bytes()
+                css = _deck_stylesheet(data, theme_css, template_renderer)
+            document = markdown_to_html(document, css)
+            if args.font_dir:
+                document = _embed_fonts(args, document, output_path)
+        write_atomic(output_path, document, compression=args.compress or "auto")
+        if args.verbose:
+            print(f"✅ {input_path} → {output_path}", file=sys.stderr)
+
+    if args.verbose:
+        print(f"Rendered {len(inputs) - failed}/{len(inputs)} decks", file=sys.stderr)
+    return EXIT_INVALID_INPUT if failed else EXIT_OK
+
+
+def _render_tree(args: argparse.Namespace, src: str) -> int:
+    """Render a directory tree incrementally (see slide_renderer.directory)."""
+    from slide_renderer.directory import render_directory
+
+    if args.output is None or args.output == STDIN:
+        raise _UsageError("A directory input needs an output directory (-o DIR)")
+    if args.format == "html":
+        raise _UsageError("--format html is not supported for directory inputs")
+    if args.asset_cache:
+        raise _UsageError("--asset-cache is not supported for directory inputs")
+
+    report = render_directory(
+        src,
+        args.output,
+        workers=args.jobs or None,
+        validate=not args.no_validate,
+        include_frontmatter=args.format == "markdown",
+        compression=args.compress or "none",
+        template_dir=args.template_dir,
+        force=args.force,
+    )
+
+    for name, error in sorted(report.failed.items()):
+        print(f"❌ {name}: {error}", file=sys.stderr)
+    if args.verbose:
+        for name in report.rendered:
+            print(f"✅ {name}", file=sys.stderr)
+        for name in report.removed:
+            print(f"🗑  {name}", file=sys.stderr)
+    print(
+        f"Rendered {len(report.rendered)}, unchanged {len(report.skipped)}, "
+        f"removed {len(report.removed)}, failed {len(report.failed)}",
+        file=sys.stderr,
+    )
+    return EXIT_OK if report.ok else EXIT_INVALID_INPUT
+
+
+def _watch(args: argparse.Namespace, inputs: list[str]) -> int:
+    """Render the inputs, then re-render them on every change until Ctrl+C."""
+    from slide_renderer.renderer import SlideRenderer
+    from slide_renderer.watch import DeckWatcher
+
+    if STDIN in inputs:
+        raise _UsageError("--watch needs input files, not stdin")
+    if args.asset_cache:
+        raise _UsageError("--asset-cache is not supported with --watch")
+    if args.output is None or args.output == STDIN:
+        raise _UsageError("--watch needs an output file or directory (-o)")
+
+    if len(inputs) == 1:
+        decks = {inputs[0]: _output_path(args, inputs[0])}
+    else:
+        output_dir = Path(args.output)
+        decks = {path: output_dir / name for path, name in _output_names(args, inputs).items()}
+
+    watcher = DeckWatcher(
+        decks,
+        renderer=SlideRenderer(args.template_dir),
+        validate=not args.no_validate,
+        include_frontmatter=args.format != "fragment",
+        input_format=args.input_format,
+        interval=args.poll_interval,
+        theme_css=_load_theme(args),
+        font_dir=args.font_dir,
+        font_files=args.font_files,
+    )
+
+    def report(event) -> None:
+        if not event.ok:
+            print(f"❌ {event.source}: {event.error}", file=sys.stderr)
+        elif event.written or args.verbose:
+            print(
+                f"✅ {event.source} → {event.output} "
+                f"({event.rendered} slides, {event.elapsed * 1000:.1f} ms)",
+                file=sys.stderr,
+            )
+
+    template_dir = (
+        watcher.renderer.template_dir or "bundled templates (pass --template-dir to edit)"
+    )
+    print(f"Watching {len(decks)} deck(s) and {template_dir}", file=sys.stderr)
+    try:
+        watcher.run(callback=report)
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run the slide-renderer command.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (see module docstring)
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.jobs < 0:
+        parser.error(f"--jobs must be 0 or more, got {args.jobs}")
+    if args.shake_css and args.format != "html":
+        parser.error("--shake-css needs --format html")
+    if args.font_dir and args.format != "html":
+        parser.error("--font-dir needs --format html")
+    if (args.font_files or args.font_cache) and not args.font_dir:
+        parser.error("--font-files and --font-cache need --font-dir")
+
+    patterns = args.inputs + args.extra_inputs
+    if not patterns:
+        if sys.stdin.isatty():
+            parser.error("no input: pass JSON files or pipe a deck on stdin")
+        patterns = [STDIN]
+
+    try:
+        inputs = _expand_inputs(patterns)
+        if args.watch:
+            return _watch(args, inputs)
+        if len(inputs) == 1 and os.path.isdir(inputs[0]):
+            return _render_tree(args, inputs[0])
+        if len(inputs) == 1:
+            return _render_one(args, inputs[0])
+        return _render_all(args, inputs)
+
+    except _UsageError as e:
+        parser.print_usage(sys.stderr)
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except BrokenPipeError:
+        # Downstream closed the pipe (e.g. `| head`): stop quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return EXIT_OK
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_IO_ERROR
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_INVALID_INPUT
+
+
+if __name__ == "__main__":
+    sys.exit(main())
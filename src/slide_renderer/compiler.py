@@ -0,0 +1,290 @@
+"""
+Ahead-of-time compiler from Jinja2 templates to a pure-Python module.
+
+The 14 slide layouts only use variable output (``{{ title }}``,
+``{{ item.title }}``) and simple ``{% for %}`` loops. This module walks the
+Jinja2 AST of each template and generates one plain Python function per
+slide type, so rendering skips Jinja2's runtime context machinery entirely.
+
+The generated module records a fingerprint (SHA-256 of the source) per
+template. SlideRenderer only uses a compiled function while its fingerprint
+matches the current template source; anything else falls back to Jinja2.
+
+Usage:
+    from slide_renderer.compiler import compile_templates
+
+    compile_templates()                     # bundled templates → _compiled_templates.py
+    renderer = SlideRenderer(production=True)   # picks up the compiled module
+
+Or from the command line:
+    python -m slide_renderer.compiler [--template-dir DIR] [-o OUTPUT]
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Union
+
+from jinja2 import Environment, nodes
+
+# Default location of the generated module, next to this package's sources
+DEFAULT_COMPILED_MODULE = Path(__file__).parent / "_compiled_templates.py"
+
+# Runtime helpers copied into every generated module, mirroring the
+# behaviour of Jinja2's default Undefined and attribute lookup
+_RUNTIME = '''
+class _Undefined:
+    """Missing value: renders as "", iterates as empty, like Jinja2's Undefined."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return ""
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+
+_UNDEFINED = _Undefined()
+
+
+def _lookup(context, name):
+    return context.get(name, _UNDEFINED)
+
+
+def _getattr(obj, name):
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        pass
+    try:
+        return obj[name]
+    except (TypeError, LookupError):
+        return _UNDEFINED
+
+
+def _getitem(obj, key):
+    try:
+        return obj[key]
+    except (TypeError, LookupError):
+        pass
+    try:
+        return getattr(obj, key)
+    except (TypeError, AttributeError):
+        return _UNDEFINED
+'''
+
+
+def template_source_fingerprint(source: str) -> str:
+    """
+    Hash a template source.
+
+    Args:
+        source: Template source text
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class _FunctionGenerator:
+    """Generates the Python render function for one parsed template."""
+
+    def __init__(self, template_name: str):
+        self.template_name = template_name
+        self.lines: list[str] = []
+        self.indent = 1
+        # Stack of {template name: python variable} for loop targets
+        self.scopes: list[dict[str, str]] = []
+
+    def generate(self, function_name: str, template: nodes.Template) -> list[str]:
+        """Return the source lines of ``def function_name(context)``."""
+        self.lines = [f"def {function_name}(context):", "    parts = []", "    w = parts.append"]
+        self.visit_body(template.body)
+        self.lines.append('    return "".join(parts)')
+        return self.lines
+
+    def emit(self, line: str) -> None:
+        self.lines.append("    " * self.indent + line)
+
+    def visit_body(self, body: list[nodes.Node]) -> None:
+        for node in body:
+            self.visit(node)
+
+    def visit(self, node: nodes.Node) -> None:
+        if isinstance(node, nodes.Output):
+            for child in node.nodes:
+                if isinstance(child, nodes.TemplateData):
+                    self.emit(f"w({child.data!r})")
+                else:
+                    self.emit(f"w(str({self.expression(child)}))")
+
+        elif isinstance(node, nodes.For):
+            if (
+                not isinstance(node.target, nodes.Name)
+                or node.else_
+                or node.test is not None
+                or node.recursive
+            ):
+                self.unsupported(node, "only plain '{% for name in expr %}' loops are supported")
+
+            variable = f"l_{len(self.scopes)}_{node.target.name}"
+            self.emit(f"for {variable} in {self.expression(node.iter)}:")
+            self.scopes.append({node.target.name: variable})
+            self.indent += 1
+            self.visit_body(node.body)
+            if not node.body:
+                self.emit("pass")
+            self.indent -= 1
+            self.scopes.pop()
+
+        else:
+            self.unsupported(node)
+
+    def expression(self, node: nodes.Expr) -> str:
+        if isinstance(node, nodes.Name):
+            for scope in reversed(self.scopes):
+                if node.name in scope:
+                    return scope[node.name]
+            if node.name == "loop":
+                self.unsupported(node, "the 'loop' variable is not supported")
+            return f"_lookup(context, {node.name!r})"
+
+        if isinstance(node, nodes.Getattr):
+            return f"_getattr({self.expression(node.node)}, {node.attr!r})"
+
+        if isinstance(node, nodes.Getitem) and isinstance(node.arg, nodes.Const):
+            return f"_getitem({self.expression(node.node)}, {node.arg.value!r})"
+
+        if isinstance(node, nodes.Const):
+            return repr(node.value)
+
+        self.unsupported(node)
+
+    def unsupported(self, node: nodes.Node, reason: Optional[str] = None) -> None:
+        reason = reason or f"unsupported construct {type(node).__name__}"
+        raise ValueError(f"Cannot compile {self.template_name} (line {node.lineno}): {reason}")
+
+
+def compile_templates(
+    template_dir: Union[str, Path, None] = None,
+    output: Union[str, Path, None] = None,
+) -> Path:
+    """
+    Compile every ``.jinja2`` template into a Python module of render functions.
+
+    Args:
+        template_dir: Templates directory (default: the SlideRenderer default)
+        output: Path of the generated module (default: DEFAULT_COMPILED_MODULE)
+
+    Returns:
+        Path of the generated module
+
+    Raises:
+        ValueError: If a template uses a construct the compiler doesn't support
+    """
+    from slide_renderer.renderer import SlideRenderer
+
+    renderer = SlideRenderer(template_dir)
+    env: Environment = renderer.env
+    output = Path(output) if output is not None else DEFAULT_COMPILED_MODULE
+
+    suffix = ".jinja2"
+    functions: list[str] = []
+    fingerprints: dict[str, str] = {}
+    renderers: dict[str, str] = {}
+
+    for template_file in env.list_templates(extensions=[suffix[1:]]):
+        slide_type = template_file[: -len(suffix)]
+        source, _, _ = env.loader.get_source(env, template_file)
+
+        function_name = "render_" + "".join(c if c.isalnum() else "_" for c in slide_type)
+        generator = _FunctionGenerator(template_file)
+        functions.append("\n".join(generator.generate(function_name, env.parse(source))))
+
+        fingerprints[slide_type] = template_source_fingerprint(source)
+        renderers[slide_type] = function_name
+
+    module_lines = [
+        '"""',
+        "Slide templates compiled to plain Python by slide_renderer.compiler.",
+        "",
+        "Generated file - do not edit. Regenerate with:",
+        "    python -m slide_renderer.compiler",
+        '"""',
+        _RUNTIME,
+        "# slide type → SHA-256 of the template source this module was compiled from",
+        "FINGERPRINTS = {",
+        *(f"    {slide_type!r}: {digest!r}," for slide_type, digest in fingerprints.items()),
+        "}",
+        "",
+        *(f"\n{function}\n" for function in functions),
+        "",
+        "RENDERERS = {",
+        *(f"    {slide_type!r}: {name}," for slide_type, name in renderers.items()),
+        "}",
+        "",
+    ]
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text("\n".join(module_lines), encoding="utf-8")
+
+    return output
+
+
+def load_compiled_module(path: Union[str, Path, None] = None) -> Optional[ModuleType]:
+    """
+    Import a module generated by ``compile_templates``.
+
+    Args:
+        path: Path of the generated module (default: DEFAULT_COMPILED_MODULE)
+
+    Returns:
+        The imported module, or None if the file doesn't exist
+    """
+    path = Path(path) if path is not None else DEFAULT_COMPILED_MODULE
+    if not path.exists():
+        return None
+
+    spec = importlib.util.spec_from_file_location(f"_slide_templates_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Compile the templates directory to a Python module."""
+    parser = argparse.ArgumentParser(
+        prog="python -m slide_renderer.compiler",
+        description="Compile Jinja2 slide templates to a pure-Python render module.",
+    )
+    parser.add_argument("--template-dir", default=None, help="Templates directory")
+    parser.add_argument(
+        "-o", "--output", default=None, help=f"Output module (default: {DEFAULT_COMPILED_MODULE})"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        output = compile_templates(args.template_dir, args.output)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ Compiled templates to: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Incremental rendering of a whole tree of slide JSON files.
+
+``render_directory(src, dst)`` mirrors every deck under ``src`` to a
+markdown file under ``dst`` and keeps a manifest next to the outputs. For
+each deck the manifest records a hash of the input, the fingerprint of
+every template the deck uses and a hash of the output. On later runs:
+    - decks whose input, templates and output are unchanged are skipped (a
+      matching mtime and size skips even hashing a file)
+    - an output edited or damaged since it was written is rendered again
+    - editing a template re-renders only the decks using that slide type
+    - the remaining decks are rendered in parallel worker processes
+    - outputs whose input has disappeared are removed
+
+Usage:
+    from slide_renderer.directory import render_directory
+
+    report = render_directory("decks/", "site/", workers=8)
+    print(len(report.rendered), len(report.skipped), len(report.removed))
+
+Or from the command line:
+    slide-renderer decks/ -o site/ --jobs 8
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from slide_renderer import _json, batch
+from slide_renderer.jsonstream import detect_input_format, iter_jsonl
+from slide_renderer.renderer import SlideRenderer
+from slide_renderer.writer import compression_for, write_atomic
+
+# Manifest file, stored at the root of the output directory
+MANIFEST_NAME = ".slide-renderer-manifest.json"
+MANIFEST_VERSION = 2
+
+# Input files picked up under the source directory
+INPUT_SUFFIXES = (".json", ".jsonl", ".ndjson")
+
+# Output suffix per compression
+_OUTPUT_SUFFIXES = {None: ".md", "gzip": ".md.gz", "zstd": ".md.zst"}
+
+
+@dataclass
+class DirectoryReport:
+    """
+    Outcome of a ``render_directory`` run.
+
+    Attributes:
+        rendered: Inputs rendered in this run (paths relative to src)
+        skipped: Inputs skipped because nothing they depend on changed
+        removed: Outputs removed because their input is gone (relative to dst)
+        failed: Input → error message for decks that failed to render
+    """
+
+    rendered: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every deck rendered (or was already up to date)."""
+        return not self.failed
+
+
+def _hash_file(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _unchanged(path: Path, entry: dict[str, Any], kind: str) -> bool:
+    """
+    Whether a file still has the contents recorded in a manifest entry.
+
+    ``kind`` ("input" or "output") selects the entry's ``<kind>_hash``,
+    ``<kind>_mtime_ns`` and ``<kind>_size``. A matching mtime and size is
+    trusted without reading the file; otherwise the contents are hashed, and
+    if they are unchanged the new mtime and size are recorded.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if (entry.get(f"{kind}_mtime_ns"), entry.get(f"{kind}_size")) == signature:
+        return True
+    if entry.get(f"{kind}_hash") != _hash_file(path):
+        return False
+
+    entry[f"{kind}_mtime_ns"], entry[f"{kind}_size"] = signature
+    return True
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    """Read the manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            manifest = _json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _find_inputs(src: Path, dst: Path) -> list[str]:
+    """Deck files under src, relative and sorted; anything under dst is ignored."""
+    dst = dst.resolve()
+    inputs = []
+
+    for root, dirs, files in os.walk(src):
+        root_path = Path(root)
+        # Don't descend into the output tree if it lives inside src
+        dirs[:] = sorted(d for d in dirs if (root_path / d).resolve() != dst)
+        for name in files:
+            if name.lower().endswith(INPUT_SUFFIXES):
+                inputs.append((root_path / name).relative_to(src).as_posix())
+
+    return sorted(inputs)
+
+
+def _render_entry(
+    renderer: SlideRenderer, job: tuple[str, str, str, bool, bool, Optional[str]]
+) -> dict[str, Any]:
+    """
+    Render one deck to its output file; returns its manifest entry or error.
+
+    The input is stat-ed before it is read and hashed from the very bytes
+    that are parsed, so an edit landing mid-render is seen as a change on
+    the next run instead of being recorded as rendered.
+    """
+    name, input_path, output_path, validate, include_frontmatter, compression = job
+
+    try:
+        input_stat = os.stat(input_path)
+        data = Path(input_path).read_bytes()
+        input_hash = hashlib.sha256(data).hexdigest()
+        if detect_input_format(input_path) == "jsonl":
+            slides = list(iter_jsonl(io.BytesIO(data)))
+        else:
+            slides = _json.loads(data)
+        if not isinstance(slides, list):
+            raise ValueError("JSON file must contain an array of slides")
+
+        markdown = renderer.render_presentation(
+            slides, validate=validate, include_frontmatter=include_frontmatter
+        )
+        write_atomic(output_path, markdown, compression=compression or "none")
+        output_stat = os.stat(output_path)
+        output_hash = _hash_file(Path(output_path))
+
+    except Exception as e:
+        return {"name": name, "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "name": name,
+        "slide_types": sorted(
+            {slide["type"] for slide in slides if isinstance(slide, dict) and "type" in slide}
+        ),
+        "input_hash": input_hash,
+        "input_mtime_ns": input_stat.st_mtime_ns,
+        "input_size": input_stat.st_size,
+        "output_hash": output_hash,
+        "output_mtime_ns": output_stat.st_mtime_ns,
+        "output_size": output_stat.st_size,
+    }
+
+
+def _render_entry_in_worker(job: tuple[str, str, str, bool, bool, Optional[str]]) -> dict:
+    """Render one deck with this worker process's warm renderer."""
+    return _render_entry(batch._worker_renderer, job)
+
+
+def _remove_output(dst: Path, relative: str) -> bool:
+    """Delete an output file and any directories it leaves empty."""
+    path = dst / relative
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+
+    parent = path.parent
+    while parent != dst:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+    return True
+
+
+def render_directory(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    workers: Optional[int] = None,
+    validate: bool = True,
+    include_frontmatter: bool = True,
+    compression: str = "none",
+    template_dir: Union[str, Path, None] = None,
+    force: bool = False,
+) -> DirectoryReport:
+    """
+    Render every deck under src to dst, skipping decks that are up to date.
+
+    Inputs that would share an output (``a/b.json`` and ``a/b.jsonl`` both
+    render to ``a/b.md``) are all reported as failed and none is rendered.
+
+    Args:
+        src: Directory tree of slide JSON / JSON Lines files
+        dst: Output directory; ``a/b.json`` renders to ``a/b.md``
+        workers: Worker processes (default: CPU count; 1 = in-process)
+        validate: Whether to validate content (default: True)
+        include_frontmatter: Whether to include Marp frontmatter (default: True)
+        compression: "none", "gzip" (.md.gz) or "zstd" (.md.zst) (default: "none")
+        template_dir: Templates directory (default: the bundled templates)
+        force: Re-render every deck, ignoring the manifest (default: False)
+
+    Returns:
+        DirectoryReport listing rendered, skipped, removed and failed decks
+
+    Raises:
+        FileNotFoundError: If src is not a directory
+
+    Example:
+        >>> report = render_directory("decks", "site")
+        >>> report = render_directory("decks", "site")   # nothing changed
+        >>> len(report.rendered)
+        0
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if not src.is_dir():
+        raise FileNotFoundError(f"Source directory not found: {src}")
+
+    compression = compression_for("", compression)
+    options = {
+        "validate": validate,
+        "include_frontmatter": include_frontmatter,
+        "compression": compression,
+    }
+
+    # Fingerprint every template once; decks record the ones they use
+    renderer = SlideRenderer(template_dir, production=True)
+    suffix = ".jinja2"
+    fingerprints = {
+        name[: -len(suffix)]: renderer.template_fingerprint(name[: -len(suffix)])
+        for name in renderer.env.list_templates(extensions=[suffix[1:]])
+    }
+
+    manifest_path = dst / MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+    entries: dict[str, dict[str, Any]] = manifest.get("entries", {})
+    if force or manifest.get("options") != options:
+        # Render everything, but still clean up outputs of removed inputs
+        entries = {name: {"output": entry["output"]} for name, entry in entries.items()}
+
+    report = DirectoryReport()
+    outputs: dict[str, str] = {}
+    sources: dict[str, list[str]] = {}
+    for name in _find_inputs(src, dst):
+        output = Path(name).with_suffix(_OUTPUT_SUFFIXES[compression]).as_posix()
+        outputs[name] = output
+        sources.setdefault(output, []).append(name)
+
+    jobs = []
+    for name, output in outputs.items():
+        if len(sources[output]) > 1:
+            others = ", ".join(other for other in sources[output] if other != name)
+            report.failed[name] = f"{output} would also be written from {others}"
+            continue
+
+        entry = entries.get(name, {})
+        up_to_date = (
+            "templates" in entry
+            and entry.get("output") == output
+            and all(fingerprints.get(t) == fp for t, fp in entry["templates"].items())
+            and _unchanged(src / name, entry, "input")
+            and _unchanged(dst / output, entry, "output")
+        )
+
+        if up_to_date:
+            report.skipped.append(name)
+            continue
+
+        if entry.get("output") not in (None, output):
+            _remove_output(dst, entry["output"])
+
+        jobs.append(
+            (name, str(src / name), str(dst / output), validate, include_frontmatter, compression)
+        )
+
+    # Outputs whose input no longer exists
+    for name in sorted(set(entries) - set(outputs)):
+        output = entries.pop(name)["output"]
+        if _remove_output(dst, output):
+            report.removed.append(output)
+
+    for result in _render_jobs(jobs, workers, renderer):
+        name = result.pop("name")
+        if "error" in result:
+            report.failed[name] = result["error"]
+            continue
+
+        slide_types = result.pop("slide_types")
+        entries[name] = {
+            **result,
+            "templates": {t: fingerprints.get(t) for t in slide_types},
+            "output": outputs[name],
+        }
+        report.rendered.append(name)
+
+    report.rendered.sort()
+    dst.mkdir(parents=True, exist_ok=True)
+    write_atomic(
+        manifest_path,
+        json.dumps(
+            {"version": MANIFEST_VERSION, "options": options, "entries": entries},
+            indent=1,
+            sort_keys=True,
+        ),
+        compression="none",
+    )
+
+    return report
+
+
+def _render_jobs(jobs: list[tuple], workers: Optional[int], renderer: SlideRenderer):
+    """Render jobs in-process or in a pool of warm worker processes."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    if workers <= 1:
+        for job in jobs:
+            yield _render_entry(renderer, job)
+        return
+
+    options = {"template_dir": renderer.template_dir}
+    with multiprocessing.Pool(workers, initializer=batch._init_worker, initargs=(options,)) as pool:
+        yield from pool.imap_unordered(_render_entry_in_worker, jobs)
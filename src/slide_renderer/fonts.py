@@ -0,0 +1,513 @@
+"""
+Offline web fonts for HTML decks: theme fonts resolved locally, subset and embedded.
+
+``custom-style.css`` loads nine Pretendard weights from a CDN, so every
+viewer downloads megabytes of fonts and air-gapped installs fall back to
+system fonts. ``embed_fonts`` rewrites the ``@font-face`` rules of an HTML
+deck so the fonts come from a local directory instead:
+    - only the faces the theme's ``font-weight`` values select are kept
+      (plus 400 and 700, the browser defaults for text and bold/headings),
+      matched with the CSS font matching rules
+    - each font file is looked up in the font directory by the file name of
+      its ``src`` URL (``Pretendard-Bold.woff2``; ``.woff``/``.otf``/``.ttf``
+      with the same stem also match)
+    - each font is subset to the characters of the deck's slides, which
+      shrinks CJK fonts from megabytes to kilobytes. Subsetting needs
+      fontTools (``pip install slide-renderer[fonts]``); without it the
+      whole files are embedded.
+    - fonts are inlined as ``data:`` URLs, or written into a ``fonts/``
+      directory next to the output, named by content so decks share them
+
+Subsets are cached in memory (and optionally on disk) by font file and
+glyph set hash, so re-exporting a deck, or a deck with the same characters,
+doesn't subset again.
+
+Usage:
+    from slide_renderer.fonts import embed_fonts
+
+    html = embed_fonts(renderer.render_html(slides, tree_shake=True), "fonts/")
+
+Or from the command line:
+    slide-renderer talk.json -o talk.html --format html --font-dir fonts/
+"""
+
+import base64
+import functools
+import hashlib
+import html
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Font file suffix → CSS format() hint, in lookup order
+FONT_FORMATS = {".woff2": "woff2", ".woff": "woff", ".otf": "opentype", ".ttf": "truetype"}
+
+# Weights every deck may need: normal text, and bold text and headings
+DEFAULT_WEIGHTS = frozenset({400, 700})
+
+# Fonts (whole or subset) kept in memory
+CACHE_SIZE = 64
+
+_FONT_FACE = re.compile(r"@font-face\s*\{([^}]*)\}\s*", re.I)
+_DESCRIPTOR = re.compile(r"([\w-]+)\s*:\s*((?:[^;\"']|\"[^\"]*\"|'[^']*')*)")
+_SRC = re.compile(r"(?<![\w-])src\s*:(?:[^;\"']|\"[^\"]*\"|'[^']*')*", re.I)
+_URL = re.compile(r"""url\(\s*(["']?)(.*?)\1\s*\)""")
+_FONT_WEIGHT = re.compile(r"font-weight\s*:\s*([^;}!]+)", re.I)
+_FONT_SHORTHAND = re.compile(r"(?<![\w-])font\s*:\s*([^;}]+)", re.I)
+_STYLE_BLOCK = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S | re.I)
+_MARPIT = re.compile(r'<div class="marpit">(.*)</div>', re.S)
+_TAG = re.compile(r"<[^>]*>")
+
+_WEIGHT_KEYWORDS = {"normal": 400, "bold": 700}
+
+
+@dataclass(frozen=True)
+class FontFace:
+    """
+    One ``@font-face`` rule of a stylesheet.
+
+    Attributes:
+        family: Font family name, unquoted
+        weight: Weight range (a single weight has equal bounds)
+        style: Font style ("normal", "italic", ...)
+        file_name: File name of the first ``src`` URL (e.g. "Pretendard-Bold.woff2")
+    """
+
+    family: str
+    weight: tuple[int, int]
+    style: str
+    file_name: str
+
+
+# ============================================================================
+# STYLESHEET
+# ============================================================================
+
+
+def _parse_face(body: str) -> Optional[FontFace]:
+    """FontFace of an ``@font-face`` body, or None without a family or URL."""
+    descriptors = {name.lower(): value.strip() for name, value in _DESCRIPTOR.findall(body)}
+    url = _URL.search(descriptors.get("src", ""))
+    family = descriptors.get("font-family", "").strip("\"' ")
+    if not url or not family:
+        return None
+
+    weights = []
+    for token in descriptors.get("font-weight", "normal").split():
+        weight = _parse_weight(token)
+        if weight is not None:
+            weights.append(weight)
+    weights = weights or [400]
+
+    file_name = url.group(2).split("?")[0].split("#")[0].rsplit("/", 1)[-1]
+    return FontFace(
+        family=family,
+        weight=(min(weights), max(weights)),
+        style=descriptors.get("font-style", "normal").lower(),
+        file_name=file_name,
+    )
+
+
+def _parse_weight(token: str) -> Optional[int]:
+    """Numeric weight of a font-weight token, None for relative or unknown ones."""
+    token = token.strip().lower()
+    if token in _WEIGHT_KEYWORDS:
+        return _WEIGHT_KEYWORDS[token]
+    try:
+        weight = float(token)
+    except ValueError:
+        return None
+    return int(weight) if 1 <= weight <= 1000 else None
+
+
+def font_faces(css: str) -> list[FontFace]:
+    """
+    The ``@font-face`` rules of a stylesheet that load a font file.
+
+    Args:
+        css: Stylesheet
+
+    Returns:
+        Font faces, in stylesheet order
+    """
+    faces = (_parse_face(match.group(1)) for match in _FONT_FACE.finditer(css))
+    return [face for face in faces if face is not None]
+
+
+def used_weights(css: str) -> Optional[frozenset[int]]:
+    """
+    Font weights a stylesheet's rules ask for, plus ``DEFAULT_WEIGHTS``.
+
+    Args:
+        css: Stylesheet (``@font-face`` rules are ignored)
+
+    Returns:
+        Numeric weights, or None if a relative weight (``bolder``,
+        ``lighter``) makes every weight possible
+    """
+    css = _FONT_FACE.sub("", css)
+    weights = set(DEFAULT_WEIGHTS)
+
+    for value in _FONT_WEIGHT.findall(css):
+        weight = _parse_weight(value)
+        if weight is None:
+            if value.strip().lower() in ("bolder", "lighter"):
+                return None
+            continue
+        weights.add(weight)
+
+    for value in _FONT_SHORTHAND.findall(css):
+        # The weight is any number/keyword before the size ("700 2rem/1.2 X")
+        for token in value.split():
+            if token.lower() in ("bolder", "lighter"):
+                return None
+            weight = _parse_weight(token)
+            if weight is not None and token.lower() != "normal":
+                weights.add(weight)
+
+    return frozenset(weights)
+
+
+def _match_face(weight: int, faces: list[FontFace]) -> FontFace:
+    """
+    The face a browser uses for a weight, per the CSS font matching rules.
+
+    A face whose range covers the weight wins. Otherwise, for 400-500 the
+    heavier faces up to 500 come first (ascending), then lighter ones
+    (descending), then the other heavier ones; below 400 lighter faces come
+    first, above 500 heavier ones.
+    """
+    covering = [face for face in faces if face.weight[0] <= weight <= face.weight[1]]
+    if covering:
+        return covering[0]
+
+    lighter = sorted((f for f in faces if f.weight[1] < weight), key=lambda f: -f.weight[1])
+    heavier = sorted((f for f in faces if f.weight[0] > weight), key=lambda f: f.weight[0])
+
+    if 400 <= weight <= 500:
+        near = [f for f in heavier if f.weight[0] <= 500]
+        far = [f for f in heavier if f.weight[0] > 500]
+        order = near + lighter + far
+    elif weight < 400:
+        order = lighter + heavier
+    else:
+        order = heavier + lighter
+    return order[0]
+
+
+def select_faces(faces: Iterable[FontFace], weights: Optional[Iterable[int]]) -> list[FontFace]:
+    """
+    The faces the given weights select, per font family and style.
+
+    Args:
+        faces: Font faces of a stylesheet
+        weights: Weights in use (None = keep every face)
+
+    Returns:
+        Selected faces, in their original order
+    """
+    faces = list(faces)
+    if weights is None:
+        return faces
+
+    groups: dict[tuple[str, str], list[FontFace]] = {}
+    for face in faces:
+        groups.setdefault((face.family.lower(), face.style), []).append(face)
+
+    selected = set()
+    for group in groups.values():
+        for weight in weights:
+            selected.add(_match_face(weight, group))
+    return [face for face in faces if face in selected]
+
+
+# ============================================================================
+# FONT FILES
+# ============================================================================
+
+
+def find_font(file_name: str, font_dir: PathLike) -> Path:
+    """
+    Find a font file in a local font directory.
+
+    Args:
+        file_name: File name from the ``src`` URL (e.g. "Pretendard-Bold.woff2")
+        font_dir: Directory of font files (searched recursively)
+
+    Returns:
+        Path of the file with that name, else of one with the same stem and
+        another font suffix (.woff2, .woff, .otf, .ttf)
+
+    Raises:
+        FileNotFoundError: If no such file exists
+    """
+    font_dir = Path(font_dir)
+    if not font_dir.is_dir():
+        raise FileNotFoundError(f"Font directory not found: {font_dir}")
+
+    stem = Path(file_name).stem
+    candidates = [file_name] + [stem + suffix for suffix in FONT_FORMATS]
+    for name in candidates:
+        for path in (font_dir / name, *sorted(font_dir.rglob(name))):
+            if path.is_file():
+                return path
+
+    raise FileNotFoundError(f"Font not found in {font_dir}: {file_name}")
+
+
+def _has_fonttools() -> bool:
+    """Whether fontTools' subsetter can be imported."""
+    try:
+        import fontTools.subset  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _subset_flavor() -> str:
+    """WOFF2 if brotli is available to compress it, else WOFF."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return "woff"
+    return "woff2"
+
+
+def glyph_set(text: str) -> str:
+    """Canonical glyph set of a text: its distinct characters, sorted."""
+    return "".join(sorted(set(text)))
+
+
+def glyph_hash(glyphs: str) -> str:
+    """Short hash of a glyph set, used in cache keys and file names."""
+    return hashlib.sha256(glyphs.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+def subset_font(data: bytes, glyphs: str, flavor: Optional[str] = None) -> bytes:
+    """
+    Subset a font to the given characters with fontTools.
+
+    Args:
+        data: Font file contents (TTF, OTF, WOFF or WOFF2)
+        glyphs: Characters to keep
+        flavor: Output flavor, "woff2" or "woff" (default: woff2 when brotli
+            is installed, else woff)
+
+    Returns:
+        Subset font file contents
+
+    Raises:
+        ImportError: If fontTools isn't installed
+    """
+    try:
+        from fontTools import subset
+    except ImportError:
+        raise ImportError(
+            "font subsetting needs fontTools (pip install slide-renderer[fonts])"
+        ) from None
+
+    options = subset.Options()
+    options.flavor = flavor or _subset_flavor()
+    # Keep kerning, ligatures and other layout features of the kept glyphs
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    font = subset.load_font(io.BytesIO(data), options, dontLoadGlyphNames=True)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=[ord(char) for char in glyphs])
+    subsetter.subset(font)
+
+    out = io.BytesIO()
+    subset.save_font(font, out, options)
+    return out.getvalue()
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _font_data(
+    path: str, mtime_ns: int, size: int, glyphs: Optional[str], cache_dir: Optional[str]
+) -> tuple[bytes, str]:
+    """
+    Contents and format of a font file, subset to glyphs (None = whole file).
+
+    Cached per file version and glyph set; ``cache_dir`` adds a disk tier
+    keyed by the file's content hash and the glyph set hash.
+    """
+    data = Path(path).read_bytes()
+    if glyphs is None:
+        return data, FONT_FORMATS.get(Path(path).suffix.lower(), "woff2")
+
+    flavor = _subset_flavor()
+    cached = None
+    if cache_dir is not None:
+        key = f"{hashlib.sha256(data).hexdigest()[:16]}-{glyph_hash(glyphs)}.{flavor}"
+        cached = Path(cache_dir) / key
+        if cached.is_file():
+            return cached.read_bytes(), flavor
+
+    subset = subset_font(data, glyphs, flavor)
+    if cached is not None:
+        from slide_renderer.writer import write_bytes_atomic
+
+        write_bytes_atomic(cached, subset)
+    return subset, flavor
+
+
+def cache_info() -> functools._CacheInfo:
+    """Hit/miss statistics of the in-memory font cache."""
+    return _font_data.cache_info()
+
+
+def clear_cache() -> None:
+    """Forget every font (and subset) kept in memory."""
+    _font_data.cache_clear()
+
+
+# ============================================================================
+# DOCUMENTS
+# ============================================================================
+
+
+def document_text(document: str) -> str:
+    """
+    Text a rendered HTML deck displays, for subsetting.
+
+    Args:
+        document: HTML deck (e.g. ``markdown_to_html``)
+
+    Returns:
+        Text of the slides (tags removed, entities decoded), plus the digits
+        of page numbers when pagination is on
+    """
+    match = _MARPIT.search(document)
+    body = match.group(1) if match else _STYLE_BLOCK.sub("", document)
+    text = html.unescape(_TAG.sub(" ", body))
+    if "data-marpit-pagination" in body:
+        text += "0123456789"
+    return text + " "
+
+
+def bundle_fonts(
+    css: str,
+    text: str,
+    font_dir: PathLike,
+    subset: Optional[bool] = None,
+    fonts_dir: Optional[PathLike] = None,
+    fonts_url: str = "fonts/",
+    cache_dir: Optional[PathLike] = None,
+) -> str:
+    """
+    Rewrite a stylesheet's ``@font-face`` rules to load local, subset fonts.
+
+    Args:
+        css: Stylesheet (e.g. ``load_theme()`` or a tree-shaken one)
+        text: Text the fonts have to render (see ``document_text``)
+        font_dir: Local directory holding the theme's font files
+        subset: Subset fonts to the text's characters (default: when
+            fontTools is installed; True raises without it)
+        fonts_dir: Write the fonts into this directory and reference them
+            by URL, instead of inlining them as ``data:`` URLs
+        fonts_url: URL prefix of ``fonts_dir`` as seen from the document
+            (default: "fonts/")
+        cache_dir: Directory keeping subset fonts across runs (default:
+            memory only)
+
+    Returns:
+        Stylesheet whose ``@font-face`` rules only cover the weights in use
+        and point at the local fonts
+
+    Raises:
+        FileNotFoundError: If a kept font isn't in the font directory
+        ImportError: If subset is True and fontTools isn't installed
+    """
+    if subset is None:
+        subset = _has_fonttools()
+    elif subset and not _has_fonttools():
+        raise ImportError("font subsetting needs fontTools (pip install slide-renderer[fonts])")
+
+    keep = set(select_faces(font_faces(css), used_weights(css)))
+    glyphs = glyph_set(text) if subset else None
+
+    def replace(match: re.Match) -> str:
+        face = _parse_face(match.group(1))
+        if face is None:
+            return match.group(0)
+        if face not in keep:
+            return ""
+
+        path = find_font(face.file_name, font_dir)
+        stat = path.stat()
+        data, fmt = _font_data(
+            str(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            glyphs,
+            str(cache_dir) if cache_dir is not None else None,
+        )
+
+        if fonts_dir is None:
+            url = f"data:font/{fmt};base64,{base64.b64encode(data).decode('ascii')}"
+        else:
+            # Named by content: identical fonts of several decks are one file
+            suffix = {"opentype": ".otf", "truetype": ".ttf"}.get(fmt, "." + fmt)
+            name = f"{path.stem}-{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+            target = Path(fonts_dir) / name
+            if not target.exists():
+                from slide_renderer.writer import write_bytes_atomic
+
+                write_bytes_atomic(target, data)
+            url = fonts_url + name
+
+        src = f"src:url('{url}') format('{fmt}')"
+        body = _SRC.sub(lambda _: src, match.group(1), count=1)
+        return match.group(0).replace(match.group(1), body, 1)
+
+    return _FONT_FACE.sub(replace, css)
+
+
+def embed_fonts(
+    document: str,
+    font_dir: PathLike,
+    subset: Optional[bool] = None,
+    output: Optional[PathLike] = None,
+    cache_dir: Optional[PathLike] = None,
+) -> str:
+    """
+    Make an HTML deck's fonts local: subset to its text and embedded.
+
+    Args:
+        document: HTML deck (e.g. ``SlideRenderer.render_html``)
+        font_dir: Local directory holding the theme's font files
+        subset: Subset fonts to the deck's characters (default: when
+            fontTools is installed; True raises without it)
+        output: The deck's output file; fonts are written into a ``fonts/``
+            directory next to it instead of being inlined (default: inline)
+        cache_dir: Directory keeping subset fonts across runs (default:
+            memory only)
+
+    Returns:
+        HTML deck that needs no network access for its fonts
+
+    Raises:
+        FileNotFoundError: If a kept font isn't in the font directory
+        ImportError: If subset is True and fontTools isn't installed
+
+    Example:
+        >>> html = embed_fonts(renderer.render_html(slides), "fonts/")
+        >>> "cdn.jsdelivr.net" in html
+        False
+    """
+    text = document_text(document)
+    fonts_dir = Path(output).parent / "fonts" if output is not None else None
+
+    def replace(match: re.Match) -> str:
+        css = bundle_fonts(
+            match.group(2), text, font_dir, subset=subset, fonts_dir=fonts_dir, cache_dir=cache_dir
+        )
+        return match.group(1) + css + match.group(3)
+
+    return _STYLE_BLOCK.sub(replace, document)
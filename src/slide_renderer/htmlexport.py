@@ -0,0 +1,604 @@
+"""
+Standalone HTML export of rendered presentations, without Node or Marp CLI.
+
+Converts the Marp markdown produced by SlideRenderer into a single HTML
+file with the theme CSS inlined. The output follows Marp's structure, so
+theme selectors behave the same:
+    - ``<div class="marpit">`` holding one ``<section>`` per slide
+    - slides split on ``---`` (any thematic break), frontmatter parsed
+    - directives in HTML comments applied to the ``<section>``: ``class``,
+      ``backgroundColor``, ``color``, ``paginate``, ``header``, ``footer``
+      (``_class`` etc. apply to the current slide only); comments are
+      removed from the output, as Marp does
+    - raw HTML blocks kept as is (like ``marp --html``)
+
+Only the markdown subset the templates produce plus common inline syntax
+is supported (headings, paragraphs, lists, quotes, code, emphasis, links,
+images). Marp's built-in base theme (``@import "default"``) is not bundled:
+the theme CSS is inlined without it, on top of a small base stylesheet that
+sets the 1280x720 slide geometry.
+
+Usage:
+    from slide_renderer.htmlexport import markdown_to_html
+
+    html = markdown_to_html(renderer.render_presentation(slides))
+
+Or from the command line:
+    slide-renderer slides.json -o deck.html --format html
+"""
+
+import functools
+import html
+import re
+from importlib import resources
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+# Theme used when none is given, shipped inside the package
+DEFAULT_THEME = "custom-style.css"
+
+# Marp's default 16:9 slide size, in CSS pixels
+SLIDE_WIDTH = 1280
+SLIDE_HEIGHT = 720
+
+# Slide geometry and page layout that Marp's base theme provides
+BASE_CSS = f"""\
+html, body {{ margin: 0; padding: 0; }}
+body {{ background: #606060; }}
+div.marpit > section {{
+  box-sizing: border-box;
+  display: block;
+  position: relative;
+  overflow: hidden;
+  width: {SLIDE_WIDTH}px;
+  height: {SLIDE_HEIGHT}px;
+  margin: 24px auto;
+  box-shadow: 0 2px 12px rgba(0, 0, 0, 0.4);
+}}
+div.marpit > section > header,
+div.marpit > section > footer {{ position: absolute; left: 30px; right: 30px; height: 70px; }}
+div.marpit > section > header {{ top: 0; }}
+div.marpit > section > footer {{ bottom: 0; }}
+div.marpit > section[data-marpit-pagination]::after {{
+  content: attr(data-marpit-pagination);
+  position: absolute;
+  right: 30px;
+  bottom: 21px;
+}}
+@media print {{
+  @page {{ size: {SLIDE_WIDTH}px {SLIDE_HEIGHT}px; margin: 0; }}
+  body {{ background: none; }}
+  div.marpit > section {{ margin: 0; box-shadow: none; page-break-after: always; }}
+}}
+"""
+
+# Directives that can be set per slide; "_" + name applies to one slide only
+LOCAL_DIRECTIVES = ("class", "backgroundColor", "color", "paginate", "header", "footer")
+
+# Directives only meaningful in the frontmatter
+GLOBAL_DIRECTIVES = ("title", "lang", "theme")
+
+# Marp's bundled themes, imported by name in theme CSS
+_BUILTIN_IMPORT = re.compile(r"""@import\s+(?:url\()?["']?(default|gaia|uncover)["']?\)?\s*;""")
+
+_THEMATIC_BREAK = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_ATX_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_SETEXT_H1 = re.compile(r"^ {0,3}=+[ \t]*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+_LIST_ITEM = re.compile(r"^ {0,3}(?:([-*+])|(\d{1,9})[.)])[ \t]+(.*)$")
+_BLOCKQUOTE = re.compile(r"^ {0,3}> ?(.*)$")
+_HTML_BLOCK = re.compile(r"^ {0,3}</?[A-Za-z][A-Za-z0-9-]*(?:[\s/>]|$)")
+_COMMENT = re.compile(r"<!--(.*?)-->", re.S)
+_DIRECTIVE = re.compile(r"^\s*(_?)([A-Za-z]+)\s*:\s*(.*?)\s*$")
+
+# Inline syntax, tried left to right
+_INLINE = re.compile(
+    r"(?P<code>(?P<ticks>`+)(?P<code_text>.+?)(?P=ticks))"
+    r"|(?P<image>!\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]+)(?:\s+\"(?P<img_title>[^\"]*)\")?\))"
+    r"|(?P<link>\[(?P<text>[^\]]+)\]\((?P<href>[^)\s]+)(?:\s+\"(?P<link_title>[^\"]*)\")?\))"
+    r"|(?P<strong>(?P<sd>\*\*|__)(?P<strong_text>.+?)(?P=sd))"
+    r"|(?P<em>(?P<ed>[*_])(?P<em_text>[^\s*_](?:.*?[^\s])?)(?P=ed))"
+    r"|(?P<tag></?[A-Za-z][^<>]*>|<!--.*?-->)"
+    r"|(?P<entity>&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);)"
+    r"|(?P<br>(?:  |\\)\n)"
+)
+
+
+# ============================================================================
+# INLINE MARKDOWN
+# ============================================================================
+
+
+def _inline(text: str) -> str:
+    """Convert inline markdown to HTML; other text is escaped."""
+    out = []
+    pos = 0
+
+    for match in _INLINE.finditer(text):
+        out.append(_escape_text(text[pos : match.start()]))
+        pos = match.end()
+
+        if match.group("code"):
+            out.append(f"<code>{html.escape(match.group('code_text').strip())}</code>")
+        elif match.group("image"):
+            title = match.group("img_title")
+            out.append(
+                f'<img src="{html.escape(match.group("src"))}" '
+                f'alt="{html.escape(match.group("alt"))}"'
+                + (f' title="{html.escape(title)}"' if title else "")
+                + " />"
+            )
+        elif match.group("link"):
+            title = match.group("link_title")
+            out.append(
+                f'<a href="{html.escape(match.group("href"))}"'
+                + (f' title="{html.escape(title)}"' if title else "")
+                + f">{_inline(match.group('text'))}</a>"
+            )
+        elif match.group("strong"):
+            out.append(f"<strong>{_inline(match.group('strong_text'))}</strong>")
+        elif match.group("em"):
+            out.append(f"<em>{_inline(match.group('em_text'))}</em>")
+        elif match.group("br"):
+            out.append("<br />\n")
+        else:
+            # Raw inline HTML and entities pass through (html: true)
+            out.append(match.group(0))
+
+    out.append(_escape_text(text[pos:]))
+    # Marp renders soft line breaks as <br /> (breaks: true)
+    return "<br />\n".join("".join(out).split("\n"))
+
+
+def _escape_text(text: str) -> str:
+    """Escape text outside inline syntax, keeping backslash escapes literal."""
+    text = re.sub(r"\\([!-/:-@\[-`{-~])", lambda m: "\0" + m.group(1), text)
+    escaped = html.escape(text, quote=False)
+    return escaped.replace("\0", "")
+
+
+def _plain(text: str) -> str:
+    """Text content of inline markdown (for the document title)."""
+    return re.sub(r"<[^>]+>", "", _inline(text)).replace("<br />", " ").strip()
+
+
+# ============================================================================
+# BLOCKS
+# ============================================================================
+
+
+class _Slide:
+    """Blocks and directives of one slide while it is parsed."""
+
+    def __init__(self):
+        self.blocks: list[str] = []
+        self.directives: dict[str, str] = {}
+        self.first_heading: Optional[str] = None
+
+
+class _Parser:
+    """
+    Line-by-line Marp markdown parser emitting one _Slide per slide.
+
+    Only block structure is tracked: an open paragraph, list, quote, fence,
+    HTML block or comment. A thematic break outside of those ends the slide.
+    """
+
+    def __init__(self):
+        self.frontmatter: Optional[dict[str, str]] = None
+        self._in_frontmatter = False
+        self._started = False
+        self.slide = _Slide()
+
+        self._paragraph: list[str] = []
+        self._list: Optional[tuple[str, list[str]]] = None
+        self._quote: list[str] = []
+        self._fence: Optional[tuple[str, list[str], str]] = None
+        self._html: Optional[list[str]] = None
+        self._comment: Optional[list[str]] = None
+
+    # -- feeding -------------------------------------------------------------
+
+    def feed(self, line: str) -> Optional[_Slide]:
+        """Consume one line (without newline); returns a slide when one ends."""
+        if not self._started:
+            self._started = True
+            if line.strip() == "---":
+                self._in_frontmatter = True
+                self.frontmatter = {}
+                return None
+
+        if self._in_frontmatter:
+            if line.strip() in ("---", "..."):
+                self._in_frontmatter = False
+            else:
+                key, sep, value = line.partition(":")
+                if sep and key.strip():
+                    self.frontmatter[key.strip()] = _unquote(value.strip())
+            return None
+
+        if self._comment is not None:
+            self._comment.append(line)
+            if "-->" in line:
+                self._end_comment()
+            return None
+
+        if self._fence is not None:
+            marker, lines, info = self._fence
+            if line.strip().startswith(marker) and not line.strip().strip(marker[0]):
+                self._fence = None
+                self._emit_code(lines, info)
+            else:
+                lines.append(line)
+            return None
+
+        if self._html is not None:
+            if line.strip():
+                self._html.append(line)
+                return None
+            self._flush()
+            return None
+
+        return self._feed_block(line)
+
+    def finish(self) -> _Slide:
+        """Close open blocks and return the last slide."""
+        if self._fence is not None:
+            _, lines, info = self._fence
+            self._fence = None
+            self._emit_code(lines, info)
+        if self._comment is not None:
+            self._end_comment()
+        self._flush()
+        return self.slide
+
+    def _feed_block(self, line: str) -> Optional[_Slide]:
+        """Handle a line outside of fences, HTML blocks and comments."""
+        stripped = line.strip()
+
+        if not stripped:
+            self._flush()
+            return None
+
+        if _THEMATIC_BREAK.match(line):
+            if self._paragraph and stripped.startswith("-") and set(stripped) <= {"-", " "}:
+                # "text\n---" is a setext heading, not a slide break
+                self._heading(2, "\n".join(self._paragraph))
+                self._paragraph = []
+                return None
+            self._flush()
+            slide, self.slide = self.slide, _Slide()
+            return slide
+
+        if self._paragraph and _SETEXT_H1.match(line):
+            self._heading(1, "\n".join(self._paragraph))
+            self._paragraph = []
+            return None
+
+        if stripped.startswith("<!--"):
+            self._flush()
+            self._comment = [line]
+            if "-->" in line:
+                self._end_comment()
+            return None
+
+        heading = _ATX_HEADING.match(line)
+        if heading:
+            self._flush()
+            self._heading(len(heading.group(1)), heading.group(2) or "")
+            return None
+
+        fence = _FENCE.match(line)
+        if fence and "`" not in fence.group(2):
+            self._flush()
+            self._fence = (fence.group(1), [], fence.group(2).strip())
+            return None
+
+        if _HTML_BLOCK.match(line):
+            self._flush()
+            self._html = [line]
+            return None
+
+        quote = _BLOCKQUOTE.match(line)
+        if quote:
+            if not self._quote:
+                self._flush()
+            self._quote.append(quote.group(1))
+            return None
+
+        item = _LIST_ITEM.match(line)
+        if item:
+            kind = "ul" if item.group(1) else "ol"
+            if self._list is None or self._list[0] != kind:
+                self._flush()
+                self._list = (kind, [])
+            self._list[1].append(item.group(3))
+            return None
+
+        if self._list is not None and line.startswith((" ", "\t")):
+            # Continuation of the last list item
+            self._list[1][-1] += "\n" + stripped
+            return None
+
+        if line.startswith(("    ", "\t")) and not self._paragraph:
+            self._flush()
+            self.slide.blocks.append(f"<pre><code>{html.escape(line[4:])}\n</code></pre>")
+            return None
+
+        if self._list is not None or self._quote:
+            self._flush()
+        self._paragraph.append(stripped)
+        return None
+
+    # -- emitting ------------------------------------------------------------
+
+    def _flush(self) -> None:
+        """Close the open paragraph, list, quote or HTML block."""
+        blocks = self.slide.blocks
+        if self._paragraph:
+            blocks.append(f"<p>{_inline(chr(10).join(self._paragraph))}</p>")
+            self._paragraph = []
+        if self._list is not None:
+            kind, items = self._list
+            inner = "\n".join(f"<li>{_inline(item)}</li>" for item in items)
+            blocks.append(f"<{kind}>\n{inner}\n</{kind}>")
+            self._list = None
+        if self._quote:
+            inner = markdown_fragment("\n".join(self._quote))
+            blocks.append(f"<blockquote>\n{inner}\n</blockquote>")
+            self._quote = []
+        if self._html is not None:
+            # Comments inside HTML blocks may carry directives too
+            raw = "\n".join(self._html)
+            for comment in _COMMENT.findall(raw):
+                self._directives(comment)
+            blocks.append(_COMMENT.sub("", raw))
+            self._html = None
+
+    def _heading(self, level: int, text: str) -> None:
+        """Emit a heading; the first one names the document if untitled."""
+        if self.slide.first_heading is None:
+            self.slide.first_heading = text
+        self.slide.blocks.append(f"<h{level}>{_inline(text)}</h{level}>")
+
+    def _emit_code(self, lines: list[str], info: str) -> None:
+        """Emit a fenced code block."""
+        language = info.split()[0] if info else ""
+        attr = f' class="language-{html.escape(language)}"' if language else ""
+        code = html.escape("\n".join(lines) + "\n" if lines else "")
+        self.slide.blocks.append(f"<pre><code{attr}>{code}</code></pre>")
+
+    def _end_comment(self) -> None:
+        """Finish an HTML comment: apply directives, drop it from the output."""
+        raw = "\n".join(self._comment)
+        self._comment = None
+        body, _, rest = raw.partition("-->")
+        self._directives(body.split("<!--", 1)[-1])
+        if rest.strip():
+            self._feed_block(rest)
+
+    def _directives(self, comment: str) -> None:
+        """Record ``key: value`` directives found in a comment."""
+        for line in comment.splitlines():
+            match = _DIRECTIVE.match(line)
+            if match and match.group(2) in LOCAL_DIRECTIVES:
+                key = match.group(1) + match.group(2)
+                self.slide.directives[key] = _unquote(match.group(3))
+
+
+def _unquote(value: str) -> str:
+    """Strip one level of YAML-style quotes."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def markdown_fragment(markdown: str) -> str:
+    """
+    Convert a markdown snippet (no slide breaks or directives) to HTML.
+
+    Args:
+        markdown: Markdown text
+
+    Returns:
+        HTML of its blocks, one per line group
+    """
+    parser = _Parser()
+    parser._started = True
+    for line in markdown.split("\n"):
+        parser.feed(line)
+    return "\n".join(parser.finish().blocks)
+
+
+# ============================================================================
+# DOCUMENT
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=16)
+def _read_theme(path: str, mtime_ns: int) -> str:
+    """Theme CSS ready to inline, cached until the file changes."""
+    css = Path(path).read_text(encoding="utf-8")
+    return _BUILTIN_IMPORT.sub("", css)
+
+
+@functools.lru_cache(maxsize=None)
+def bundled_theme() -> str:
+    """
+    Read the theme bundled with the package (custom-style.css), once per process.
+
+    Read through ``importlib.resources``, like the bundled templates, so it
+    works from an installed wheel as well as from a checkout.
+
+    Returns:
+        CSS text, ready to inline (see ``load_theme``)
+    """
+    css = (resources.files("slide_renderer") / DEFAULT_THEME).read_text(encoding="utf-8")
+    return _BUILTIN_IMPORT.sub("", css)
+
+
+def load_theme(path: Union[str, Path, None] = None) -> str:
+    """
+    Read a Marp theme CSS file for inlining.
+
+    ``@import`` of Marp's bundled themes (default, gaia, uncover) is removed,
+    since those only exist inside Marp.
+
+    Args:
+        path: Theme CSS file (default: None, the bundled custom-style.css)
+
+    Returns:
+        CSS text
+
+    Raises:
+        FileNotFoundError: If the theme file doesn't exist
+    """
+    if path is None:
+        return bundled_theme()
+    path = Path(path)
+    return _read_theme(str(path), path.stat().st_mtime_ns)
+
+
+def _section(slide: _Slide, number: int, state: dict[str, str], paginate: bool) -> str:
+    """Render one slide as a Marp-style <section>, updating inherited directives."""
+    values = dict(state)
+    for key, value in slide.directives.items():
+        if key.startswith("_"):
+            values[key[1:]] = value
+        else:
+            state[key] = value
+            values[key] = value
+
+    attrs = [f'id="{number}"']
+    if values.get("paginate", str(paginate)).lower() == "true":
+        attrs.append(f'data-marpit-pagination="{number}"')
+    if values.get("class"):
+        cls = html.escape(values["class"])
+        attrs.append(f'data-class="{cls}" class="{cls}"')
+
+    style = []
+    if values.get("backgroundColor"):
+        style.append(f"background-color:{values['backgroundColor']}")
+        attrs.append(f'data-background-color="{html.escape(values["backgroundColor"])}"')
+    if values.get("color"):
+        style.append(f"color:{values['color']}")
+        attrs.append(f'data-color="{html.escape(values["color"])}"')
+    if style:
+        attrs.append(f'style="{html.escape(";".join(style))}"')
+
+    parts = [f"<section {' '.join(attrs)}>"]
+    if values.get("header"):
+        parts.append(f"<header>{_inline(values['header'])}</header>")
+    parts.extend(slide.blocks)
+    if values.get("footer"):
+        parts.append(f"<footer>{_inline(values['footer'])}</footer>")
+    parts.append("</section>\n")
+    return "\n".join(parts)
+
+
+def iter_html(
+    chunks: Iterable[str],
+    theme_css: Optional[str] = None,
+    title: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Convert a stream of Marp markdown chunks into a standalone HTML document.
+
+    Slides are emitted as soon as they are complete, so this can wrap
+    ``SlideRenderer.render_presentation_iter`` and ``write_atomic``.
+
+    Args:
+        chunks: Marp markdown text, in pieces of any size
+        theme_css: Theme CSS to inline (default: ``load_theme()``)
+        title: Document title (default: ``title`` directive, else the first
+            heading)
+        lang: Document language (default: ``lang`` directive, else "en")
+
+    Yields:
+        HTML text chunks
+    """
+    if theme_css is None:
+        theme_css = load_theme()
+
+    parser = _Parser()
+    state: dict[str, str] = {}
+    number = 0
+    head_done = False
+    pending = ""
+
+    def lines() -> Iterator[Optional[str]]:
+        nonlocal pending
+        for chunk in chunks:
+            pending += chunk
+            *complete, pending = pending.split("\n")
+            yield from complete
+        if pending:
+            yield pending
+        yield None  # end of input
+
+    for line in lines():
+        slide = parser.finish() if line is None else parser.feed(line)
+        if slide is None:
+            continue
+        # A trailing break leaves an empty last slide, which Marp doesn't render
+        if line is None and not slide.blocks and not slide.directives and number:
+            break
+
+        number += 1
+        frontmatter = parser.frontmatter or {}
+        if not head_done:
+            head_done = True
+            for key in LOCAL_DIRECTIVES:
+                if key in frontmatter:
+                    state[key] = frontmatter[key]
+            yield _head(
+                title or frontmatter.get("title") or _plain(slide.first_heading or "") or "Slides",
+                lang or frontmatter.get("lang") or "en",
+                theme_css,
+            )
+
+        yield _section(slide, number, state, paginate=False)
+
+    if not head_done:
+        yield _head(title or "Slides", lang or "en", theme_css)
+    yield "</div>\n</body>\n</html>\n"
+
+
+def _head(title: str, lang: str, theme_css: str) -> str:
+    """Document start, up to the opening of the slide container."""
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html lang="{html.escape(lang)}">\n<head>\n<meta charset="UTF-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+        f"<title>{html.escape(title)}</title>\n"
+        f"<style>\n{BASE_CSS}</style>\n<style>\n{theme_css}\n</style>\n"
+        '</head>\n<body>\n<div class="marpit">\n'
+    )
+
+
+def markdown_to_html(
+    markdown: str,
+    theme_css: Optional[str] = None,
+    title: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> str:
+    """
+    Convert Marp markdown into a standalone HTML document.
+
+    Args:
+        markdown: Marp markdown (e.g. ``SlideRenderer.render_presentation``)
+        theme_css: Theme CSS to inline (default: custom-style.css)
+        title: Document title (default: ``title`` directive or first heading)
+        lang: Document language (default: ``lang`` directive, else "en")
+
+    Returns:
+        HTML document with one <section> per slide
+
+    Example:
+        >>> html = markdown_to_html(renderer.render_presentation(slides))
+        >>> html.count("<section")
+        14
+    """
+    return "".join(iter_html([markdown], theme_css, title, lang))
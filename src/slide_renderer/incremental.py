@@ -0,0 +1,211 @@
+"""
+Incremental deck re-rendering with slide-level diffing.
+
+IncrementalRenderer remembers the previous slide list and its rendered
+chunks. Given a new list it diffs the two at slide level, renders only the
+inserted and changed slides, and returns the new document together with a
+compact patch (UTF-8 byte offsets into the previous document plus
+replacement text) that a live-preview client can apply instead of
+downloading the whole document again.
+
+Usage:
+    from slide_renderer.incremental import IncrementalRenderer
+
+    incremental = IncrementalRenderer()
+    patch = incremental.update(slides)          # first render: one full edit
+    slides[42]["content"]["title"] = "Edited"
+    patch = incremental.update(slides)          # re-renders slide 42 only
+    for edit in patch.edits:
+        send(edit.start, edit.end, edit.text)
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Iterable, Optional
+
+from slide_renderer.cache import RenderCache
+from slide_renderer.renderer import MARP_FRONTMATTER, SLIDE_SEPARATOR, SlideRenderer
+
+
+@dataclass
+class TextEdit:
+    """
+    Replacement of a byte range in the previous document.
+
+    Attributes:
+        start: Start offset in the previous document (UTF-8 bytes)
+        end: End offset (exclusive) in the previous document (UTF-8 bytes)
+        text: Replacement text
+    """
+
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class RenderPatch:
+    """
+    Result of an incremental update.
+
+    Attributes:
+        document: Complete new presentation markdown
+        edits: Non-overlapping edits against the previous document, by offset
+        inserted: Indices (in the new list) of inserted slides
+        removed: Indices (in the previous list) of removed slides
+        changed: Indices (in the new list) of slides whose content changed
+        rendered: Number of slides actually rendered for this update
+    """
+
+    document: str
+    edits: list[TextEdit] = field(default_factory=list)
+    inserted: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    changed: list[int] = field(default_factory=list)
+    rendered: int = 0
+
+    def apply(self, previous: str) -> str:
+        """
+        Apply the edits to the previous document.
+
+        Args:
+            previous: Document returned by the previous update
+
+        Returns:
+            The new document
+        """
+        data = previous.encode("utf-8")
+        for edit in reversed(self.edits):
+            data = data[: edit.start] + edit.text.encode("utf-8") + data[edit.end :]
+        return data.decode("utf-8")
+
+
+class IncrementalRenderer:
+    """
+    Re-renders a deck incrementally, one slide at a time.
+
+    Attributes:
+        renderer: SlideRenderer used for rendering
+        validate: Whether slides are validated before rendering
+        include_frontmatter: Whether the document starts with Marp frontmatter
+        document: Current presentation markdown ("" before the first update)
+    """
+
+    def __init__(
+        self,
+        renderer: Optional[SlideRenderer] = None,
+        validate: bool = True,
+        include_frontmatter: bool = True,
+    ):
+        """
+        Initialize with no previous deck.
+
+        Args:
+            renderer: SlideRenderer to use (default: a new SlideRenderer())
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+        """
+        self.renderer = renderer if renderer is not None else SlideRenderer()
+        self.validate = validate
+        self.include_frontmatter = include_frontmatter
+        self.document = ""
+
+        # Per slide of the current deck: content key, rendered chunk, piece size in bytes
+        self._keys: list[str] = []
+        self._chunks: list[str] = []
+        self._sizes: list[int] = []
+        self._has_document = False
+
+    def update(self, slides: Iterable[dict[str, Any]]) -> RenderPatch:
+        """
+        Render a new version of the deck, reusing unchanged slides.
+
+        Args:
+            slides: Slide dictionaries with 'type' and 'content' keys
+
+        Returns:
+            RenderPatch with the new document and edits against the previous one
+
+        Raises:
+            ValueError: If an inserted or changed slide fails to render. The
+                previous state is kept, so the next update diffs against it.
+        """
+        slides = list(slides)
+        keys = [self._slide_key(i, slide_data) for i, slide_data in enumerate(slides)]
+
+        # Reuse chunks of slides seen in the previous deck (or earlier in this one)
+        known_chunks = dict(zip(self._keys, self._chunks))
+        chunks = []
+        rendered = 0
+        for i, (key, slide_data) in enumerate(zip(keys, slides)):
+            chunk = known_chunks.get(key)
+            if chunk is None:
+                chunk = self.renderer.render_slide(slide_data, self.validate, index=i)
+                known_chunks[key] = chunk
+                rendered += 1
+            chunks.append(chunk)
+
+        # Piece i is the slide's chunk, preceded by a separator after the first slide
+        pieces = [SLIDE_SEPARATOR + chunk if i else chunk for i, chunk in enumerate(chunks)]
+        frontmatter = MARP_FRONTMATTER if self.include_frontmatter else ""
+        document = frontmatter + "".join(pieces)
+
+        patch = RenderPatch(document=document, rendered=rendered)
+        self._classify(keys, patch)
+
+        if self._has_document:
+            patch.edits = self._diff_pieces(keys, pieces, len(frontmatter.encode("utf-8")))
+        else:
+            patch.edits = [TextEdit(start=0, end=0, text=document)]
+
+        self.document = document
+        self._keys = keys
+        self._chunks = chunks
+        self._sizes = [len(piece.encode("utf-8")) for piece in pieces]
+        self._has_document = True
+
+        return patch
+
+    def _slide_key(self, index: int, slide_data: dict[str, Any]) -> str:
+        """Content key of a slide, including its template fingerprint."""
+        slide_type = slide_data.get("type")
+
+        try:
+            fingerprint = self.renderer.template_fingerprint(slide_type)
+        except ValueError:
+            # Let the normal render path raise its descriptive error
+            self.renderer.render_slide(slide_data, self.validate, index=index)
+            raise
+
+        return RenderCache.make_key(
+            slide_type, slide_data.get("content", {}), fingerprint, self.validate
+        )
+
+    def _classify(self, keys: list[str], patch: RenderPatch) -> None:
+        """Record inserted, removed and changed slide indices on the patch."""
+        matcher = SequenceMatcher(None, self._keys, keys, autojunk=False)
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+
+            common = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+            patch.changed.extend(range(j1, j1 + common))
+            patch.inserted.extend(range(j1 + common, j2))
+            patch.removed.extend(range(i1 + common, i2))
+
+    def _diff_pieces(self, keys: list[str], pieces: list[str], base: int) -> list[TextEdit]:
+        """Byte-offset edits turning the previous pieces into the new ones."""
+        old_ids = [(key, i > 0) for i, key in enumerate(self._keys)]
+        new_ids = [(key, i > 0) for i, key in enumerate(keys)]
+
+        offsets = [base]
+        for size in self._sizes:
+            offsets.append(offsets[-1] + size)
+
+        matcher = SequenceMatcher(None, old_ids, new_ids, autojunk=False)
+        return [
+            TextEdit(start=offsets[i1], end=offsets[i2], text="".join(pieces[j1:j2]))
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
@@ -0,0 +1,236 @@
+"""
+Incremental readers for very large slide dumps.
+
+``json.load`` needs the whole document in memory twice - once as text and
+once as Python objects. The readers below pull slides one at a time from a
+file object instead, so feeding them to ``SlideRenderer.render_presentation_iter``
+renders a multi-gigabyte deck in memory bounded by the largest single slide.
+
+Two input formats are supported:
+    json   A top-level array of slides, parsed incrementally
+    jsonl  One ``{"type", "content"}`` object per line (a.k.a. NDJSON)
+
+Usage:
+    from slide_renderer.jsonstream import iter_slides
+
+    with open("huge.jsonl", "rb") as f, open("huge.md", "w") as out:
+        renderer.render_to_stream(iter_slides(f, "jsonl"), out)
+"""
+
+import codecs
+import json
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+from slide_renderer import _json
+
+# File suffixes read as JSON Lines when the input format is "auto"
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+INPUT_FORMATS = ("auto", "json", "jsonl")
+
+# Characters read per call while scanning a JSON array
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def detect_input_format(path: Union[str, Path], input_format: str = "auto") -> str:
+    """
+    Resolve an input format, guessing from the file suffix for "auto".
+
+    Args:
+        path: Input path ('-' for stdin reads as "json")
+        input_format: "auto", "json" or "jsonl"
+
+    Returns:
+        "json" or "jsonl"
+
+    Raises:
+        ValueError: If input_format is not a known format
+    """
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(
+            f"Invalid input format: {input_format}. Valid formats: {', '.join(INPUT_FORMATS)}"
+        )
+
+    if input_format != "auto":
+        return input_format
+
+    return "jsonl" if Path(path).suffix.lower() in JSONL_SUFFIXES else "json"
+
+
+def iter_jsonl(fp: IO) -> Iterator[Any]:
+    """
+    Yield one JSON value per line of a JSON Lines stream.
+
+    Blank lines are skipped. Text and binary (UTF-8) file objects both work.
+
+    Args:
+        fp: Readable file object
+
+    Yields:
+        Decoded value of each non-blank line
+
+    Raises:
+        ValueError: If a line is not valid JSON (names the line number)
+
+    Example:
+        >>> with open("slides.jsonl", "rb") as f:
+        ...     for slide in iter_jsonl(f):
+        ...         print(slide["type"])
+    """
+    for line_number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+
+        try:
+            yield _json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Invalid JSON on line {line_number}: {e.msg} (column {e.colno})"
+            ) from e
+
+
+def iter_json_array(fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array without loading it whole.
+
+    The stream is read in chunks; only the element being decoded (plus at
+    most one chunk of lookahead) is held in memory. Text and binary (UTF-8)
+    file objects both work.
+
+    Args:
+        fp: Readable file object positioned at the start of the array
+        chunk_size: Characters read per call (default: 64 KiB)
+
+    Yields:
+        Each array element, decoded
+
+    Raises:
+        ValueError: If the input is not a JSON array, is malformed or is truncated
+
+    Example:
+        >>> with open("huge.json", "rb") as f:
+        ...     for slide in iter_json_array(f):
+        ...         print(slide["type"])
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")() if _is_binary(fp) else None
+    eof = False
+
+    def read(size: int) -> str:
+        nonlocal eof
+        data = fp.read(size)
+        eof = not data
+        return data if decoder is None else decoder.decode(data, final=eof)
+
+    buffer = ""
+    pos = 0
+    # Characters dropped from the front of the buffer, for error positions
+    consumed = 0
+    # What may come next: "[" at the start, a value or "]" after "[",
+    # a value after ",", "," or "]" after a value, nothing at the end
+    expect = "start"
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+
+        if pos == len(buffer):
+            if eof:
+                if expect == "end":
+                    return
+                raise ValueError("Unexpected end of JSON input: slide array is not closed")
+
+            chunk = read(chunk_size)
+            consumed += pos
+            buffer, pos = chunk, 0
+            continue
+
+        char = buffer[pos]
+
+        if expect == "start":
+            if char != "[":
+                raise ValueError("JSON input must contain an array of slides")
+            pos += 1
+            expect = "value_or_close"
+
+        elif expect == "end":
+            raise ValueError(f"Extra data after the slide array at character {consumed + pos}")
+
+        elif char == "]" and expect in ("value_or_close", "separator"):
+            pos += 1
+            expect = "end"
+
+        elif expect == "separator":
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at character {consumed + pos}")
+            pos += 1
+            expect = "value"
+
+        else:
+            # Decode one element, reading more input until it is complete. The
+            # read size doubles with the pending text, so a huge element costs
+            # O(size) rather than one re-parse per chunk.
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    # Only read on if more input could fix the error; a
+                    # malformed element fails fast instead of buffering the rest
+                    if eof or not _may_be_truncated(e, buffer):
+                        raise ValueError(
+                            f"Invalid JSON at character {consumed + e.pos}: {e.msg}"
+                        ) from e
+                else:
+                    # A bare number may continue in the next chunk
+                    if end < len(buffer) or eof:
+                        break
+
+                buffer += read(max(chunk_size, len(buffer) - pos))
+
+            yield value
+            pos = end
+            expect = "separator"
+
+            # Drop decoded text so the buffer stays bounded
+            if pos >= chunk_size:
+                consumed += pos
+                buffer, pos = buffer[pos:], 0
+
+
+def iter_slides(fp: IO, input_format: str = "json") -> Iterator[Any]:
+    """
+    Yield slides from a JSON array or JSON Lines stream.
+
+    Args:
+        fp: Readable file object
+        input_format: "json" (top-level array) or "jsonl" (one slide per line)
+
+    Yields:
+        Slide dictionaries, in order
+
+    Raises:
+        ValueError: If input_format is unknown or the input is malformed
+    """
+    if input_format == "jsonl":
+        return iter_jsonl(fp)
+    if input_format == "json":
+        return iter_json_array(fp)
+
+    raise ValueError(f"Invalid input format: {input_format}. Valid formats: json, jsonl")
+
+
+def _may_be_truncated(error: json.JSONDecodeError, buffer: str) -> bool:
+    """Whether a decode error could be caused by the buffer ending mid-element."""
+    # Partial literals and escapes ("tru", "\u00") fail a few characters early
+    return error.msg.startswith("Unterminated string") or error.pos >= len(buffer) - 6
+
+
+def _is_binary(fp: IO) -> bool:
+    """Whether a file object returns bytes from read()."""
+    mode = getattr(fp, "mode", None)
+    if isinstance(mode, str):
+        return "b" in mode
+    return not hasattr(fp, "encoding")
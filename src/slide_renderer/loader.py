@@ -0,0 +1,103 @@
+"""
+Template loading: the bundled templates, served from memory.
+
+The slide templates ship inside the package (``slide_renderer/templates/``)
+and are read once per process through ``importlib.resources``, so they are
+found in wheels, zip imports and editable installs alike. Every renderer then
+loads them from an in-memory DictLoader: no template file is looked up, and
+Jinja2 never checks for changes since the sources can't change.
+
+A filesystem template directory replaces the bundled set, e.g. for
+developing templates with hot reload (``SlideRenderer(template_dir=...)``,
+``slide-renderer --template-dir``). A layered loader instead overrides only
+the templates a directory contains (see slide_renderer.themes).
+
+Usage:
+    from slide_renderer.loader import bundled_templates, template_loader
+
+    sources = bundled_templates()           # {"quote.jinja2": "...", ...}
+    env = Environment(loader=template_loader())
+"""
+
+import functools
+from importlib import resources
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Union
+
+from jinja2 import BaseLoader, ChoiceLoader, DictLoader, FileSystemLoader
+
+# File name suffix of slide templates
+TEMPLATE_SUFFIX = ".jinja2"
+
+# Bundled templates in a source checkout: edit these, then pass this directory
+# as template_dir for hot reload
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+@functools.lru_cache(maxsize=None)
+def bundled_templates() -> Mapping[str, str]:
+    """
+    Read the templates bundled with the package, once per process.
+
+    Returns:
+        Read-only mapping of template file name → source
+        (e.g. ``"quote.jinja2"``)
+    """
+    sources = {}
+    for resource in (resources.files("slide_renderer") / "templates").iterdir():
+        if resource.name.endswith(TEMPLATE_SUFFIX) and resource.is_file():
+            sources[resource.name] = resource.read_text(encoding="utf-8")
+    return MappingProxyType(dict(sorted(sources.items())))
+
+
+class _BundledLoader(DictLoader):
+    """DictLoader of the bundled templates; pickled by reference, not by content."""
+
+    def __init__(self) -> None:
+        super().__init__(bundled_templates())
+
+    def __reduce__(self):
+        # Worker processes read their own copy of the bundled templates
+        return (_BundledLoader, ())
+
+
+def template_loader(template_dir: Union[str, Path, None] = None) -> BaseLoader:
+    """
+    Get the Jinja2 loader for a template directory, or for the bundled templates.
+
+    Args:
+        template_dir: Templates directory replacing the bundled templates
+            (default: None, the bundled templates from memory)
+
+    Returns:
+        FileSystemLoader for a directory, else a DictLoader of the bundled
+        templates
+
+    Raises:
+        FileNotFoundError: If the template directory doesn't exist
+    """
+    if template_dir is None:
+        return _BundledLoader()
+
+    template_dir = Path(template_dir)
+    if not template_dir.is_dir():
+        raise FileNotFoundError(f"Template directory not found: {template_dir}")
+    return FileSystemLoader(template_dir)
+
+
+def layered_loader(override_dir: Union[str, Path]) -> BaseLoader:
+    """
+    Get a loader serving templates from a directory first, bundled ones otherwise.
+
+    Args:
+        override_dir: Directory with the templates to override (may hold
+            only a few of them)
+
+    Returns:
+        ChoiceLoader of the directory and the bundled templates
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist
+    """
+    return ChoiceLoader([template_loader(override_dir), template_loader()])
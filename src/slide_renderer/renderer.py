@@ -17,14 +17,75 @@ Or render multiple slides:
     presentation = renderer.render_presentation(slides_data)
 """
 
+import asyncio
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, TextIO, Union
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+)
+from pydantic import BaseModel, ValidationError
+
+from slide_renderer import _json
+from slide_renderer.cache import RenderCache
+from slide_renderer.compiler import (
+    DEFAULT_COMPILED_MODULE,
+    load_compiled_module,
+    template_source_fingerprint,
+)
+from slide_renderer.jsonstream import detect_input_format, iter_jsonl
+from slide_renderer.loader import template_loader
+from slide_renderer.schemas.content import get_content_model
+from slide_renderer.schemas.presentation import (
+    SlideError,
+    errors_from_validation_error,
+    validate_presentation,
+    validate_presentation_json,
+)
+from slide_renderer.writer import DEFAULT_BUFFER_SIZE, write_atomic
+
+# Marp frontmatter emitted before the first slide
+MARP_FRONTMATTER = """---
+marp: true
+theme: custom-style
+---
 
-from jinja2 import Environment, FileSystemLoader, Template
-from pydantic import ValidationError
+"""
 
-from slide_renderer.schemas.content import get_content_model
+# Separator emitted between consecutive slides
+SLIDE_SEPARATOR = "\n---\n\n"
+
+
+@dataclass
+class PresentationReport:
+    """
+    Result of rendering a deck in error-collection mode.
+
+    Attributes:
+        markdown: Presentation built from the slides that rendered
+        errors: Every failure in the deck (validation and rendering)
+        rendered: Indices of the slides included in ``markdown``
+    """
+
+    markdown: str
+    errors: list[SlideError] = field(default_factory=list)
+    rendered: list[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every slide rendered."""
+        return not self.errors
+
+    @property
+    def failed(self) -> list[int]:
+        """Indices of the slides that failed, without duplicates."""
+        return sorted({error.index for error in self.errors if error.index is not None})
 
 
 class SlideRenderer:
@@ -32,34 +93,146 @@ class SlideRenderer:
     Renders Marp slides from Jinja2 templates and JSON data.
 
     Attributes:
-        template_dir: Path to templates directory
+        template_dir: Templates directory, or None for the bundled templates
         env: Jinja2 environment
+        cache: Optional cache of rendered slides
     """
 
-    def __init__(self, template_dir: Union[str, Path] = None):
+    def __init__(
+        self,
+        template_dir: Union[str, Path] = None,
+        cache: Optional[RenderCache] = None,
+        production: bool = False,
+        bytecode_cache_dir: Union[str, Path, None] = None,
+        backend: str = "auto",
+        compiled_module: Union[str, Path, None] = None,
+        loader: Optional[BaseLoader] = None,
+    ):
         """
         Initialize renderer with template directory.
 
         Args:
-            template_dir: Path to templates directory (default: ./templates/)
+            template_dir: Templates directory replacing the bundled templates,
+                e.g. to develop templates with hot reload (default: None, the
+                templates bundled with the package, served from memory)
+            cache: Optional RenderCache; cache hits skip validation and rendering
+            production: Production mode (default: False). All templates are
+                compiled once at startup and never re-checked on disk, and
+                compiled bytecode is cached on disk for fast cold starts.
+                In dev mode templates are hot-reloaded when their files change.
+            bytecode_cache_dir: Directory for the Jinja2 bytecode cache
+                (default: a per-user temp directory in production mode,
+                no bytecode cache in dev mode)
+            backend: Template backend - "jinja2", "compiled" (plain Python
+                functions generated by ``slide_renderer.compiler``) or "auto"
+                (default: compiled in production mode when available, so dev
+                mode keeps hot reload). Compiled functions are only used for
+                templates whose source fingerprint still matches.
+            compiled_module: Path of the compiled module
+                (default: slide_renderer/_compiled_templates.py)
+            loader: Jinja2 loader to use instead of ``template_dir``, e.g.
+                ``loader.layered_loader(dir)`` to override a few templates
         """
-        if template_dir is None:
-            # Find templates directory - go up from src/slide_templates to package root
-            package_root = Path(__file__).parent.parent.parent
-            template_dir = package_root / "templates"
-        else:
+        if backend not in ("auto", "jinja2", "compiled"):
+            raise ValueError(f"Invalid backend: {backend}. Valid backends: auto, jinja2, compiled")
+
+        if template_dir is not None:
             template_dir = Path(template_dir)
 
-        if not template_dir.exists():
-            raise FileNotFoundError(f"Template directory not found: {template_dir}")
+        # Arguments render_many's worker processes build their renderers from
+        self._worker_options: dict[str, Any] = {
+            "template_dir": template_dir,
+            "bytecode_cache_dir": bytecode_cache_dir,
+            "backend": backend,
+            "compiled_module": compiled_module,
+            "loader": loader,
+            "cache": (
+                (cache.maxsize, cache.directory, cache.max_disk_bytes)
+                if cache is not None
+                else None
+            ),
+        }
+
+        if loader is None:
+            loader = template_loader(template_dir)
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        elif production:
+            bytecode_cache = FileSystemBytecodeCache()
 
         self.template_dir = template_dir
+        self.production = production
         self.env = Environment(
-            loader=FileSystemLoader(template_dir),
+            loader=loader,
             trim_blocks=False,
             lstrip_blocks=False,
             keep_trailing_newline=True,
+            auto_reload=not production,
+            bytecode_cache=bytecode_cache,
         )
+        self.cache = cache
+        # slide type → compiled template (filled at startup in production mode)
+        self._templates: dict[str, Template] = {}
+        # slide type → (template object, source hash)
+        self._fingerprints: dict[str, tuple[Template, str]] = {}
+        # slide type → compiled render function (see slide_renderer.compiler)
+        self._compiled: dict[str, Callable[[Mapping[str, Any]], str]] = {}
+
+        if production:
+            self.precompile_templates()
+
+        if backend == "compiled" or (backend == "auto" and production):
+            self._load_compiled(compiled_module, required=backend == "compiled")
+
+    def precompile_templates(self) -> int:
+        """
+        Compile every template (bundled, or in the template directory) up front.
+
+        Compiled templates are served from memory afterwards; in production
+        mode no template file is looked up again.
+
+        Returns:
+            Number of templates compiled
+        """
+        suffix = ".jinja2"
+        for template_file in self.env.list_templates(extensions=[suffix[1:]]):
+            slide_type = template_file[: -len(suffix)]
+            self._templates[slide_type] = self.env.get_template(template_file)
+
+        return len(self._templates)
+
+    def _load_compiled(self, compiled_module: Union[str, Path, None], required: bool) -> None:
+        """
+        Use compiled render functions whose fingerprints match the templates.
+
+        Args:
+            compiled_module: Path of the compiled module (None = default path)
+            required: Raise if the module doesn't exist
+
+        Raises:
+            FileNotFoundError: If required and the compiled module is missing
+        """
+        module = load_compiled_module(compiled_module)
+        if module is None:
+            if required:
+                raise FileNotFoundError(
+                    f"Compiled templates not found: {compiled_module or DEFAULT_COMPILED_MODULE}\n"
+                    "Run: python -m slide_renderer.compiler"
+                )
+            return
+
+        for slide_type, render_function in module.RENDERERS.items():
+            try:
+                source, _, _ = self.env.loader.get_source(self.env, f"{slide_type}.jinja2")
+            except TemplateNotFound:
+                continue
+
+            # Stale functions (template edited since compiling) fall back to Jinja2
+            if module.FINGERPRINTS.get(slide_type) == template_source_fingerprint(source):
+                self._compiled[slide_type] = render_function
 
     def _get_template(self, slide_type: str) -> Template:
         """
@@ -74,23 +247,59 @@ class SlideRenderer:
         Raises:
             ValueError: If slide type is invalid
         """
+        template = self._templates.get(slide_type)
+        if template is not None:
+            return template
+
         template_file = f"{slide_type}.jinja2"
-        template_path = self.template_dir / template_file
 
-        if not template_path.exists():
-            raise ValueError(
-                f"Template not found for slide type: {slide_type}\nExpected file: {template_path}"
-            )
+        # Dev mode: let Jinja2 load (and hot-reload) the file. In production
+        # every template was compiled at startup, so a miss is final.
+        if not self.production:
+            try:
+                return self.env.get_template(template_file)
+            except TemplateNotFound:
+                pass
+
+        location = self.template_dir if self.template_dir is not None else "bundled templates"
+        raise ValueError(
+            f"Template not found for slide type: {slide_type}\n"
+            f"Expected file: {template_file} in {location}"
+        )
+
+    def template_fingerprint(self, slide_type: str) -> str:
+        """
+        Get a hash of the template source for a slide type.
+
+        The hash is recomputed only when Jinja2 hands back a new template
+        object, i.e. after the template file was reloaded.
+
+        Args:
+            slide_type: Slide type value (e.g., "title_slide")
+
+        Returns:
+            Hex SHA-256 digest of the template source
 
-        return self.env.get_template(template_file)
+        Raises:
+            ValueError: If slide type is invalid
+        """
+        template = self._get_template(slide_type)
+        cached = self._fingerprints.get(slide_type)
 
-    def validate_content(self, slide_type: str, content: dict[str, Any]) -> Any:
+        if cached is None or cached[0] is not template:
+            source, _, _ = self.env.loader.get_source(self.env, template.name)
+            cached = (template, template_source_fingerprint(source))
+            self._fingerprints[slide_type] = cached
+
+        return cached[1]
+
+    def validate_content(self, slide_type: str, content: Union[dict[str, Any], BaseModel]) -> Any:
         """
         Validate content data against Pydantic schema.
 
         Args:
             slide_type: Slide type value
-            content: Content data dictionary
+            content: Content data dictionary (or an already validated model)
 
         Returns:
             Validated Pydantic model instance
@@ -102,19 +311,21 @@ class SlideRenderer:
         model_class = get_content_model(slide_type)
 
         try:
-            validated = model_class(**content)
+            validated = model_class.model_validate(content)
             return validated
         except ValidationError as e:
             # Re-raise with additional context as ValueError
             raise ValueError(f"Validation error for slide type '{slide_type}':\n{e}") from e
 
-    def render(self, slide_type: str, content: dict[str, Any], validate: bool = True) -> str:
+    def render(
+        self, slide_type: str, content: Union[dict[str, Any], BaseModel], validate: bool = True
+    ) -> str:
         """
         Render a single slide.
 
         Args:
             slide_type: Slide type value (e.g., "title_slide")
-            content: Content data dictionary
+            content: Content data dictionary or validated content model
             validate: Whether to validate content against schema (default: True)
 
         Returns:
@@ -131,11 +342,62 @@ class SlideRenderer:
             ...     "subtitle": "An Amazing Journey"
             ... })
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(slide_type, content, validate)
+            if cache_key is not None:
+                rendered = self.cache.get(cache_key)
+                if rendered is not None:
+                    return rendered
+
         # Validate content if requested
         if validate:
-            validated = self.validate_content(slide_type, content)
-            # Use model_dump() to get dict with validated data
-            content = validated.model_dump()
+            content = self.validate_content(slide_type, content)
+
+        rendered = self._render_content(slide_type, content)
+
+        if cache_key is not None:
+            self.cache.put(cache_key, rendered)
+
+        return rendered
+
+    def _cache_key(
+        self, slide_type: str, content: Union[dict[str, Any], BaseModel], validate: bool
+    ) -> Optional[str]:
+        """
+        Build the render cache key for a slide.
+
+        Returns None for unknown slide types, so the normal path raises the
+        usual validation or template error.
+        """
+        try:
+            fingerprint = self.template_fingerprint(slide_type)
+        except ValueError:
+            return None
+
+        return self.cache.make_key(slide_type, content, fingerprint, validate)
+
+    def _render_content(self, slide_type: str, content: Union[dict[str, Any], BaseModel]) -> str:
+        """
+        Render the template for a slide type without validating.
+
+        Validated models are passed to the template as-is: the top-level fields
+        come from the model's own field dict and nested models (items, images,
+        metrics) are read by attribute access, so no model_dump() copy is made.
+
+        Args:
+            slide_type: Slide type value (e.g., "title_slide")
+            content: Content data dictionary or validated content model
+
+        Returns:
+            Rendered markdown string
+        """
+        if isinstance(content, BaseModel):
+            content = vars(content)
+
+        compiled = self._compiled.get(slide_type)
+        if compiled is not None:
+            return compiled(content)
 
         # Get template and render
         template = self._get_template(slide_type)
@@ -165,45 +427,410 @@ class SlideRenderer:
             ... ]
             >>> presentation = renderer.render_presentation(slides)
         """
+        return "".join(self._iter_presentation(slides, validate, include_frontmatter))
+
+    def render_html(
+        self,
+        slides: list[dict[str, Any]],
+        validate: bool = True,
+        theme_css: Optional[str] = None,
+        title: Optional[str] = None,
+        tree_shake: bool = False,
+        font_dir: Union[str, Path, None] = None,
+    ) -> str:
+        """
+        Render multiple slides into a standalone HTML deck, without Marp CLI.
+
+        Args:
+            slides: List of slide dictionaries with 'type' and 'content' keys
+            validate: Whether to validate content (default: True)
+            theme_css: Theme CSS to inline (default: custom-style.css)
+            title: Document title (default: the first heading)
+            tree_shake: Inline only the CSS rules the deck's slide types need,
+                minified (see slide_renderer.stylesheet; default: False)
+            font_dir: Local directory of the theme's font files; the fonts
+                the deck uses are embedded, subset to its characters, instead
+                of loaded from their URLs (see slide_renderer.fonts; default:
+                None, fonts left as they are)
+
+        Returns:
+            HTML document with one <section> per slide (see slide_renderer.htmlexport)
+
+        Example:
+            >>> html = renderer.render_html(slides)
+            >>> Path("preview.html").write_text(html)
+        """
+        from slide_renderer.htmlexport import iter_html, load_theme
+
+        if tree_shake:
+            from slide_renderer.stylesheet import deck_stylesheet
+
+            slide_types = [slide.get("type") for slide in slides if isinstance(slide, dict)]
+            theme_css = deck_stylesheet(
+                slide_types, theme_css if theme_css is not None else load_theme(), renderer=self
+            )
+
+        chunks = self._iter_presentation(slides, validate, include_frontmatter=True)
+        document = "".join(iter_html(chunks, theme_css=theme_css, title=title))
+
+        if font_dir is not None:
+            from slide_renderer.fonts import embed_fonts
+
+            document = embed_fonts(document, font_dir)
+        return document
+
+    def _iter_presentation(
+        self, slides: list[dict[str, Any]], validate: bool, include_frontmatter: bool
+    ) -> Iterator[str]:
+        """
+        Yield the chunks of ``render_presentation``, using the deck fast path.
+
+        Args:
+            slides: List of slide dictionaries with 'type' and 'content' keys
+            validate: Whether to validate content
+            include_frontmatter: Whether to include Marp frontmatter
+
+        Yields:
+            Markdown chunks (frontmatter, slide, separator, slide, ...)
+        """
+        # Fast path: validate the whole deck in one pydantic-core call. Invalid
+        # decks fall through to the per-slide path, which names the failing slide.
+        # With a cache, slides go through render() so hits skip validation.
+        if validate and self.cache is None:
+            try:
+                validated_slides = validate_presentation(slides)
+            except ValidationError:
+                pass
+            else:
+                rendered_slides = self._iter_validated_slides(validated_slides)
+                yield from self._iter_chunks(rendered_slides, include_frontmatter)
+                return
+
+        yield from self.render_presentation_iter(
+            slides, validate=validate, include_frontmatter=include_frontmatter
+        )
+
+    def render_presentation_report(
+        self, slides: list[dict[str, Any]], include_frontmatter: bool = True
+    ) -> PresentationReport:
+        """
+        Validate every slide in one pass and render the valid ones.
+
+        Unlike ``render_presentation``, nothing is raised for bad slides:
+        the report lists every failure (slide index, type, field path,
+        constraint and offending value) so all broken slides can be fixed or
+        regenerated in one batch, and the markdown contains the rest.
+
+        Args:
+            slides: List of slide dictionaries with 'type' and 'content' keys
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Returns:
+            PresentationReport with markdown, errors and rendered slide indices
+
+        Example:
+            >>> report = renderer.render_presentation_report(slides)
+            >>> for error in report.errors:
+            ...     print(error.index, error.slide_type, error.field, error.constraint)
+        """
+        try:
+            validated_slides = validate_presentation(slides)
+        except ValidationError as e:
+            validated_slides = None
+            errors = errors_from_validation_error(slides, e)
+        else:
+            errors = []
+
+        failed = {error.index for error in errors}
         rendered_slides = []
+        rendered = []
+
+        # An error without an index means the deck itself isn't a list of slides
+        for i, slide_data in enumerate(slides if None not in failed else []):
+            if i in failed:
+                continue
 
-        # Render each slide
-        for i, slide_data in enumerate(slides):
             try:
-                slide_type = slide_data.get("type")
-                content = slide_data.get("content", {})
+                if validated_slides is not None:
+                    slide = validated_slides[i]
+                    chunk = self._render_content(slide.type, slide.content)
+                else:
+                    chunk = self.render(slide_data["type"], slide_data["content"])
+            except Exception as e:
+                errors.append(
+                    SlideError(
+                        index=i,
+                        slide_type=slide_data.get("type"),
+                        field="",
+                        constraint="render_error",
+                        message=str(e),
+                    )
+                )
+                continue
+
+            rendered_slides.append(chunk)
+            rendered.append(i)
+
+        errors.sort(key=lambda error: -1 if error.index is None else error.index)
+        markdown = "".join(self._iter_chunks(rendered_slides, include_frontmatter))
+
+        return PresentationReport(markdown=markdown, errors=errors, rendered=rendered)
+
+    def render_presentation_iter(
+        self,
+        slides: Iterable[dict[str, Any]],
+        validate: bool = True,
+        include_frontmatter: bool = True,
+    ) -> Iterator[str]:
+        """
+        Render a presentation lazily, one chunk at a time.
 
-                if not slide_type:
-                    raise ValueError(f"Slide {i}: Missing 'type' field")
+        Yields the frontmatter, then each rendered slide with separators in
+        between; joining the chunks gives exactly ``render_presentation``'s
+        output. Slides are pulled from ``slides`` (any iterable, e.g. a
+        generator) and validated one by one, so peak memory is bounded by the
+        largest single slide rather than the whole deck.
 
-                rendered = self.render(slide_type, content, validate=validate)
-                rendered_slides.append(rendered)
+        Args:
+            slides: Iterable of slide dictionaries with 'type' and 'content' keys
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Yields:
+            Markdown chunks (frontmatter, slide, separator, slide, ...)
 
+        Raises:
+            ValueError: When a slide is reached that fails to render
+        """
+        rendered_slides = (
+            self.render_slide(slide_data, validate, index=i) for i, slide_data in enumerate(slides)
+        )
+        yield from self._iter_chunks(rendered_slides, include_frontmatter)
+
+    def render_to_stream(
+        self,
+        slides: Iterable[dict[str, Any]],
+        fp: TextIO,
+        validate: bool = True,
+        include_frontmatter: bool = True,
+    ) -> int:
+        """
+        Render a presentation and write it incrementally to a text stream.
+
+        Args:
+            slides: Iterable of slide dictionaries with 'type' and 'content' keys
+            fp: Writable text file object (e.g. ``open(path, "w")`` or ``sys.stdout``)
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Returns:
+            Number of characters written
+
+        Example:
+            >>> with open("presentation.md", "w") as f:
+            ...     renderer.render_to_stream(slides, f)
+        """
+        written = 0
+        for chunk in self.render_presentation_iter(
+            slides, validate=validate, include_frontmatter=include_frontmatter
+        ):
+            fp.write(chunk)
+            written += len(chunk)
+
+        return written
+
+    def render_many(
+        self,
+        decks: Iterable[Any],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        validate: bool = True,
+        include_frontmatter: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Render many independent decks in parallel worker processes.
+
+        Each worker holds its own warm, production-mode SlideRenderer built
+        with this renderer's settings: template directory or loader, backend
+        and compiled module, bytecode cache directory, and a RenderCache of
+        the same size and directory (each worker has its own memory, so only
+        a disk cache is shared). See ``slide_renderer.batch.render_many``.
+
+        Args:
+            decks: Iterable of decks (slide lists or paths to JSON files)
+            workers: Number of worker processes (default: CPU count)
+            chunksize: Decks sent to a worker per task (default: 1)
+            ordered: Yield results in input order (default: True)
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Yields:
+            DeckResult for each deck (``index``, ``markdown``, ``error``)
+
+        Raises:
+            ValueError: If this renderer's loader can't be sent to worker
+                processes (e.g. a FunctionLoader of a lambda); use workers=1
+        """
+        from slide_renderer.batch import render_many
+
+        return render_many(
+            decks,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            validate=validate,
+            include_frontmatter=include_frontmatter,
+            renderer_options=self._worker_options,
+        )
+
+    def render_slide(
+        self, slide_data: dict[str, Any], validate: bool = True, index: int = 0
+    ) -> str:
+        """
+        Render one slide dictionary of a deck, naming the slide in any error.
+
+        Unlike ``render``, this takes the ``{"type", "content"}`` dictionary
+        as it appears in a deck, and errors say which slide failed.
+
+        Args:
+            slide_data: Slide dictionary with 'type' and 'content' keys
+            validate: Whether to validate content (default: True)
+            index: Position of the slide in its deck, for error messages
+                (default: 0)
+
+        Returns:
+            Rendered markdown string
+
+        Raises:
+            ValueError: If the slide is missing its type or fails to render
+
+        Example:
+            >>> renderer.render_slide({"type": "quote", "content": {...}}, index=3)
+        """
+        slide_type = None
+        try:
+            slide_type = slide_data.get("type")
+            content = slide_data.get("content", {})
+
+            if not slide_type:
+                raise ValueError(f"Slide {index}: Missing 'type' field")
+
+            return self.render(slide_type, content, validate=validate)
+
+        except Exception as e:
+            raise ValueError(f"Error rendering slide {index} ({slide_type}): {e}") from e
+
+    def _iter_validated_slides(self, validated_slides: Iterable[Any]) -> Iterator[str]:
+        """
+        Render slides already validated by the deck-level adapter.
+
+        Args:
+            validated_slides: Slide models from ``validate_presentation``, or
+                from ``validate_presentation_json(strict=False)`` where invalid
+                slides are plain values
+
+        Yields:
+            Rendered markdown string for each slide
+
+        Raises:
+            ValueError: When a slide is reached that fails to render
+        """
+        for i, slide in enumerate(validated_slides):
+            if not isinstance(slide, BaseModel):
+                # Rejected by the deck adapter: the per-slide path explains why
+                yield self.render_slide(slide, index=i)
+                continue
+            try:
+                yield self._render_content(slide.type, slide.content)
             except Exception as e:
-                raise ValueError(f"Error rendering slide {i} ({slide_type}): {e}") from e
+                raise ValueError(f"Error rendering slide {i} ({slide.type}): {e}") from e
+
+    def _iter_chunks(
+        self, rendered_slides: Iterable[str], include_frontmatter: bool = True
+    ) -> Iterator[str]:
+        """
+        Interleave rendered slides with frontmatter and separators.
 
-        # Join slides with separators
-        slides_content = "\n---\n\n".join(rendered_slides)
+        Args:
+            rendered_slides: Rendered markdown for each slide
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
 
-        # Add frontmatter if requested
+        Yields:
+            Markdown chunks (frontmatter, slide, separator, slide, ...)
+        """
         if include_frontmatter:
-            frontmatter = """---
-marp: true
-theme: custom-style
----
+            yield MARP_FRONTMATTER
+
+        for i, rendered in enumerate(rendered_slides):
+            if i:
+                yield SLIDE_SEPARATOR
+            yield rendered
+
+    def render_json_iter(
+        self,
+        data: Union[str, bytes, bytearray],
+        validate: bool = True,
+        include_frontmatter: bool = True,
+    ) -> Iterator[str]:
+        """
+        Render a presentation from JSON text, yielding markdown chunks.
 
-"""
-            return frontmatter + slides_content
+        Args:
+            data: JSON array of slides as str or bytes
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Yields:
+            Markdown chunks (frontmatter, slide, separator, slide, ...)
+
+        Raises:
+            ValueError: If the JSON is malformed, isn't an array, or a slide
+                fails to render
+
+        Example:
+            >>> for chunk in renderer.render_json_iter(sys.stdin.buffer.read()):
+            ...     sys.stdout.write(chunk)
+        """
+        # Fast path: validate straight from the JSON bytes, skipping json.loads.
+        # Invalid slides come back as plain values from the same parse and take
+        # the per-slide path, which names the failing slide.
+        if validate and self.cache is None:
+            try:
+                validated_slides = validate_presentation_json(data, strict=False)
+            except ValidationError:
+                pass  # Malformed JSON or not an array: reported below
+            else:
+                rendered_slides = self._iter_validated_slides(validated_slides)
+                yield from self._iter_chunks(rendered_slides, include_frontmatter)
+                return
 
-        return slides_content
+        # orjson when installed (see slide_renderer._json), stdlib json otherwise
+        slides = _json.loads(data)
 
-    def render_from_file(self, json_file: Union[str, Path], validate: bool = True) -> str:
+        if not isinstance(slides, list):
+            raise ValueError("JSON file must contain an array of slides")
+
+        yield from self.render_presentation_iter(
+            slides, validate=validate, include_frontmatter=include_frontmatter
+        )
+
+    def render_from_file(
+        self,
+        json_file: Union[str, Path],
+        validate: bool = True,
+        include_frontmatter: bool = True,
+        input_format: str = "auto",
+    ) -> str:
         """
         Render presentation from JSON file.
 
         Args:
             json_file: Path to JSON file with slides data
             validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+            input_format: "json", "jsonl" (one slide per line) or "auto"
+                (default: JSON Lines for .jsonl/.ndjson files, else JSON)
 
         Returns:
             Complete Marp presentation markdown
@@ -219,35 +846,110 @@ theme: custom-style
         if not json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-        with open(json_path) as f:
-            slides = json.load(f)
-
-        if not isinstance(slides, list):
-            raise ValueError("JSON file must contain an array of slides")
-
-        return self.render_presentation(slides, validate=validate)
+        if detect_input_format(json_path, input_format) == "jsonl":
+            with open(json_path, "rb") as f:
+                return "".join(
+                    self.render_presentation_iter(
+                        iter_jsonl(f), validate=validate, include_frontmatter=include_frontmatter
+                    )
+                )
+
+        data = json_path.read_bytes()
+        return "".join(
+            self.render_json_iter(data, validate=validate, include_frontmatter=include_frontmatter)
+        )
 
     def save_presentation(
-        self, slides: list[dict[str, Any]], output_file: Union[str, Path], validate: bool = True
+        self,
+        slides: list[dict[str, Any]],
+        output_file: Union[str, Path],
+        validate: bool = True,
+        compression: str = "auto",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ):
         """
         Render and save presentation to file.
 
+        Slides are streamed to a temp file that is renamed over the output
+        only once complete, so a failing slide or a crash never leaves a
+        partial file (see ``slide_renderer.writer``).
+
         Args:
             slides: List of slide dictionaries
-            output_file: Output markdown file path
+            output_file: Output markdown file path (.gz / .zst are compressed)
             validate: Whether to validate content (default: True)
+            compression: "auto" (by file suffix), "none", "gzip" or "zstd"
+            buffer_size: Write buffer size in bytes (default: 64 KiB)
         """
-        presentation = self.render_presentation(slides, validate=validate)
         output_path = Path(output_file)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            f.write(presentation)
+        write_atomic(
+            output_path,
+            self._iter_presentation(slides, validate, include_frontmatter=True),
+            compression=compression,
+            buffer_size=buffer_size,
+        )
 
         print(f"✅ Presentation saved to: {output_path}")
 
+    # ------------------------------------------------------------------------
+    # Async API - for asyncio pipelines (e.g. LLM generation)
+    #
+    # Validation, rendering and file I/O are CPU/IO-bound and synchronous, so
+    # they are offloaded to the default thread pool instead of blocking the
+    # event loop.
+    # ------------------------------------------------------------------------
+
+    async def arender(
+        self, slide_type: str, content: Union[dict[str, Any], BaseModel], validate: bool = True
+    ) -> str:
+        """
+        Render a single slide without blocking the event loop.
+
+        Args:
+            slide_type: Slide type value (e.g., "title_slide")
+            content: Content data dictionary or validated content model
+            validate: Whether to validate content against schema (default: True)
+
+        Returns:
+            Rendered markdown string
+
+        Example:
+            >>> markdown = await renderer.arender("title_slide", content)
+        """
+        return await asyncio.to_thread(self.render, slide_type, content, validate)
+
+    async def arender_presentation(
+        self, slides: list[dict[str, Any]], validate: bool = True, include_frontmatter: bool = True
+    ) -> str:
+        """
+        Render multiple slides into a presentation without blocking the event loop.
+
+        Args:
+            slides: List of slide dictionaries with 'type' and 'content' keys
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+
+        Returns:
+            Complete Marp presentation markdown
+        """
+        return await asyncio.to_thread(
+            self.render_presentation, slides, validate, include_frontmatter
+        )
+
+    async def asave_presentation(
+        self, slides: list[dict[str, Any]], output_file: Union[str, Path], validate: bool = True
+    ):
+        """
+        Render and save presentation to file without blocking the event loop.
+
+        Args:
+            slides: List of slide dictionaries
+            output_file: Output markdown file path
+            validate: Whether to validate content (default: True)
+        """
+        await asyncio.to_thread(self.save_presentation, slides, output_file, validate)
+
 
 # ============================================================================
 # EXAMPLE USAGE
@@ -1,29 +1,45 @@
-"""Pydantic schemas for slide content validation."""
-
-from slide_renderer.schemas.content import (
-    SLIDE_CONTENT_MODELS,
-    get_all_schemas,
-    get_content_model,
-    get_json_schema,
-    HighlightContent,
-    Horizontal3ColumnListContent,
-    Horizontal4ColumnListContent,
-    ImageItem,
-    ImageWithDescription2Content,
-    ImageWithDescription3Content,
-    ListItem,
-    MetricsGridContent,
-    MetricValue,
-    MetricWithDescription,
-    QuoteContent,
-    SectionTitleContent,
-    SingleContentWithImageContent,
-    ThreeColumnMetricsContent,
-    TitleSlideContent,
-    TwoColumnListContent,
-    TwoColumnsWithGridContent,
-    VerticalListContent,
-)
+"""Pydantic schemas for slide content validation.
+
+Names are resolved lazily, so pydantic is imported (and the models built)
+only when a schema is first used.
+"""
+
+import importlib
+
+# Public name → submodule defining it
+_LAZY_IMPORTS = {
+    "SLIDE_CONTENT_MODELS": "slide_renderer.schemas.content",
+    "get_all_schemas": "slide_renderer.schemas.content",
+    "get_content_model": "slide_renderer.schemas.content",
+    "get_json_schema": "slide_renderer.schemas.content",
+    "get_json_schema_text": "slide_renderer.schemas.content",
+    "HighlightContent": "slide_renderer.schemas.content",
+    "Horizontal3ColumnListContent": "slide_renderer.schemas.content",
+    "Horizontal4ColumnListContent": "slide_renderer.schemas.content",
+    "ImageItem": "slide_renderer.schemas.content",
+    "ImageWithDescription2Content": "slide_renderer.schemas.content",
+    "ImageWithDescription3Content": "slide_renderer.schemas.content",
+    "ListItem": "slide_renderer.schemas.content",
+    "MetricsGridContent": "slide_renderer.schemas.content",
+    "MetricValue": "slide_renderer.schemas.content",
+    "MetricWithDescription": "slide_renderer.schemas.content",
+    "QuoteContent": "slide_renderer.schemas.content",
+    "SectionTitleContent": "slide_renderer.schemas.content",
+    "SingleContentWithImageContent": "slide_renderer.schemas.content",
+    "ThreeColumnMetricsContent": "slide_renderer.schemas.content",
+    "TitleSlideContent": "slide_renderer.schemas.content",
+    "TwoColumnListContent": "slide_renderer.schemas.content",
+    "TwoColumnsWithGridContent": "slide_renderer.schemas.content",
+    "VerticalListContent": "slide_renderer.schemas.content",
+    "PRESENTATION_ADAPTER": "slide_renderer.schemas.presentation",
+    "SLIDE_MODELS": "slide_renderer.schemas.presentation",
+    "Presentation": "slide_renderer.schemas.presentation",
+    "Slide": "slide_renderer.schemas.presentation",
+    "SlideError": "slide_renderer.schemas.presentation",
+    "collect_slide_errors": "slide_renderer.schemas.presentation",
+    "validate_presentation": "slide_renderer.schemas.presentation",
+    "validate_presentation_json": "slide_renderer.schemas.presentation",
+}
 
 __all__ = [
     # Models
@@ -50,5 +66,31 @@ __all__ = [
     "SLIDE_CONTENT_MODELS",
     "get_content_model",
     "get_json_schema",
+    "get_json_schema_text",
     "get_all_schemas",
+    # Deck-level validation
+    "Slide",
+    "Presentation",
+    "SLIDE_MODELS",
+    "PRESENTATION_ADAPTER",
+    "validate_presentation",
+    "validate_presentation_json",
+    "SlideError",
+    "collect_slide_errors",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a schema's submodule on first access and cache the name."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Module attributes, including schemas not imported yet."""
+    return sorted(set(globals()) | set(__all__))
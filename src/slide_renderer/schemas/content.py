@@ -11,8 +11,12 @@ Usage with LLM APIs:
 - Others: Export schema and use with structured output
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from slide_renderer.schemas.json_schema import model_schema, model_schema_json
+
 # ============================================================================
 # SHARED COMPONENT MODELS
 # ============================================================================
@@ -274,6 +278,9 @@ def get_json_schema(slide_type: str) -> dict:
     """
     Get JSON schema for a slide type.
 
+    The schema is generated once per model (or loaded from a schema bundle,
+    see ``json_schema.load_schema_bundle``); each call returns a copy.
+
     Args:
         slide_type: Slide type value (e.g., "title_slide")
 
@@ -281,7 +288,22 @@ def get_json_schema(slide_type: str) -> dict:
         JSON Schema dictionary
     """
     model = get_content_model(slide_type)
-    return model.model_json_schema()
+    return model_schema(model)
+
+
+def get_json_schema_text(slide_type: str, indent: Optional[int] = None) -> str:
+    """
+    Get JSON schema for a slide type as JSON text, e.g. for an LLM prompt.
+
+    Args:
+        slide_type: Slide type value (e.g., "title_slide")
+        indent: JSON indentation (default: None, compact)
+
+    Returns:
+        JSON Schema text (cached; non-ASCII characters kept as is)
+    """
+    model = get_content_model(slide_type)
+    return model_schema_json(model, indent=indent)
 
 
 def get_all_schemas() -> dict[str, dict]:
@@ -291,9 +313,7 @@ def get_all_schemas() -> dict[str, dict]:
     Returns:
         Dictionary mapping slide type to JSON schema
     """
-    return {
-        slide_type: model.model_json_schema() for slide_type, model in SLIDE_CONTENT_MODELS.items()
-    }
+    return {slide_type: model_schema(model) for slide_type, model in SLIDE_CONTENT_MODELS.items()}
 
 
 # ============================================================================
@@ -303,6 +323,8 @@ def get_all_schemas() -> dict[str, dict]:
 if __name__ == "__main__":
     import json
 
+    from slide_renderer.schemas.json_schema import write_schema_bundle
+
     print("=" * 70)
     print("SLIDE CONTENT SCHEMAS - FOR LLM STRUCTURED OUTPUT")
     print("=" * 70)
@@ -344,8 +366,6 @@ if __name__ == "__main__":
     # Example 4: Export all schemas to file
     print("\n\n4. Exporting all schemas...")
     print("-" * 70)
-    all_schemas = get_all_schemas()
-    with open("../sample_data/all_schemas.json", "w") as f:
-        json.dump(all_schemas, f, indent=2)
+    write_schema_bundle("../sample_data/all_schemas.json")
     print("✅ Exported to sample_data/all_schemas.json")
-    print(f"   Total schemas: {len(all_schemas)}")
+    print(f"   Total schemas: {len(SLIDE_CONTENT_MODELS)}")
@@ -0,0 +1,330 @@
+"""
+Memoized JSON schemas for the content models, and a pre-built schema bundle.
+
+``model_json_schema()`` rebuilds the schema on every call (about 1 ms per
+slide type), and prompt builders then serialize it again for every prompt.
+Here each model's schema is generated once, and its serialized text is
+cached per indent, so repeated lookups cost a dict access and a copy.
+
+A schema bundle (``sample_data/all_schemas.json``) holds every slide type's
+schema, keyed by slide type only. A sidecar file next to it
+(``all_schemas.meta.json``) records a fingerprint of the model definitions
+the schemas were generated from and a hash of the schema content. Loading
+the bundle at startup seeds the cache without generating anything; a bundle
+whose models changed, or whose content no longer matches its hash, is stale
+and is ignored.
+
+Usage:
+    from slide_renderer.schemas.json_schema import load_schema_bundle, model_schema_json
+
+    load_schema_bundle("sample_data/all_schemas.json")    # optional
+    prompt = f"Schema: {model_schema_json(MetricsGridContent)}"
+
+Regenerate the bundle after changing a model:
+    python -m slide_renderer.schemas.json_schema sample_data/all_schemas.json
+"""
+
+import copy
+import hashlib
+import json
+import sys
+import threading
+import typing
+import warnings
+from pathlib import Path
+from typing import Any, Mapping, Optional, Union
+
+from pydantic import BaseModel
+
+from slide_renderer import _json
+
+# Suffix of the sidecar file holding a bundle's fingerprints
+META_SUFFIX = ".meta.json"
+
+# Model → generated schema; shared, never handed out without copying
+_SCHEMAS: dict[type[BaseModel], dict[str, Any]] = {}
+
+# (model, indent) → serialized schema
+_SCHEMA_TEXT: dict[tuple[type[BaseModel], Optional[int]], str] = {}
+
+_lock = threading.Lock()
+
+
+def _schema(model: type[BaseModel]) -> dict[str, Any]:
+    """The cached schema of a model, generated on first use (do not mutate)."""
+    schema = _SCHEMAS.get(model)
+    if schema is None:
+        schema = model.model_json_schema()
+        with _lock:
+            schema = _SCHEMAS.setdefault(model, schema)
+    return schema
+
+
+def model_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Get a model's JSON schema, generating it only once per model.
+
+    Args:
+        model: Pydantic model class
+
+    Returns:
+        JSON Schema dictionary (a copy; changing it does not affect the cache)
+
+    Example:
+        >>> model_schema(MetricsGridContent) == MetricsGridContent.model_json_schema()
+        True
+    """
+    return copy.deepcopy(_schema(model))
+
+
+def model_schema_json(model: type[BaseModel], indent: Optional[int] = None) -> str:
+    """
+    Get a model's JSON schema serialized as text, cached per model and indent.
+
+    Non-ASCII characters are kept as is (``ensure_ascii=False``), as LLM
+    prompts expect.
+
+    Args:
+        model: Pydantic model class
+        indent: JSON indentation (default: None, compact)
+
+    Returns:
+        JSON Schema text
+    """
+    key = (model, indent)
+    text = _SCHEMA_TEXT.get(key)
+    if text is None:
+        text = json.dumps(_schema(model), ensure_ascii=False, indent=indent)
+        _SCHEMA_TEXT[key] = text
+    return text
+
+
+def clear_schema_cache() -> None:
+    """Forget every cached schema, e.g. after redefining a model in a notebook."""
+    with _lock:
+        _SCHEMAS.clear()
+        _SCHEMA_TEXT.clear()
+
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+
+def _referenced_models(annotation: Any) -> list[type[BaseModel]]:
+    """Models used in a field annotation, e.g. ``ListItem`` in ``list[ListItem]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+
+    models = []
+    for arg in typing.get_args(annotation):
+        models.extend(_referenced_models(arg))
+    return models
+
+
+def _field_signature(name: str, field: Any) -> str:
+    """
+    Stable description of a field's definition.
+
+    Built from the field's own attributes rather than ``repr(FieldInfo)``,
+    whose format belongs to pydantic and changes between releases.
+    """
+    if field.is_required():
+        default = "required"
+    elif field.default_factory is not None:
+        default = f"factory {getattr(field.default_factory, '__qualname__', field.default_factory)}"
+    else:
+        default = repr(field.default)
+
+    parts = [
+        name,
+        repr(field.annotation),
+        default,
+        repr(field.alias),
+        repr(field.title),
+        repr(field.description),
+        repr(field.examples),
+        repr(field.json_schema_extra),
+        *(repr(constraint) for constraint in field.metadata),
+    ]
+    return " | ".join(parts)
+
+
+def schemas_fingerprint(models: Mapping[str, type[BaseModel]]) -> str:
+    """
+    Fingerprint the definitions of models and every model they reference.
+
+    Covers each model's name, docstring, config and fields (annotations,
+    defaults, constraints, descriptions), which shape the generated schema.
+    The pydantic version is deliberately left out, so a library upgrade alone
+    doesn't invalidate a bundle (``schema_content_hash`` catches schemas that
+    actually changed). Computing it is far cheaper than generating schemas.
+
+    Args:
+        models: Slide type → content model
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    seen: set[type[BaseModel]] = set()
+
+    def visit(model: type[BaseModel]) -> None:
+        if model in seen:
+            return
+        seen.add(model)
+        digest.update(f"{model.__qualname__}\n{model.__doc__}\n{model.model_config}\n".encode())
+        for name, field in model.model_fields.items():
+            digest.update(f"{_field_signature(name, field)}\n".encode())
+            for referenced in _referenced_models(field.annotation):
+                visit(referenced)
+
+    for slide_type, model in models.items():
+        digest.update(f"[{slide_type}]\n".encode())
+        visit(model)
+
+    return digest.hexdigest()
+
+
+def schema_content_hash(schemas: Mapping[str, Any]) -> str:
+    """
+    Hash the content of generated schemas, independent of key order and spacing.
+
+    Args:
+        schemas: Slide type → JSON schema
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(schemas, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# SCHEMA BUNDLE
+# ============================================================================
+
+
+def meta_path(path: Union[str, Path]) -> Path:
+    """Sidecar file of a bundle: ``all_schemas.json`` → ``all_schemas.meta.json``."""
+    path = Path(path)
+    return path.with_name(path.stem + META_SUFFIX)
+
+
+def write_schema_bundle(
+    path: Union[str, Path], models: Optional[Mapping[str, type[BaseModel]]] = None
+) -> None:
+    """
+    Write every slide type's schema to a file, and its fingerprints to a sidecar.
+
+    The bundle itself is a plain slide type → schema mapping; the model
+    fingerprint and content hash go to ``meta_path(path)``.
+
+    Args:
+        path: Bundle file (JSON)
+        models: Slide type → content model (default: SLIDE_CONTENT_MODELS)
+    """
+    from slide_renderer.schemas.content import SLIDE_CONTENT_MODELS
+    from slide_renderer.writer import write_atomic
+
+    models = SLIDE_CONTENT_MODELS if models is None else models
+    bundle = {slide_type: _schema(model) for slide_type, model in models.items()}
+    meta = {"models": schemas_fingerprint(models), "schemas": schema_content_hash(bundle)}
+
+    write_atomic(path, json.dumps(bundle, indent=2, ensure_ascii=False) + "\n", compression="none")
+    write_atomic(meta_path(path), json.dumps(meta, indent=2) + "\n", compression="none")
+
+
+def load_schema_bundle(
+    path: Union[str, Path],
+    models: Optional[Mapping[str, type[BaseModel]]] = None,
+    check: bool = True,
+) -> bool:
+    """
+    Seed the schema cache from a pre-built bundle instead of generating schemas.
+
+    A missing or stale bundle is ignored with a warning: schemas are then
+    generated on demand as usual, so a forgotten regeneration never serves
+    outdated schemas. A bundle is stale when its sidecar is missing, the model
+    fingerprint no longer matches the current definitions, or the content no
+    longer matches its hash (the file was edited by hand).
+
+    Args:
+        path: Bundle file written by ``write_schema_bundle``
+        models: Slide type → content model (default: SLIDE_CONTENT_MODELS)
+        check: Compare the sidecar's fingerprints with the models and the
+            bundle content (default: True)
+
+    Returns:
+        True if the bundle was loaded, False if it was missing or stale
+
+    Example:
+        >>> load_schema_bundle("sample_data/all_schemas.json")
+        True
+        >>> schema = get_json_schema("metrics_grid")   # no generation
+    """
+    from slide_renderer.schemas.content import SLIDE_CONTENT_MODELS
+
+    models = SLIDE_CONTENT_MODELS if models is None else models
+
+    try:
+        bundle = _json.loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        warnings.warn(f"Schema bundle not found: {path}", stacklevel=2)
+        return False
+
+    if check:
+        reason = _stale_reason(path, bundle, models)
+        if reason is not None:
+            warnings.warn(
+                f"Schema bundle {path} is stale ({reason}); regenerate it with: "
+                f"python -m slide_renderer.schemas.json_schema {path}",
+                stacklevel=2,
+            )
+            return False
+
+    missing = sorted(set(models) - set(bundle))
+    if missing:
+        warnings.warn(f"Schema bundle {path} lacks slide types: {', '.join(missing)}", stacklevel=2)
+        return False
+
+    with _lock:
+        for slide_type, model in models.items():
+            _SCHEMAS[model] = bundle[slide_type]
+            for key in [key for key in _SCHEMA_TEXT if key[0] is model]:
+                del _SCHEMA_TEXT[key]
+    return True
+
+
+def _stale_reason(
+    path: Union[str, Path], bundle: Any, models: Mapping[str, type[BaseModel]]
+) -> Optional[str]:
+    """Why a bundle can't be trusted, or None if its sidecar vouches for it."""
+    try:
+        meta = json.loads(meta_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return f"no readable {meta_path(path).name}"
+    if not isinstance(meta, dict):
+        return f"no readable {meta_path(path).name}"
+
+    if meta.get("models") != schemas_fingerprint(models):
+        return "models changed since it was written"
+    if meta.get("schemas") != schema_content_hash(bundle):
+        return "its content was modified since it was written"
+    return None
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Write the schema bundle of all slide types to the given file."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m slide_renderer.schemas.json_schema BUNDLE.json")
+        return 2
+
+    write_schema_bundle(argv[0])
+    print(f"✅ Wrote schema bundle: {argv[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
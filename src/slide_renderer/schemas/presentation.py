@@ -0,0 +1,195 @@
+"""
+Deck-level schema - a whole presentation validated in one call.
+
+Each slide is a ``{"type": ..., "content": {...}}`` object. The slide models
+below wrap the per-type content models from ``content.py`` and are combined
+into a union discriminated by ``type``, so pydantic-core dispatches each slide
+straight to the right validator instead of trying every variant.
+
+The adapter is built once at import time and reused for every deck.
+
+Usage:
+    from slide_renderer.schemas import validate_presentation_json
+
+    with open("slides.json", "rb") as f:
+        slides = validate_presentation_json(f.read())
+
+    for slide in slides:
+        print(slide.type, slide.content.title)
+"""
+
+import dataclasses
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+
+from slide_renderer.schemas.content import SLIDE_CONTENT_MODELS
+
+
+def _build_slide_model(slide_type: str, content_model: type[BaseModel]) -> type[BaseModel]:
+    """Build the ``{"type", "content"}`` wrapper model for one slide type."""
+    name = content_model.__name__
+    if name.endswith("Content"):
+        name = name[: -len("Content")]
+
+    return create_model(
+        f"{name}Slide",
+        type=(Literal[slide_type], Field(..., description="Slide type value")),
+        content=(content_model, Field(..., description="Slide content")),
+    )
+
+
+# ============================================================================
+# MAPPING: Slide type value → Slide model ({"type", "content"} wrapper)
+# ============================================================================
+
+SLIDE_MODELS: dict[str, type[BaseModel]] = {
+    slide_type: _build_slide_model(slide_type, content_model)
+    for slide_type, content_model in SLIDE_CONTENT_MODELS.items()
+}
+
+# A single slide, dispatched on its ``type`` tag
+Slide = Annotated[Union[tuple(SLIDE_MODELS.values())], Field(discriminator="type")]
+
+# A whole deck: ordered list of slides
+Presentation = list[Slide]
+
+PRESENTATION_ADAPTER: TypeAdapter = TypeAdapter(Presentation)
+
+# A deck whose invalid slides are kept as their plain JSON values: the slide
+# union is tried first, anything it rejects falls through to Any
+LENIENT_PRESENTATION_ADAPTER: TypeAdapter = TypeAdapter(
+    list[Annotated[Union[Slide, Any], Field(union_mode="left_to_right")]]
+)
+
+
+# ============================================================================
+# ERROR REPORTING
+# ============================================================================
+
+
+@dataclasses.dataclass
+class SlideError:
+    """
+    One validation failure in a deck.
+
+    Attributes:
+        index: Slide index in the deck (None if the deck itself is invalid)
+        slide_type: Slide 'type' value, if the slide has one
+        field: Dotted path inside the slide (e.g. "content.items.2.title";
+            "" for slide-level errors such as an unknown type)
+        constraint: Pydantic error type (e.g. "string_too_long", "missing")
+        message: Human-readable error message
+        value: Offending input value
+        context: Constraint parameters (e.g. {"max_length": 60})
+    """
+
+    index: Optional[int]
+    slide_type: Optional[str]
+    field: str
+    constraint: str
+    message: str
+    value: Any = None
+    context: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+def errors_from_validation_error(slides: Any, error: ValidationError) -> list[SlideError]:
+    """
+    Convert a deck-level ValidationError into one SlideError per failure.
+
+    Args:
+        slides: The deck that was validated
+        error: ValidationError raised by ``validate_presentation``
+
+    Returns:
+        List of SlideError, in slide order
+    """
+    slide_errors = []
+
+    for details in error.errors(include_url=False):
+        loc = details["loc"]
+        index = loc[0] if loc and isinstance(loc[0], int) else None
+
+        slide_type = None
+        if index is not None and isinstance(slides[index], dict):
+            slide_type = slides[index].get("type")
+
+        slide_errors.append(
+            SlideError(
+                index=index,
+                slide_type=slide_type,
+                # loc is (index, type tag, "content", ...) - drop index and tag
+                field=".".join(str(part) for part in loc[2:]),
+                constraint=details["type"],
+                message=details["msg"],
+                value=details.get("input"),
+                context=dict(details.get("ctx", {})),
+            )
+        )
+
+    return slide_errors
+
+
+def collect_slide_errors(slides: Any) -> list[SlideError]:
+    """
+    Validate a whole deck and report every failure instead of raising.
+
+    Args:
+        slides: List of slide dictionaries with 'type' and 'content' keys
+
+    Returns:
+        List of SlideError (empty if the deck is valid)
+    """
+    try:
+        validate_presentation(slides)
+    except ValidationError as e:
+        return errors_from_validation_error(slides, e)
+
+    return []
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+
+def validate_presentation(slides: Any) -> list[BaseModel]:
+    """
+    Validate a whole deck of slide dictionaries in a single call.
+
+    Args:
+        slides: List of slide dictionaries with 'type' and 'content' keys
+
+    Returns:
+        List of validated slide models (``slide.type``, ``slide.content``)
+
+    Raises:
+        ValidationError: If any slide is invalid (locations start with the slide index)
+    """
+    return PRESENTATION_ADAPTER.validate_python(slides)
+
+
+def validate_presentation_json(
+    data: Union[str, bytes, bytearray], strict: bool = True
+) -> list[Any]:
+    """
+    Validate a whole deck straight from JSON text, without ``json.loads``.
+
+    With ``strict=False`` the JSON is still parsed only once, but invalid
+    slides don't fail the call: they are returned as their plain JSON values
+    (dicts, or whatever else the array held), for the caller to report.
+
+    Args:
+        data: JSON array of slides as str or bytes
+        strict: Raise if any slide is invalid (default: True)
+
+    Returns:
+        List of validated slide models (``slide.type``, ``slide.content``);
+        with strict=False, invalid slides are left as plain values
+
+    Raises:
+        ValidationError: If the JSON is malformed or isn't an array, or (when
+            strict) any slide is invalid
+    """
+    adapter = PRESENTATION_ADAPTER if strict else LENIENT_PRESENTATION_ADAPTER
+    return adapter.validate_json(data)
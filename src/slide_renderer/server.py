@@ -0,0 +1,694 @@
+"""
+Local HTTP render service with warm renderers and request batching.
+
+Spawning a Python process per render pays interpreter start-up, imports and
+template compilation every time. This service pays them once: a pool of
+worker processes each keeps a warm production SlideRenderer, and requests
+are answered over persistent (keep-alive) HTTP/1.1 connections. Only the
+standard library is used.
+
+Endpoints (request bodies are JSON):
+    POST /render         deck (array of slides) → text/markdown
+    POST /render/slide   one slide ({"type", "content"}) → text/markdown
+    POST /validate       deck → {"valid": bool, "errors": [...]}
+    GET  /metrics        latency histograms per endpoint and batching stats
+    GET  /health         {"status": "ok"}
+
+Query parameters: ``validate=false`` skips schema validation,
+``frontmatter=false`` omits the Marp frontmatter (/render only). Invalid
+JSON is answered with 400, invalid content with 422 and a list of errors.
+
+Requests that arrive while every worker is busy are grouped into one batch
+per worker task, so a burst of small requests costs one IPC round trip per
+batch instead of one per request.
+
+Usage:
+    python -m slide_renderer.server --port 8000 -j 4
+
+    curl --data-binary @slides.json http://127.0.0.1:8000/render
+
+Or embedded, e.g. in integration tests:
+    from slide_renderer.server import make_server
+
+    server = make_server(port=0)            # any free port
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ...
+    server.shutdown()
+    server.server_close()
+"""
+
+import argparse
+import bisect
+import dataclasses
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from slide_renderer import _json, batch
+from slide_renderer.renderer import SlideRenderer
+from slide_renderer.schemas.presentation import collect_slide_errors
+
+# Endpoints handled by the render workers
+RENDER_ENDPOINTS = ("/render", "/render/slide", "/validate")
+
+# Largest accepted request body
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Histogram bucket upper bounds, in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Worker reply: (HTTP status, content type, body)
+Reply = tuple[int, str, bytes]
+
+# Worker job: (endpoint, request body, validate, include_frontmatter)
+Job = tuple[str, bytes, bool, bool]
+
+_JSON_TYPE = "application/json"
+_MARKDOWN_TYPE = "text/markdown; charset=utf-8"
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with fixed buckets.
+
+    Attributes:
+        bounds: Bucket upper bounds in milliseconds (a final +Inf is implied)
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds: Increasing bucket upper bounds in milliseconds
+        """
+        self.bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float, error: bool = False) -> None:
+        """
+        Record one request.
+
+        Args:
+            ms: Latency in milliseconds
+            error: Whether the request failed (status >= 400)
+        """
+        index = bisect.bisect_left(self.bounds, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += ms
+            self._errors += error
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a latency quantile as the upper bound of its bucket.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.99)
+
+        Returns:
+            Milliseconds (inf if in the overflow bucket), or None if empty
+        """
+        with self._lock:
+            counts = list(self._counts)
+
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for bound, count in zip((*self.bounds, float("inf")), counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Summarize the histogram for the /metrics endpoint.
+
+        Returns:
+            Count, errors, mean, p50/p90/p99 and cumulative buckets
+            (``[[upper bound, requests <= bound], ..., ["+Inf", count]]``)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_ms = self._sum
+            errors = self._errors
+
+        count = sum(counts)
+        buckets = []
+        cumulative = 0
+        for bound, n in zip((*self.bounds, "+Inf"), counts):
+            cumulative += n
+            buckets.append([bound, cumulative])
+
+        def finite(value: Optional[float]) -> Union[float, str, None]:
+            return "+Inf" if value == float("inf") else value
+
+        return {
+            "count": count,
+            "errors": errors,
+            "mean_ms": round(total_ms / count, 3) if count else None,
+            "p50_ms": finite(self.quantile(0.5)),
+            "p90_ms": finite(self.quantile(0.9)),
+            "p99_ms": finite(self.quantile(0.99)),
+            "buckets": buckets,
+        }
+
+
+@dataclasses.dataclass
+class BatchStats:
+    """
+    Batching counters.
+
+    Attributes:
+        batches: Worker tasks submitted
+        requests: Requests carried by those tasks
+        max_size: Largest batch so far
+    """
+
+    batches: int = 0
+    requests: int = 0
+    max_size: int = 0
+
+    @property
+    def mean_size(self) -> float:
+        """Average requests per batch."""
+        return self.requests / self.batches if self.batches else 0.0
+
+
+# ============================================================================
+# REQUEST HANDLING (runs in the workers)
+# ============================================================================
+
+
+def _json_reply(status: int, payload: Any) -> Reply:
+    """JSON response; values JSON can't encode (rare in error inputs) become str."""
+    body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+    return status, _JSON_TYPE, body
+
+
+def _invalid_reply(slides: Any, error: Exception, validate: bool) -> Reply:
+    """422 response listing every validation failure of a deck."""
+    errors = collect_slide_errors(slides) if validate else []
+    return _json_reply(
+        422,
+        {
+            "error": f"{type(error).__name__}: {error}",
+            "errors": [dataclasses.asdict(e) for e in errors],
+        },
+    )
+
+
+def _handle_job(renderer: SlideRenderer, job: Job) -> Reply:
+    """Answer one render request with a warm renderer."""
+    endpoint, body, validate, include_frontmatter = job
+
+    if endpoint == "/render":
+        try:
+            markdown = "".join(renderer.render_json_iter(body, validate, include_frontmatter))
+        except ValueError as e:
+            try:
+                slides = _json.loads(body)
+            except ValueError:
+                return _json_reply(400, {"error": f"Invalid JSON: {e}"})
+            if not isinstance(slides, list):
+                return _json_reply(400, {"error": "Request body must be an array of slides"})
+            return _invalid_reply(slides, e, validate)
+        except Exception as e:
+            return _json_reply(422, {"error": f"{type(e).__name__}: {e}", "errors": []})
+        return 200, _MARKDOWN_TYPE, markdown.encode("utf-8")
+
+    try:
+        data = _json.loads(body)
+    except ValueError as e:
+        return _json_reply(400, {"error": f"Invalid JSON: {e}"})
+
+    if endpoint == "/validate":
+        if not isinstance(data, list):
+            return _json_reply(400, {"error": "Request body must be an array of slides"})
+        errors = collect_slide_errors(data)
+        return _json_reply(
+            200, {"valid": not errors, "errors": [dataclasses.asdict(e) for e in errors]}
+        )
+
+    # /render/slide
+    if not isinstance(data, dict) or "type" not in data or "content" not in data:
+        return _json_reply(400, {"error": "Request body must be a slide with 'type' and 'content'"})
+    try:
+        markdown = renderer.render(data["type"], data["content"], validate=validate)
+    except Exception as e:
+        return _invalid_reply([data], e, validate)
+    return 200, _MARKDOWN_TYPE, markdown.encode("utf-8")
+
+
+def _handle_batch(renderer: SlideRenderer, jobs: list[Job]) -> list[Reply]:
+    """Answer a batch of requests, one reply per job."""
+    return [_handle_job(renderer, job) for job in jobs]
+
+
+def _handle_batch_in_worker(jobs: list[Job]) -> list[Reply]:
+    """Answer a batch with this worker process's warm renderer."""
+    return _handle_batch(batch._worker_renderer, jobs)
+
+
+# ============================================================================
+# RENDER SERVICE (pool + batching, no HTTP)
+# ============================================================================
+
+
+class RenderService:
+    """
+    Warm render workers fed through a batching dispatcher.
+
+    Requests are queued; a dispatcher thread hands them to the workers.
+    While all workers are busy, queued requests accumulate and are sent
+    together as one batch (up to ``max_batch`` requests / ``max_batch_bytes``).
+
+    Attributes:
+        workers: Worker processes (1 = render in the dispatcher thread)
+        latency: Endpoint → LatencyHistogram
+        batch_stats: BatchStats
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        template_dir: Union[str, Path, None] = None,
+        max_batch: int = 32,
+        max_batch_bytes: int = 1024 * 1024,
+        batch_timeout: float = 120.0,
+    ):
+        """
+        Start the workers and the dispatcher.
+
+        Args:
+            workers: Worker processes (default: CPU count). With ``workers=1``
+                requests are rendered in-process by one warm renderer.
+            template_dir: Templates directory (default: the bundled templates)
+            max_batch: Most requests sent to a worker in one task (default: 32)
+            max_batch_bytes: Most request bytes per batch (default: 1 MiB);
+                a larger request is sent on its own
+            batch_timeout: Seconds a worker may take to answer a batch
+                (default: 120). Past it the batch's requests fail with
+                TimeoutError and its worker slot is freed, so a worker that
+                died mid-batch doesn't take a slot with it.
+        """
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.template_dir = str(template_dir) if template_dir is not None else None
+        self.max_batch = max_batch
+        self.max_batch_bytes = max_batch_bytes
+        self.batch_timeout = batch_timeout
+
+        self.latency = {endpoint: LatencyHistogram() for endpoint in RENDER_ENDPOINTS}
+        self.batch_stats = BatchStats()
+        self.started = time.time()
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Item taken from the queue that didn't fit in the previous batch
+        self._carry: list[Optional[tuple[Job, Future]]] = []
+        self._slots = threading.Semaphore(self.workers)
+
+        if self.workers == 1:
+            self._pool = None
+            self._renderer = SlideRenderer(self.template_dir, production=True)
+        else:
+            self._pool = multiprocessing.Pool(
+                self.workers,
+                initializer=batch._init_worker,
+                initargs=({"template_dir": self.template_dir},),
+            )
+            self._renderer = None
+
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="slide-renderer-dispatch", daemon=True
+        )
+        self._dispatcher.start()
+
+    def submit(self, job: Job) -> Future:
+        """
+        Queue a request for the workers.
+
+        Args:
+            job: (endpoint, request body, validate, include_frontmatter)
+
+        Returns:
+            Future resolving to (status, content type, body)
+        """
+        future: Future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def close(self) -> None:
+        """Stop the dispatcher and the workers."""
+        self._queue.put(None)
+        self._dispatcher.join()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+
+    def __enter__(self) -> "RenderService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the service metrics.
+
+        Returns:
+            Uptime, worker count, per-endpoint latency histograms and
+            batching statistics
+        """
+        stats = self.batch_stats
+        return {
+            "uptime_s": round(time.time() - self.started, 3),
+            "workers": self.workers,
+            "endpoints": {endpoint: h.snapshot() for endpoint, h in self.latency.items()},
+            "batching": {
+                "batches": stats.batches,
+                "requests": stats.requests,
+                "mean_size": round(stats.mean_size, 3),
+                "max_size": stats.max_size,
+            },
+        }
+
+    def _dispatch(self) -> None:
+        """Group queued requests into batches and hand them to the workers."""
+        while True:
+            item = self._carry.pop() if self._carry else self._queue.get()
+            if item is None:
+                return
+
+            pending = [item]
+            size = len(item[0][1])
+
+            # Wait for a free worker; requests queued meanwhile join the batch
+            self._slots.acquire()
+            self._collect(pending, size)
+
+            self._run(pending)
+
+    def _collect(self, pending: list[tuple[Job, Future]], size: int) -> int:
+        """Move queued requests into the batch while it has room."""
+        while len(pending) < self.max_batch and not self._carry:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None or size + len(item[0][1]) > self.max_batch_bytes:
+                # Shutdown marker or too big: handle it after this batch
+                self._carry.append(item)
+                break
+
+            pending.append(item)
+            size += len(item[0][1])
+        return size
+
+    def _run(self, pending: list[tuple[Job, Future]]) -> None:
+        """Send a batch to a worker (or render it in-process)."""
+        stats = self.batch_stats
+        stats.batches += 1
+        stats.requests += len(pending)
+        stats.max_size = max(stats.max_size, len(pending))
+
+        jobs = [job for job, _ in pending]
+        futures = [future for _, future in pending]
+        # Acquired by whichever of the worker's answer and the timeout comes first
+        settled = threading.Lock()
+        timer = None
+
+        def settle() -> bool:
+            """Free the batch's worker slot; False if already done."""
+            if not settled.acquire(blocking=False):
+                return False
+            if timer is not None:
+                timer.cancel()
+            self._slots.release()
+            return True
+
+        def deliver(replies: list[Reply]) -> None:
+            if settle():
+                for future, reply in zip(futures, replies):
+                    future.set_result(reply)
+
+        def fail(error: BaseException) -> None:
+            if settle():
+                for future in futures:
+                    future.set_exception(error)
+
+        if self._pool is None:
+            try:
+                replies = _handle_batch(self._renderer, jobs)
+            except Exception as e:
+                fail(e)
+            else:
+                deliver(replies)
+            return
+
+        error = TimeoutError(f"No reply from the worker within {self.batch_timeout:g} s")
+        timer = threading.Timer(self.batch_timeout, fail, (error,))
+        timer.daemon = True
+        try:
+            self._pool.apply_async(
+                _handle_batch_in_worker, (jobs,), callback=deliver, error_callback=fail
+            )
+        except Exception as e:
+            fail(e)
+            return
+        # Started after submitting: an answer that came first already cancelled it
+        timer.start()
+
+
+# ============================================================================
+# HTTP SERVER
+# ============================================================================
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler: keeps connections alive and forwards to the service."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "slide-renderer"
+
+    # Seconds an idle keep-alive connection is kept open
+    timeout = 30
+
+    server: "RenderServer"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            self._reply(*_json_reply(200, self.server.service.metrics()))
+        elif path == "/health":
+            self._reply(*_json_reply(200, {"status": "ok"}))
+        else:
+            self._reply(*_json_reply(404, {"error": f"Not found: {path}"}))
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self.close_connection = True
+            self._reply(*_json_reply(411, {"error": "Content-Length required"}))
+            return
+
+        if length < 0:
+            # rfile.read(-1) would block until the client closes the connection
+            self.close_connection = True
+            self._reply(*_json_reply(400, {"error": "Invalid Content-Length"}))
+            return
+
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+            self._reply(*_json_reply(413, {"error": f"Body over {MAX_BODY_SIZE} bytes"}))
+            return
+
+        # Always consume the body, so the next request on this connection parses
+        body = self.rfile.read(length)
+
+        if url.path not in RENDER_ENDPOINTS:
+            self._reply(*_json_reply(404, {"error": f"Not found: {url.path}"}))
+            return
+
+        query = parse_qs(url.query)
+        job = (
+            url.path,
+            body,
+            _flag(query, "validate", True),
+            _flag(query, "frontmatter", True),
+        )
+
+        try:
+            reply = self.server.service.submit(job).result(self.server.request_timeout)
+        except FutureTimeoutError:
+            reply = _json_reply(504, {"error": "Render timed out"})
+        except Exception as e:
+            reply = _json_reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+        self._reply(*reply)
+        status = reply[0]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.server.service.latency[url.path].observe(elapsed_ms, error=status >= 400)
+
+    def _reply(self, status: int, content_type: str, body: bytes) -> None:
+        """Send a complete response with a Content-Length (needed for keep-alive)."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _flag(query: dict[str, list[str]], name: str, default: bool) -> bool:
+    """Read a boolean query parameter (false/0/no/off disable it)."""
+    values = query.get(name)
+    if not values:
+        return default
+    return values[-1].lower() not in ("false", "0", "no", "off")
+
+
+class RenderServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server bound to a RenderService.
+
+    Attributes:
+        service: RenderService answering render requests
+        request_timeout: Seconds a request may wait for its render
+        verbose: Log every request to stderr
+    """
+
+    daemon_threads = True
+    # Integration tests open many connections at once
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        service: RenderService,
+        request_timeout: float = 60.0,
+        verbose: bool = False,
+    ):
+        self.service = service
+        self.request_timeout = request_timeout
+        self.verbose = verbose
+        super().__init__(address, RenderRequestHandler)
+
+    def server_close(self) -> None:
+        """Close the socket and stop the render service."""
+        super().server_close()
+        self.service.close()
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: Optional[int] = None,
+    template_dir: Union[str, Path, None] = None,
+    max_batch: int = 32,
+    request_timeout: float = 60.0,
+    verbose: bool = False,
+) -> RenderServer:
+    """
+    Create a render server with its warm workers (not serving yet).
+
+    Args:
+        host: Interface to bind (default: 127.0.0.1, local only)
+        port: TCP port (0 = any free port, see ``server.server_address``)
+        workers: Worker processes (default: CPU count; 1 = in-process)
+        template_dir: Templates directory (default: the bundled templates)
+        max_batch: Most requests per worker task (default: 32)
+        request_timeout: Seconds a request may wait for its render, and a
+            worker for its batch (default: 60)
+        verbose: Log every request to stderr (default: False)
+
+    Returns:
+        RenderServer; call ``serve_forever()``, then ``shutdown()`` and
+        ``server_close()``
+
+    Example:
+        >>> server = make_server(port=0, workers=1)
+        >>> host, port = server.server_address
+    """
+    service = RenderService(
+        workers, template_dir, max_batch=max_batch, batch_timeout=request_timeout
+    )
+    try:
+        return RenderServer((host, port), service, request_timeout, verbose)
+    except BaseException:
+        service.close()
+        raise
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Serve renders over HTTP until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m slide_renderer.server",
+        description="Serve slide rendering over HTTP with warm renderers.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="TCP port")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--max-batch", type=int, default=32, help="Requests per worker task")
+    parser.add_argument("--template-dir", default=None, help="Templates directory")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = make_server(
+        args.host,
+        args.port,
+        workers=args.workers,
+        template_dir=args.template_dir,
+        max_batch=args.max_batch,
+        verbose=args.verbose,
+    )
+    host, port = server.server_address[:2]
+    print(f"✅ Serving on http://{host}:{port} ({server.service.workers} workers)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
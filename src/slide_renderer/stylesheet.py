@@ -0,0 +1,394 @@
+"""
+Per-deck stylesheets: theme CSS tree-shaken to the slide types a deck uses.
+
+``custom-style.css`` styles all 14 layouts, while most decks use a few. The
+classes a slide type needs come from ``SlideTypeEnum.get_css_classes()``
+plus the class attributes and ``_class`` directives of its template (the
+metadata lists the defining classes only, and tenant templates may add
+their own). A rule is kept when one of its selectors only uses classes from
+that set; rules without classes (``section``, ``section h1``), ``@font-face``
+and other at-rules are base rules and always kept. The result is minified.
+
+Stylesheets are cached by (theme CSS, class set), so every deck with the
+same slide types (and templates) shares one stylesheet.
+
+Usage:
+    from slide_renderer.stylesheet import deck_stylesheet
+
+    css = deck_stylesheet(["title_slide", "quote"], load_theme())
+    html = markdown_to_html(markdown, theme_css=css)
+"""
+
+import functools
+import re
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Union
+
+from slide_renderer.loader import TEMPLATE_SUFFIX, bundled_templates
+from slide_renderer.types import SlideTypeEnum
+
+if TYPE_CHECKING:
+    from slide_renderer.renderer import SlideRenderer
+
+# Stylesheets kept by deck_stylesheet (one per theme and class set)
+CACHE_SIZE = 256
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_STRING = re.compile(r"\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'")
+_SELECTOR_CLASS = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_PSEUDO_FUNCTION = re.compile(r":([-\w]+)\(")
+# Functional pseudo-classes taking a selector list, one alternative of which
+# has to match; the arguments of any other (:not(), :nth-child(), ...) are
+# not required
+_ALTERNATIVE_PSEUDOS = frozenset({"is", "where", "has", "matches", "-webkit-any", "-moz-any"})
+_CLASS_ATTRIBUTE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_CLASS_DIRECTIVE = re.compile(r"<!--\s*_?class\s*:\s*([^>]*?)\s*-->")
+_THEME_COMMENT = re.compile(r"/\*\s*@theme\s+[^*]*?\*/")
+
+# At-rules whose block holds nested rules, which are shaken too
+_GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+
+class _Rule(NamedTuple):
+    """A parsed CSS statement: ``prelude { body }``, or ``prelude;`` (body None)."""
+
+    prelude: str
+    body: Union[str, list["_Rule"], None]
+
+
+# ============================================================================
+# CLASSES
+# ============================================================================
+
+
+def template_classes(source: str) -> Optional[frozenset[str]]:
+    """
+    CSS classes a template uses in class attributes and ``_class`` directives.
+
+    Args:
+        source: Template source
+
+    Returns:
+        Class names, or None if a class is computed (e.g. ``class="{{ x }}"``),
+        in which case no class can be ruled out
+    """
+    classes: set[str] = set()
+    values = [a or b for a, b in _CLASS_ATTRIBUTE.findall(source)]
+    values.extend(_CLASS_DIRECTIVE.findall(source))
+
+    for value in values:
+        if "{" in value:
+            return None
+        classes.update(value.split())
+    return frozenset(classes)
+
+
+def slide_type_classes(
+    slide_type: str, renderer: Optional["SlideRenderer"] = None
+) -> Optional[frozenset[str]]:
+    """
+    CSS classes a slide type needs: its metadata plus its template's classes.
+
+    Args:
+        slide_type: Slide type value (e.g., "quote")
+        renderer: Renderer whose template to scan (default: the bundled one)
+
+    Returns:
+        Class names, or None if they can't be determined (unknown slide type,
+        missing template or computed classes)
+    """
+    try:
+        metadata = SlideTypeEnum(slide_type).get_css_classes()
+    except ValueError:
+        return None
+
+    name = slide_type + TEMPLATE_SUFFIX
+    if renderer is None:
+        source = bundled_templates().get(name)
+    else:
+        try:
+            source, _, _ = renderer.env.loader.get_source(renderer.env, name)
+        except Exception:
+            source = None
+    if source is None:
+        return None
+
+    classes = _cached_template_classes(source)
+    return None if classes is None else classes | frozenset(metadata)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_template_classes(source: str) -> Optional[frozenset[str]]:
+    """``template_classes``, cached per template source."""
+    return template_classes(source)
+
+
+# ============================================================================
+# PARSING AND MINIFYING
+# ============================================================================
+
+
+def _parse(css: str) -> list[_Rule]:
+    """Split CSS (comments removed) into statements, nesting grouping at-rules."""
+    rules = []
+    pos = 0
+    length = len(css)
+
+    while pos < length:
+        # Find the end of the prelude: "{" opens a block, ";" ends a statement
+        i = pos
+        while i < length and css[i] not in "{;":
+            match = _STRING.match(css, i) if css[i] in "\"'" else None
+            i = match.end() if match else i + 1
+        prelude = css[pos:i].strip()
+
+        if i >= length:
+            if prelude:
+                rules.append(_Rule(prelude, None))
+            break
+
+        if css[i] == ";":
+            if prelude:
+                rules.append(_Rule(prelude, None))
+            pos = i + 1
+            continue
+
+        # Matching "}" of the block, skipping strings and nested blocks
+        depth = 0
+        j = i
+        while j < length:
+            char = css[j]
+            if char in "\"'":
+                match = _STRING.match(css, j)
+                j = match.end() if match else j + 1
+                continue
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            j += 1
+
+        body = css[i + 1 : j]
+        if prelude.lower().startswith(_GROUPING_AT_RULES):
+            rules.append(_Rule(prelude, _parse(body)))
+        else:
+            rules.append(_Rule(prelude, body))
+        pos = j + 1
+
+    return rules
+
+
+def _outside_strings(text: str, pattern: str, repl: str) -> str:
+    """Apply a regex substitution to the parts of text outside of strings."""
+    parts = []
+    pos = 0
+    for match in _STRING.finditer(text):
+        parts.append(re.sub(pattern, repl, text[pos : match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(re.sub(pattern, repl, text[pos:]))
+    return "".join(parts)
+
+
+def _squeeze(text: str) -> str:
+    """Collapse whitespace outside of strings."""
+    return _outside_strings(text, r"\s+", " ").strip()
+
+
+def _minify_selector(selector: str) -> str:
+    """Minify a selector (or at-rule prelude) without changing its meaning."""
+    return _outside_strings(_squeeze(selector), r"\s*([>+~,])\s*", r"\1")
+
+
+def _minify_declarations(body: str) -> str:
+    """Minify a declaration block body."""
+    declarations = []
+    for declaration in _split_outside_strings(body, ";"):
+        name, sep, value = declaration.partition(":")
+        if sep and name.strip():
+            value = _outside_strings(_squeeze(value), r"\s*([,!])\s*", r"\1")
+            declarations.append(f"{name.strip()}:{value}")
+    return ";".join(declarations)
+
+
+def _split_outside_strings(text: str, separator: str) -> list[str]:
+    """Split on a separator character, ignoring it inside strings and parentheses."""
+    parts = []
+    depth = 0
+    start = 0
+    pos = 0
+    while pos < len(text):
+        char = text[pos]
+        if char in "\"'":
+            match = _STRING.match(text, pos)
+            pos = match.end() if match else pos + 1
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:pos])
+            start = pos + 1
+        pos += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_paren(text: str, pos: int) -> int:
+    """Index of the ")" closing a parenthesis opened just before pos (len if none)."""
+    depth = 1
+    while pos < len(text):
+        if text[pos] == "(":
+            depth += 1
+        elif text[pos] == ")":
+            depth -= 1
+            if depth == 0:
+                return pos
+        pos += 1
+    return pos
+
+
+def _selector_matches(selector: str, classes: frozenset[str]) -> bool:
+    """
+    Whether every class a selector requires is in the set.
+
+    Classes in attribute selectors and in :not() aren't required. Inside
+    :is(), :where() and :has() the selector list is either-or: one of its
+    alternatives has to match.
+    """
+    selector = _STRING.sub("", selector)
+    plain = []
+    pos = 0
+    while pos < len(selector):
+        if selector[pos] == "[":
+            end = selector.find("]", pos)
+            pos = len(selector) if end < 0 else end + 1
+            continue
+
+        match = _PSEUDO_FUNCTION.match(selector, pos)
+        if match:
+            end = _closing_paren(selector, match.end())
+            if match.group(1).lower() in _ALTERNATIVE_PSEUDOS:
+                alternatives = _split_outside_strings(selector[match.end() : end], ",")
+                if not any(_selector_matches(alt, classes) for alt in alternatives):
+                    return False
+            pos = end + 1
+            continue
+
+        plain.append(selector[pos])
+        pos += 1
+
+    return all(name in classes for name in _SELECTOR_CLASS.findall("".join(plain)))
+
+
+def _emit(rules: list[_Rule], classes: Optional[frozenset[str]]) -> str:
+    """Minified CSS of the rules whose selectors match the classes (None = all)."""
+    out = []
+    for rule in rules:
+        if rule.body is None:
+            out.append(_minify_selector(rule.prelude) + ";")
+        elif isinstance(rule.body, list):
+            inner = _emit(rule.body, classes)
+            if inner:
+                out.append(f"{_minify_selector(rule.prelude)}{{{inner}}}")
+        elif rule.prelude.startswith("@"):
+            # @font-face, @page, @keyframes, ...: base rules
+            if "{" in rule.body:
+                out.append(f"{_minify_selector(rule.prelude)}{{{_squeeze(rule.body)}}}")
+            else:
+                out.append(f"{_minify_selector(rule.prelude)}{{{_minify_declarations(rule.body)}}}")
+        else:
+            selectors = _split_outside_strings(rule.prelude, ",")
+            if classes is not None:
+                selectors = [s for s in selectors if _selector_matches(s, classes)]
+            if selectors:
+                prelude = ",".join(_minify_selector(s) for s in selectors)
+                out.append(f"{prelude}{{{_minify_declarations(rule.body)}}}")
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=16)
+def _parsed(css: str) -> tuple[str, list[_Rule]]:
+    """Marp theme comment and parsed rules of a stylesheet, cached per stylesheet."""
+    theme_comment = _THEME_COMMENT.search(css)
+    rules = _parse(_COMMENT.sub("", css))
+    return (theme_comment.group(0) + "\n" if theme_comment else ""), rules
+
+
+def shake_css(css: str, classes: Optional[Iterable[str]]) -> str:
+    """
+    Keep the CSS rules a set of classes needs, and minify the result.
+
+    The Marp ``/* @theme name */`` comment is kept, so the output still
+    works as a Marp theme.
+
+    Args:
+        css: Stylesheet
+        classes: Classes present in the document (None = keep every rule,
+            only minify)
+
+    Returns:
+        Minified stylesheet
+    """
+    classes = frozenset(classes) if classes is not None else None
+    return _shake(css, classes)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _shake(css: str, classes: Optional[frozenset[str]]) -> str:
+    """``shake_css`` with a hashable class set, cached."""
+    theme_comment, rules = _parsed(css)
+    return theme_comment + _emit(rules, classes)
+
+
+# ============================================================================
+# DECK STYLESHEETS
+# ============================================================================
+
+
+def deck_stylesheet(
+    slide_types: Iterable[str],
+    css: str,
+    renderer: Optional["SlideRenderer"] = None,
+) -> str:
+    """
+    Build the minified stylesheet for a deck using the given slide types.
+
+    Args:
+        slide_types: Slide types in the deck (repeats are fine)
+        css: Theme stylesheet (e.g. ``htmlexport.load_theme()``)
+        renderer: Renderer whose templates the deck is rendered with, for
+            themes that override templates (default: the bundled templates)
+
+    Returns:
+        Minified stylesheet with only the rules the deck needs; if any slide
+        type's classes can't be determined, every rule is kept
+
+    Example:
+        >>> css = deck_stylesheet({"title_slide", "quote"}, load_theme())
+        >>> ".quote" in css, ".grid-3col" in css
+        (True, False)
+    """
+    classes: Optional[set[str]] = set()
+    for slide_type in set(slide_types):
+        needed = slide_type_classes(slide_type, renderer)
+        if needed is None:
+            classes = None
+            break
+        classes.update(needed)
+
+    return shake_css(css, classes)
+
+
+def cache_info() -> functools._CacheInfo:
+    """Hit/miss statistics of the stylesheet cache."""
+    return _shake.cache_info()
+
+
+def clear_cache() -> None:
+    """Forget every cached stylesheet, parsed theme and template scan."""
+    _shake.cache_clear()
+    _parsed.cache_clear()
+    _cached_template_classes.cache_clear()
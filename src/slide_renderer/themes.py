@@ -0,0 +1,461 @@
+"""
+Theme registry: pooled, per-theme renderers for multi-tenant rendering.
+
+A theme is a variant of ``custom-style.css`` plus an optional directory of
+templates that override some of the bundled ones (the rest still come from
+the package). Building a renderer compiles every template, so the registry
+keeps one production-mode SlideRenderer (and its Jinja2 Environment) per
+theme in an LRU pool, bounded by a theme count and an estimated memory cap:
+    - hits reuse the compiled Environment and the loaded CSS
+    - misses build them; least recently used themes are evicted to fit
+    - a theme whose CSS or override templates changed on disk is invalidated
+      and rebuilt on its next use (checked at most every check_interval)
+
+Usage:
+    from slide_renderer.themes import ThemeRegistry
+
+    registry = ThemeRegistry(max_themes=32, max_bytes=64 * 1024 * 1024)
+    registry.register("acme", template_dir="themes/acme", css="themes/acme.css")
+
+    markdown = registry.renderer("acme").render_presentation(slides)
+    html = registry.render_html("acme", slides)
+    print(registry.stats)
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Optional, Union
+
+from slide_renderer.htmlexport import load_theme
+from slide_renderer.loader import TEMPLATE_SUFFIX, layered_loader
+from slide_renderer.renderer import SlideRenderer
+
+# File → (mtime_ns, size), None when missing
+_Signature = tuple[tuple[str, Optional[tuple[int, int]]], ...]
+
+
+@dataclass
+class ThemePoolStats:
+    """
+    Counters for a ThemeRegistry's pool.
+
+    Attributes:
+        hits: Lookups served by a pooled renderer
+        misses: Lookups that had to build a renderer
+        evictions: Themes dropped to respect max_themes / max_bytes
+        invalidations: Pooled themes dropped because their files changed
+            (or by ``invalidate``)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class Theme:
+    """
+    Definition of a registered theme.
+
+    Attributes:
+        name: Theme name
+        template_dir: Directory of templates overriding the bundled ones (None = none)
+        css: Theme CSS file (None = the bundled custom-style.css)
+    """
+
+    name: str
+    template_dir: Optional[Path]
+    css: Optional[Path]
+
+
+@dataclass
+class PooledTheme:
+    """
+    A theme's compiled renderer and CSS, as held in the pool.
+
+    Attributes:
+        theme: Theme definition
+        renderer: Production-mode renderer with every template compiled
+        css: Theme CSS ready to inline (see ``htmlexport.load_theme``)
+        size: Estimated memory footprint in bytes
+        signature: Stats of the theme's files when it was built
+        checked: When the files were last checked (time.monotonic)
+    """
+
+    theme: Theme
+    renderer: SlideRenderer
+    css: str
+    size: int
+    signature: _Signature
+    checked: float
+
+
+class ThemeRegistry:
+    """
+    Registered themes and an LRU pool of their compiled renderers.
+
+    Thread-safe: renderers can be shared by request threads (each theme is
+    built once even when several threads miss it at the same time).
+
+    Attributes:
+        max_themes: Maximum number of themes kept compiled
+        max_bytes: Memory cap of the pool (estimated, see ``estimate_size``)
+        check_interval: Seconds between file change checks of a pooled theme
+            (0 = on every lookup, None = never; use ``invalidate``)
+        stats: Hit/miss/eviction/invalidation counters
+    """
+
+    def __init__(
+        self,
+        max_themes: int = 16,
+        max_bytes: int = 64 * 1024 * 1024,
+        check_interval: Optional[float] = 1.0,
+        default_css: Union[str, Path, None] = None,
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_themes: Maximum number of themes kept compiled (default: 16)
+            max_bytes: Memory cap of the pool in bytes (default: 64 MiB).
+                The most recently used theme is always kept, even if larger.
+            check_interval: Seconds between file change checks of a pooled
+                theme (default: 1.0; 0 = every lookup, None = never)
+            default_css: CSS file of themes registered without one
+                (default: None, the bundled custom-style.css)
+        """
+        if max_themes < 1:
+            raise ValueError(f"max_themes must be at least 1, got {max_themes}")
+
+        self.max_themes = max_themes
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.default_css = Path(default_css) if default_css is not None else None
+        self.stats = ThemePoolStats()
+
+        self._themes: dict[str, Theme] = {}
+        self._pool: OrderedDict[str, PooledTheme] = OrderedDict()
+        self._lock = threading.Lock()
+        # Theme name → lock held while building it
+        self._build_locks: dict[str, threading.Lock] = {}
+
+    # ========================================================================
+    # REGISTRATION
+    # ========================================================================
+
+    def register(
+        self,
+        name: str,
+        template_dir: Union[str, Path, None] = None,
+        css: Union[str, Path, None] = None,
+    ) -> Theme:
+        """
+        Register (or redefine) a theme.
+
+        Args:
+            name: Theme name
+            template_dir: Directory of templates overriding the bundled ones,
+                e.g. only ``quote.jinja2`` (default: None, bundled templates)
+            css: Theme CSS file (default: the registry's default_css)
+
+        Returns:
+            Theme definition
+
+        Raises:
+            FileNotFoundError: If the template directory or CSS file doesn't exist
+        """
+        theme = Theme(
+            name=name,
+            template_dir=Path(template_dir) if template_dir is not None else None,
+            css=Path(css) if css is not None else self.default_css,
+        )
+        if theme.template_dir is not None and not theme.template_dir.is_dir():
+            raise FileNotFoundError(f"Template directory not found: {theme.template_dir}")
+        if theme.css is not None and not theme.css.is_file():
+            raise FileNotFoundError(f"Theme CSS not found: {theme.css}")
+
+        with self._lock:
+            self._themes[name] = theme
+            self._build_locks.setdefault(name, threading.Lock())
+            if self._pool.pop(name, None) is not None:
+                self.stats.invalidations += 1
+        return theme
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a theme and drop its pooled renderer.
+
+        Raises:
+            ValueError: If the theme isn't registered
+        """
+        with self._lock:
+            self._theme(name)
+            del self._themes[name]
+            self._pool.pop(name, None)
+
+    @property
+    def themes(self) -> list[str]:
+        """Names of the registered themes."""
+        return sorted(self._themes)
+
+    # ========================================================================
+    # POOL
+    # ========================================================================
+
+    def get(self, name: str) -> PooledTheme:
+        """
+        Get a theme's compiled renderer and CSS, building them on a miss.
+
+        Args:
+            name: Theme name
+
+        Returns:
+            PooledTheme (share it; don't keep it across file changes)
+
+        Raises:
+            ValueError: If the theme isn't registered
+        """
+        with self._lock:
+            pooled = self._lookup(name)
+            if pooled is not None:
+                self.stats.hits += 1
+                return pooled
+            build_lock = self._build_locks[name]
+
+        with build_lock:
+            # Another thread may have built it while this one waited
+            with self._lock:
+                pooled = self._lookup(name)
+                if pooled is not None:
+                    self.stats.hits += 1
+                    return pooled
+                theme = self._theme(name)
+                self.stats.misses += 1
+
+            pooled = self._build(theme)
+
+            with self._lock:
+                if self._themes.get(name) is theme:
+                    self._pool[name] = pooled
+                    self._evict(keep=name)
+        return pooled
+
+    def renderer(self, name: str) -> SlideRenderer:
+        """
+        Get a theme's renderer (see ``get``).
+
+        Raises:
+            ValueError: If the theme isn't registered
+        """
+        return self.get(name).renderer
+
+    def css(self, name: str) -> str:
+        """
+        Get a theme's CSS, ready to inline (see ``get``).
+
+        Raises:
+            ValueError: If the theme isn't registered
+        """
+        return self.get(name).css
+
+    def render_html(
+        self,
+        name: str,
+        slides: list[dict[str, Any]],
+        validate: bool = True,
+        tree_shake: bool = False,
+    ) -> str:
+        """
+        Render slides into a standalone HTML deck with a theme.
+
+        Args:
+            name: Theme name
+            slides: List of slide dictionaries with 'type' and 'content' keys
+            validate: Whether to validate content (default: True)
+            tree_shake: Inline only the CSS the deck needs (default: False)
+
+        Returns:
+            HTML document (see slide_renderer.htmlexport)
+
+        Raises:
+            ValueError: If the theme isn't registered or a slide fails
+        """
+        pooled = self.get(name)
+        return pooled.renderer.render_html(
+            slides, validate=validate, theme_css=pooled.css, tree_shake=tree_shake
+        )
+
+    def invalidate(self, name: Optional[str] = None) -> int:
+        """
+        Drop pooled renderers so they are rebuilt on next use.
+
+        Args:
+            name: Theme to drop (default: None, every theme)
+
+        Returns:
+            Number of pooled themes dropped
+        """
+        with self._lock:
+            names = list(self._pool) if name is None else [name]
+            dropped = sum(self._pool.pop(n, None) is not None for n in names)
+            self.stats.invalidations += dropped
+        return dropped
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Snapshot of the pool: counters, occupancy and per-theme sizes.
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        with self._lock:
+            return {
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "evictions": self.stats.evictions,
+                "invalidations": self.stats.invalidations,
+                "hit_rate": self.stats.hit_rate,
+                "themes": len(self._pool),
+                "max_themes": self.max_themes,
+                "bytes": self.pool_bytes,
+                "max_bytes": self.max_bytes,
+                # Least recently used first
+                "pooled": {name: pooled.size for name, pooled in self._pool.items()},
+            }
+
+    @property
+    def pool_bytes(self) -> int:
+        """Estimated memory held by the pooled themes."""
+        return sum(pooled.size for pooled in self._pool.values())
+
+    def __len__(self) -> int:
+        """Number of themes currently compiled in the pool."""
+        return len(self._pool)
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _theme(self, name: str) -> Theme:
+        """Registered theme by name (call with the lock held)."""
+        theme = self._themes.get(name)
+        if theme is None:
+            registered = ", ".join(sorted(self._themes)) or "none"
+            raise ValueError(f"Unknown theme: {name}. Registered themes: {registered}")
+        return theme
+
+    def _lookup(self, name: str) -> Optional[PooledTheme]:
+        """Pooled theme if present and unchanged on disk (call with the lock held)."""
+        self._theme(name)
+        pooled = self._pool.get(name)
+        if pooled is None:
+            return None
+
+        now = time.monotonic()
+        if self.check_interval is not None and now - pooled.checked >= self.check_interval:
+            pooled.checked = now
+            if _signature(pooled.theme) != pooled.signature:
+                del self._pool[name]
+                self.stats.invalidations += 1
+                return None
+
+        self._pool.move_to_end(name)
+        return pooled
+
+    def _build(self, theme: Theme) -> PooledTheme:
+        """Compile a theme's templates and load its CSS."""
+        # Signature first: an edit made while building is caught next check
+        signature = _signature(theme)
+        loader = layered_loader(theme.template_dir) if theme.template_dir is not None else None
+        renderer = SlideRenderer(production=True, loader=loader)
+        css = load_theme(theme.css)
+
+        return PooledTheme(
+            theme=theme,
+            renderer=renderer,
+            css=css,
+            size=estimate_size(renderer) + sys.getsizeof(css),
+            signature=signature,
+            checked=time.monotonic(),
+        )
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used themes until the pool fits (lock held)."""
+        while len(self._pool) > 1 and (
+            len(self._pool) > self.max_themes or self.pool_bytes > self.max_bytes
+        ):
+            name = next(iter(self._pool))
+            if name == keep:
+                self._pool.move_to_end(name)
+                continue
+            del self._pool[name]
+            self.stats.evictions += 1
+
+
+def _signature(theme: Theme) -> _Signature:
+    """Stats of a theme's CSS and override templates, to detect changes."""
+    # The bundled CSS is part of the package and doesn't change at runtime
+    paths = [theme.css] if theme.css is not None else []
+    if theme.template_dir is not None:
+        try:
+            with os.scandir(theme.template_dir) as entries:
+                paths.extend(
+                    Path(entry.path) for entry in entries if entry.name.endswith(TEMPLATE_SUFFIX)
+                )
+        except FileNotFoundError:
+            pass
+
+    signature = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append((str(path), None))
+        else:
+            signature.append((str(path), (stat.st_mtime_ns, stat.st_size)))
+    return tuple(signature)
+
+
+def _code_size(code: CodeType) -> int:
+    """Bytes of a code object, its constants and nested code objects."""
+    size = sys.getsizeof(code) + sys.getsizeof(code.co_code)
+    for const in code.co_consts:
+        size += _code_size(const) if isinstance(const, CodeType) else sys.getsizeof(const)
+    return size
+
+
+def estimate_size(renderer: SlideRenderer) -> int:
+    """
+    Estimate the memory held by a renderer's compiled templates.
+
+    Counts each template's source and the code objects Jinja2 compiled it
+    to (render functions, their constants and nested functions). Shared
+    state such as the pydantic validators is not counted.
+
+    Args:
+        renderer: Renderer with precompiled templates (production mode)
+
+    Returns:
+        Approximate size in bytes
+    """
+    env = renderer.env
+    size = 0
+    for template in renderer._templates.values():
+        source, _, _ = env.loader.get_source(env, template.name)
+        size += sys.getsizeof(source) + _code_size(template.root_render_func.__code__)
+        for block in template.blocks.values():
+            size += _code_size(block.__code__)
+    return size
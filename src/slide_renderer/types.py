@@ -14,9 +14,25 @@ Each enum value includes:
 Supports two LLM usage patterns:
 1. Full Generation: Type + content in one LLM call
 2. Selection First: Type selection → content generation in separate calls
+
+The metadata itself lives in ``slide_renderer._slide_type_metadata`` and is
+loaded the first time a getter needs it, so importing the enum is cheap.
 """
 
+import functools
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from slide_renderer._slide_type_metadata import SlideTypeMetadata
+
+
+@functools.cache
+def _load_metadata() -> dict[str, "SlideTypeMetadata"]:
+    """Slide type value → metadata, imported on first use."""
+    from slide_renderer._slide_type_metadata import SLIDE_TYPE_METADATA
+
+    return SLIDE_TYPE_METADATA
 
 
 class SlideTypeEnum(str, Enum):
@@ -31,560 +47,58 @@ class SlideTypeEnum(str, Enum):
 
     Attributes:
         value: Snake_case identifier
-        _description: Technical description with HTML/CSS details
-        _file_reference: Source markdown file
-        _css_classes: Required CSS classes
-        _llm_description: Simple, non-technical description for LLM
-        _use_case: When to use this slide type
-        _content_requirements: Structure and validation rules
+        _metadata: SlideTypeMetadata (descriptions, file reference, CSS
+            classes, use case, content requirements), loaded lazily
     """
 
-    def __new__(
-        cls,
-        value: str,
-        description: str,
-        file_reference: str,
-        css_classes: list[str],
-        llm_description: str,
-        use_case: str,
-        content_requirements: dict,
-    ):
-        """
-        Create new enum member with full metadata.
-
-        Args:
-            value: Enum value (snake_case identifier)
-            description: Technical description with structure details
-            file_reference: Source markdown filename
-            css_classes: List of CSS class names
-            llm_description: LLM-friendly simple description
-            use_case: Primary use cases
-            content_requirements: Dict with validation rules
-        """
-        obj = str.__new__(cls, value)
-        obj._value_ = value
-        obj._description = description
-        obj._file_reference = file_reference
-        obj._css_classes = css_classes
-        obj._llm_description = llm_description
-        obj._use_case = use_case
-        obj._content_requirements = content_requirements
-        return obj
-
     # ========================================================================
     # BASIC SLIDES
     # ========================================================================
 
-    TITLE_SLIDE = (
-        "title_slide",
-        """Title slide with main heading and subtitle.
-
-Structure:
-    # Slide Title
-    ## Subtitle text
-
-HTML: Pure markdown, no wrapper divs
-CSS Classes: None (default h1/h2 styling)
-Use Case: Opening slide, presentation title""",
-        "a-title-slide.md",
-        [],
-        "Opening slide with a main title and subtitle",
-        "Presentation opening, cover slide, title page, introduction",
-        {
-            "required_fields": ["title", "subtitle"],
-            "optional_fields": [],
-            "item_count": None,
-            "has_images": False,
-            "max_title_length": 80,
-            "max_subtitle_length": 120,
-            "description": "Simple two-line text slide with large heading and smaller subheading",
-        },
-    )
-
-    SECTION_TITLE = (
-        "section_title",
-        """Section divider with centered title.
-
-Structure:
-    <!-- _class: center -->
-    # Section title
-
-HTML: Markdown with center class directive
-CSS Classes: .center (via _class directive)
-Use Case: Section breaks, chapter transitions""",
-        "b-section-title.md",
-        ["center"],
-        "Centered title slide for dividing presentation sections",
-        "Section breaks, chapter transitions, topic changes, agenda items",
-        {
-            "required_fields": ["title"],
-            "optional_fields": [],
-            "item_count": None,
-            "has_images": False,
-            "max_title_length": 60,
-            "description": "Single centered title for section breaks",
-        },
-    )
+    TITLE_SLIDE = "title_slide"
+    SECTION_TITLE = "section_title"
 
     # ========================================================================
     # TWO-COLUMN LAYOUTS
     # ========================================================================
 
-    SINGLE_CONTENT_WITH_IMAGE = (
-        "single_content_with_image",
-        """Single content block with optional image on the right.
-
-Structure:
-    <div class="two-column">
-      <div class="left">
-        <h1>Header</h1>
-        <p>Description</p>
-      </div>
-      <div class="right">
-        <div class="placeholder">
-          <img src="..." alt="...">
-        </div>
-      </div>
-    </div>
-
-HTML: two-column layout with left text and right image
-CSS Classes: .two-column, .left, .right, .placeholder
-Use Case: Feature spotlight, product showcase""",
-        "c-single-content-with-image.md",
-        ["two-column", "left", "right", "placeholder"],
-        "Text content on the left with a large image on the right",
-        "Feature spotlight, product showcase, concept explanation with visual",
-        {
-            "required_fields": ["title", "description"],
-            "optional_fields": ["image_url", "image_alt"],
-            "item_count": None,
-            "has_images": True,
-            "max_title_length": 60,
-            "max_description_length": 300,
-            "image_count": 1,
-            "description": "Single concept with explanatory text and supporting image",
-        },
-    )
-
-    HIGHLIGHT = (
-        "highlight",
-        """Highlight slide with title on left, emphasis text on right.
-
-Structure:
-    <div class="two-column">
-      <div class="left">
-        <h1>Highlight</h1>
-      </div>
-      <div class="right">
-        <p>Key message or call to action</p>
-      </div>
-    </div>
-
-HTML: two-column with minimal left content
-CSS Classes: .two-column, .left, .right
-Use Case: Key messages, important callouts""",
-        "d-highlight.md",
-        ["two-column", "left", "right"],
-        "Emphasized message or call-to-action with title on left",
-        "Key messages, important callouts, memorable quotes, CTAs",
-        {
-            "required_fields": ["title", "message"],
-            "optional_fields": [],
-            "item_count": None,
-            "has_images": False,
-            "max_title_length": 40,
-            "max_message_length": 200,
-            "description": "Short, impactful message split between title and content",
-        },
-    )
-
-    TWO_COLUMN_LIST = (
-        "two_column_list",
-        """Two-column layout with title on left, vertical list on right.
-
-Structure:
-    <div class="two-column">
-      <div class="left">
-        <h1>Simple list</h1>
-      </div>
-      <div class="right">
-        <div class="list-vertical">
-          <div class="list-item">
-            <h3>Item Title</h3>
-            <p>Description</p>
-          </div>
-          ...
-        </div>
-      </div>
-    </div>
-
-HTML: two-column with left title and right vertical list
-CSS Classes: .two-column, .left, .right, .list-vertical, .list-item
-Use Case: Bullet points, feature lists""",
-        "e-two-column-list.md",
-        ["two-column", "left", "right", "list-vertical", "list-item"],
-        "Title on left with 2-4 list items stacked vertically on right",
-        "Bullet points, feature lists, step-by-step instructions, benefits",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 2, "max": 4},
-            "has_images": False,
-            "max_title_length": 40,
-            "item_structure": {"title": 50, "description": 150},
-            "description": "Vertical list of 2-4 items with titles and descriptions",
-        },
-    )
-
-    TWO_COLUMNS_WITH_GRID = (
-        "two_columns_with_grid",
-        """Two-column layout with title on left, 2x2 grid on right.
-
-Structure:
-    <div class="two-column">
-      <div class="left">
-        <h1>Two columns</h1>
-      </div>
-      <div class="right">
-        <div class="grid-2x2">
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-        </div>
-      </div>
-    </div>
-
-HTML: two-column with 2x2 grid on right
-CSS Classes: .two-column, .left, .right, .grid-2x2, .list-item
-Use Case: Four-quadrant comparisons, 2x2 matrices""",
-        "h-two-columns-with-2x2-grid.md",
-        ["two-column", "left", "right", "grid-2x2", "list-item"],
-        "Title on left with exactly 4 items arranged in a 2x2 grid on right",
-        "Four-quadrant analysis, 2x2 matrices, SWOT analysis, four key points",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 4, "max": 4},
-            "has_images": False,
-            "max_title_length": 40,
-            "item_structure": {"title": 40, "description": 100},
-            "description": "Exactly 4 items in 2x2 grid layout",
-        },
-    )
+    SINGLE_CONTENT_WITH_IMAGE = "single_content_with_image"
+    HIGHLIGHT = "highlight"
+    TWO_COLUMN_LIST = "two_column_list"
+    TWO_COLUMNS_WITH_GRID = "two_columns_with_grid"
 
     # ========================================================================
     # SECTION CONTAINER LAYOUTS
     # ========================================================================
 
-    VERTICAL_LIST = (
-        "vertical_list",
-        """Full-width vertical list with section title.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">Simple list</h1>
-      <div class="section-content">
-        <div class="list-vertical">
-          <div class="list-item">...</div>
-          ...
-        </div>
-      </div>
-    </div>
-
-HTML: section-title-container with vertical list
-CSS Classes: .section-title-container, .section-title, .section-content, .list-vertical
-Use Case: Multiple items in vertical layout""",
-        "f-vertical-list.md",
-        ["section-title-container", "section-title", "section-content", "list-vertical"],
-        "Full-width title with 3-6 items stacked vertically below",
-        "Detailed feature lists, step-by-step processes, agenda items, multiple points",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 3, "max": 6},
-            "has_images": False,
-            "max_title_length": 60,
-            "item_structure": {"title": 60, "description": 200},
-            "description": "Vertical stack of 3-6 items with ample space for detail",
-        },
-    )
-
-    HORIZONTAL_3_COLUMN_LIST = (
-        "horizontal_3_column_list",
-        """Three-column horizontal grid layout.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">Simple list</h1>
-      <div class="section-content">
-        <div class="grid-3col">
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-        </div>
-      </div>
-    </div>
-
-HTML: section-title-container with 3-column grid
-CSS Classes: .section-title-container, .grid-3col, .list-item
-Use Case: Three-way comparisons, feature trios""",
-        "g-horizontal-3-column-list.md",
-        ["section-title-container", "grid-3col", "list-item"],
-        "Title with exactly 3 items arranged horizontally side-by-side",
-        "Three-way comparisons, feature trios, pricing tiers, three options",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 3, "max": 3},
-            "has_images": False,
-            "max_title_length": 60,
-            "item_structure": {"title": 50, "description": 150},
-            "description": "Exactly 3 items in horizontal layout",
-        },
-    )
-
-    HORIZONTAL_4_COLUMN_LIST = (
-        "horizontal_4_column_list",
-        """Four-column horizontal grid layout.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">Simple list</h1>
-      <div class="section-content">
-        <div class="grid-4col">
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-        </div>
-      </div>
-    </div>
-
-HTML: section-title-container with 4-column grid
-CSS Classes: .section-title-container, .grid-4col, .list-item
-Use Case: Four-step processes, quarterly breakdowns""",
-        "i-horizontal-4-column-list.md",
-        ["section-title-container", "grid-4col", "list-item"],
-        "Title with exactly 4 items arranged horizontally side-by-side",
-        "Four-step processes, quarterly results, four phases, four categories",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 4, "max": 4},
-            "has_images": False,
-            "max_title_length": 60,
-            "item_structure": {"title": 40, "description": 120},
-            "description": "Exactly 4 items in horizontal layout",
-        },
-    )
+    VERTICAL_LIST = "vertical_list"
+    HORIZONTAL_3_COLUMN_LIST = "horizontal_3_column_list"
+    HORIZONTAL_4_COLUMN_LIST = "horizontal_4_column_list"
 
     # ========================================================================
     # IMAGE LAYOUTS
     # ========================================================================
 
-    IMAGE_WITH_DESCRIPTION_2 = (
-        "image_with_description_2",
-        """Two images with corresponding text descriptions.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">Image with description</h1>
-      <div class="section-content">
-        <div class="image-grid-2">
-          <div class="placeholder-small"><img ...></div>
-          <div class="placeholder-small"><img ...></div>
-        </div>
-        <div class="text-grid-2">
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-        </div>
-      </div>
-    </div>
-
-HTML: 2-column image grid + 2-column text grid
-CSS Classes: .section-title-container, .image-grid-2, .text-grid-2, .placeholder-small
-Use Case: Before/after comparisons, dual products""",
-        "j-image-with-description---2-images-text.md",
-        ["section-title-container", "image-grid-2", "text-grid-2", "placeholder-small"],
-        "Two images displayed side-by-side with corresponding descriptions below each",
-        "Before/after comparisons, dual products, two options, A/B comparison",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 2, "max": 2},
-            "has_images": True,
-            "image_count": 2,
-            "max_title_length": 60,
-            "item_structure": {
-                "title": 50,
-                "description": 150,
-                "image_url": "required",
-                "image_alt": "required",
-            },
-            "description": "Exactly 2 images with matching text descriptions",
-        },
-    )
-
-    IMAGE_WITH_DESCRIPTION_3 = (
-        "image_with_description_3",
-        """Three images with corresponding text descriptions.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">Image with description</h1>
-      <div class="section-content">
-        <div class="image-grid-3">
-          <div class="placeholder-small"><img ...></div>
-          <div class="placeholder-small"><img ...></div>
-          <div class="placeholder-small"><img ...></div>
-        </div>
-        <div class="grid-3col">
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-          <div class="list-item">...</div>
-        </div>
-      </div>
-    </div>
-
-HTML: 3-column image grid + 3-column text grid
-CSS Classes: .section-title-container, .image-grid-3, .grid-3col, .placeholder-small
-Use Case: Product galleries, step-by-step visuals""",
-        "k-image-with-description---3-images-text.md",
-        ["section-title-container", "image-grid-3", "grid-3col", "placeholder-small"],
-        "Three images displayed side-by-side with corresponding descriptions below each",
-        "Product galleries, step-by-step visuals, three examples, feature showcase",
-        {
-            "required_fields": ["title", "items"],
-            "optional_fields": [],
-            "item_count": {"min": 3, "max": 3},
-            "has_images": True,
-            "image_count": 3,
-            "max_title_length": 60,
-            "item_structure": {
-                "title": 40,
-                "description": 120,
-                "image_url": "required",
-                "image_alt": "required",
-            },
-            "description": "Exactly 3 images with matching text descriptions",
-        },
-    )
+    IMAGE_WITH_DESCRIPTION_2 = "image_with_description_2"
+    IMAGE_WITH_DESCRIPTION_3 = "image_with_description_3"
 
     # ========================================================================
     # METRICS LAYOUTS
     # ========================================================================
 
-    THREE_COLUMN_METRICS = (
-        "three_column_metrics",
-        """Three-column metrics display with values and descriptions.
-
-Structure:
-    <div class="section-title-container">
-      <h1 class="section-title">3 column metric</h1>
-      <div class="section-content">
-        <div class="grid-3col">
-          <div class="metric">
-            <div class="metric-value">XX%</div>
-            <p>Description</p>
-          </div>
-          ...
-        </div>
-      </div>
-    </div>
-
-HTML: 3-column grid with metric components
-CSS Classes: .section-title-container, .grid-3col, .metric, .metric-value
-Use Case: KPI displays, statistics overview""",
-        "l-3-column-metrics.md",
-        ["section-title-container", "grid-3col", "metric", "metric-value"],
-        "Display three key metrics side-by-side with numeric values and labels",
-        "KPI dashboard, performance metrics, statistics overview, key numbers",
-        {
-            "required_fields": ["title", "metrics"],
-            "optional_fields": [],
-            "item_count": {"min": 3, "max": 3},
-            "has_images": False,
-            "max_title_length": 60,
-            "metric_format": "percentage, number, currency, or custom",
-            "metric_structure": {"value": "numeric string", "label": 60, "description": 100},
-            "description": "Exactly 3 metrics with prominent numeric values",
-        },
-    )
-
-    METRICS_GRID = (
-        "metrics_grid",
-        """Metrics dashboard with description on left, 2x2 grid on right.
-
-Structure:
-    <div class="container">
-      <div class="left-col">
-        <h2>Metrics</h2>
-        <p>Description about the data</p>
-      </div>
-      <div class="right-col">
-        <div class="metric-item">
-          <h2>61%</h2>
-          <p>Metric 1</p>
-        </div>
-        ...
-      </div>
-    </div>
-
-HTML: container with left description and right 2x2 metrics
-CSS Classes: .container, .left-col, .right-col, .metric-item
-Use Case: Dashboard views, quarterly metrics""",
-        "m-metrics-grid.md",
-        ["container", "left-col", "right-col", "metric-item"],
-        "Title and description on left with exactly 4 metrics in a 2x2 grid on right",
-        "Dashboard views, quarterly metrics, four KPIs, performance summary",
-        {
-            "required_fields": ["title", "description", "metrics"],
-            "optional_fields": [],
-            "item_count": {"min": 4, "max": 4},
-            "has_images": False,
-            "max_title_length": 40,
-            "max_description_length": 200,
-            "metric_format": "percentage, number, currency, or custom",
-            "metric_structure": {"value": "numeric string", "label": 50},
-            "description": "Exactly 4 metrics in 2x2 grid with contextual description",
-        },
-    )
+    THREE_COLUMN_METRICS = "three_column_metrics"
+    METRICS_GRID = "metrics_grid"
 
     # ========================================================================
     # SPECIAL SLIDES
     # ========================================================================
 
-    QUOTE = (
-        "quote",
-        """Centered quote slide with attribution.
-
-Structure:
-    <!-- _class: center -->
-    <div class="quote">
-      <div class="avatar"></div>
-      <blockquote>"Quote text"</blockquote>
-      <cite>Full Name · Location</cite>
-    </div>
-
-HTML: centered quote container with avatar
-CSS Classes: .center, .quote, .avatar
-Use Case: Testimonials, impactful quotes""",
-        "n-quote.md",
-        ["center", "quote", "avatar"],
-        "Centered quote with author attribution and optional avatar",
-        "Testimonials, customer quotes, impactful statements, endorsements",
-        {
-            "required_fields": ["quote_text", "author_name"],
-            "optional_fields": ["author_title", "avatar_url"],
-            "item_count": None,
-            "has_images": False,
-            "max_quote_length": 200,
-            "max_author_name_length": 60,
-            "max_author_title_length": 80,
-            "description": "Single impactful quote with attribution",
-        },
-    )
+    QUOTE = "quote"
+
+    @property
+    def _metadata(self) -> "SlideTypeMetadata":
+        """Metadata of this slide type (loaded on first access)."""
+        return _load_metadata()[self._value_]
 
     # ========================================================================
     # GETTER METHODS - Original functionality
@@ -597,7 +111,7 @@ Use Case: Testimonials, impactful quotes""",
         Returns:
             Full technical description with HTML/CSS details
         """
-        return self._description
+        return self._metadata.description
 
     def get_file_reference(self) -> str:
         """
@@ -606,7 +120,7 @@ Use Case: Testimonials, impactful quotes""",
         Returns:
             Filename of the original split slide
         """
-        return self._file_reference
+        return self._metadata.file_reference
 
     def get_css_classes(self) -> list[str]:
         """
@@ -615,7 +129,7 @@ Use Case: Testimonials, impactful quotes""",
         Returns:
             List of CSS class names used by this slide type
         """
-        return self._css_classes
+        return self._metadata.css_classes
 
     # ========================================================================
     # GETTER METHODS - New LLM metadata
@@ -628,7 +142,7 @@ Use Case: Testimonials, impactful quotes""",
         Returns:
             Plain language description suitable for LLM decision-making
         """
-        return self._llm_description
+        return self._metadata.llm_description
 
     def get_use_case(self) -> str:
         """
@@ -637,7 +151,7 @@ Use Case: Testimonials, impactful quotes""",
         Returns:
             Comma-separated use cases describing when to use this type
         """
-        return self._use_case
+        return self._metadata.use_case
 
     def get_content_requirements(self) -> dict:
         """
@@ -652,7 +166,7 @@ Use Case: Testimonials, impactful quotes""",
             - field length limits
             - additional constraints
         """
-        return self._content_requirements.copy()
+        return self._metadata.content_requirements.copy()
 
     def get_category(self) -> str:
         """
@@ -705,8 +219,8 @@ Use Case: Testimonials, impactful quotes""",
         return {
             "type": self.value,
             "name": self.name.replace("_", " ").title(),
-            "description": self._llm_description,
-            "use_case": self._use_case,
+            "description": self._metadata.llm_description,
+            "use_case": self._metadata.use_case,
         }
 
     def to_llm_full_dict(self) -> dict:
@@ -727,9 +241,9 @@ Use Case: Testimonials, impactful quotes""",
         return {
             "type": self.value,
             "name": self.name.replace("_", " ").title(),
-            "description": self._llm_description,
-            "use_case": self._use_case,
-            "content_requirements": self._content_requirements.copy(),
+            "description": self._metadata.llm_description,
+            "use_case": self._metadata.use_case,
+            "content_requirements": self._metadata.content_requirements.copy(),
             "category": self.get_category(),
         }
 
@@ -799,8 +313,8 @@ Use Case: Testimonials, impactful quotes""",
         lines = ["Available slide types:", ""]
         for idx, slide_type in enumerate(cls, 1):
             lines.append(f"{idx}. {slide_type.name} ({slide_type.value})")
-            lines.append(f"   Description: {slide_type._llm_description}")
-            lines.append(f"   Use case: {slide_type._use_case}")
+            lines.append(f"   Description: {slide_type._metadata.llm_description}")
+            lines.append(f"   Use case: {slide_type._metadata.use_case}")
             lines.append("")
         return "\n".join(lines)
 
@@ -828,10 +342,10 @@ Use Case: Testimonials, impactful quotes""",
         """
         lines = ["Slide type specifications:", ""]
         for idx, slide_type in enumerate(cls, 1):
-            req = slide_type._content_requirements
+            req = slide_type._metadata.content_requirements
             lines.append(f"{idx}. {slide_type.name} ({slide_type.value})")
-            lines.append(f"   Description: {slide_type._llm_description}")
-            lines.append(f"   Use case: {slide_type._use_case}")
+            lines.append(f"   Description: {slide_type._metadata.llm_description}")
+            lines.append(f"   Use case: {slide_type._metadata.use_case}")
             lines.append(f"   Category: {slide_type.get_category()}")
 
             # Format requirements
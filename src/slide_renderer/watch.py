@@ -0,0 +1,328 @@
+"""
+Watch mode: re-render decks as their JSON or templates are edited.
+
+DeckWatcher polls file stats (no OS-specific notification APIs), waits for
+a burst of saves to settle, then re-renders only what the change affects:
+    - a deck JSON edit re-renders that deck
+    - a template edit re-renders only the decks using that slide type
+      (templates are watched when the renderer has a template directory,
+      e.g. ``SlideRenderer(template_dir=loader.TEMPLATE_DIR)``; the bundled
+      templates served from memory never change)
+
+One dev-mode SlideRenderer is kept warm for the whole session, so the
+Jinja2 environment, compiled templates and pydantic validators survive
+between runs. Each deck also keeps an IncrementalRenderer, so inside a
+deck only the slides that actually changed are rendered again, and an
+output file is rewritten (atomically) only when its content changed.
+
+Usage:
+    from slide_renderer.watch import DeckWatcher
+
+    watcher = DeckWatcher({"talk.json": "talk.md"})
+    watcher.run(callback=print)     # until Ctrl+C
+
+Or from the command line:
+    slide-renderer talk.json -o talk.md --watch
+    slide-renderer talk.json -o talk.html --format html --watch   # live HTML preview
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+from slide_renderer import _json
+from slide_renderer.incremental import IncrementalRenderer
+from slide_renderer.jsonstream import detect_input_format, iter_jsonl
+from slide_renderer.renderer import SlideRenderer
+from slide_renderer.writer import write_atomic
+
+PathLike = Union[str, Path]
+
+# File identity used to detect edits: (modification time in ns, size)
+_Signature = tuple[int, int]
+
+
+@dataclass
+class WatchEvent:
+    """
+    One deck re-rendered (or failing to) after file changes.
+
+    Attributes:
+        source: Deck JSON file
+        output: Markdown output file
+        changed: Files whose change triggered this re-render
+        rendered: Slides actually rendered (unchanged slides are reused)
+        written: Whether the output file was rewritten
+        elapsed: Seconds spent loading and rendering the deck
+        error: Error message (None if rendering succeeded)
+    """
+
+    source: Path
+    output: Path
+    changed: list[Path] = field(default_factory=list)
+    rendered: int = 0
+    written: bool = False
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the deck rendered successfully."""
+        return self.error is None
+
+
+class DeckWatcher:
+    """
+    Polls decks and templates and re-renders affected decks on change.
+
+    Attributes:
+        renderer: Warm dev-mode SlideRenderer shared by all decks
+        decks: Deck JSON file → markdown output file
+        interval: Seconds between polls
+        debounce: Quiet period (seconds) a burst of changes must settle for
+    """
+
+    def __init__(
+        self,
+        decks: Union[Mapping[PathLike, PathLike], Iterable[PathLike]],
+        renderer: Optional[SlideRenderer] = None,
+        validate: bool = True,
+        include_frontmatter: bool = True,
+        input_format: str = "auto",
+        interval: float = 0.1,
+        debounce: float = 0.05,
+        theme_css: Optional[str] = None,
+        font_dir: Optional[PathLike] = None,
+        font_files: bool = False,
+    ):
+        """
+        Initialize the watcher; nothing is read until ``start``.
+
+        Args:
+            decks: Mapping of deck JSON file → output file, or deck files
+                alone (output next to each deck, with a .md suffix)
+            renderer: Dev-mode SlideRenderer (default: a new SlideRenderer())
+            validate: Whether to validate content (default: True)
+            include_frontmatter: Whether to include Marp frontmatter (default: True)
+            input_format: "json", "jsonl" or "auto" (default: by file suffix)
+            interval: Seconds between polls (default: 0.1)
+            debounce: Quiet period before re-rendering a burst of changes
+                (default: 0.05)
+            theme_css: Write standalone HTML decks with this theme CSS inlined
+                instead of markdown (see slide_renderer.htmlexport; default:
+                None, markdown)
+            font_dir: With theme_css, embed the theme's fonts from this local
+                directory (see slide_renderer.fonts; default: None)
+            font_files: Write the fonts into fonts/ next to each output
+                instead of inlining them (default: False)
+
+        Raises:
+            ValueError: If the renderer is in production mode, which never
+                re-reads templates
+        """
+        if renderer is None:
+            renderer = SlideRenderer()
+        if renderer.production:
+            raise ValueError("DeckWatcher needs a dev-mode SlideRenderer (production=False)")
+
+        if not isinstance(decks, Mapping):
+            decks = {deck: Path(deck).with_suffix(".md") for deck in decks}
+
+        self.renderer = renderer
+        self.decks: dict[Path, Path] = {Path(src): Path(dst) for src, dst in decks.items()}
+        self.validate = validate
+        self.include_frontmatter = include_frontmatter
+        self.input_format = input_format
+        self.interval = interval
+        self.debounce = debounce
+        self.theme_css = theme_css
+        self.font_dir = font_dir
+        self.font_files = font_files
+
+        # Per deck: incremental renderer and slide types seen at the last load
+        self._incremental: dict[Path, IncrementalRenderer] = {
+            deck: IncrementalRenderer(renderer, validate, include_frontmatter)
+            for deck in self.decks
+        }
+        self._slide_types: dict[Path, set[str]] = {deck: set() for deck in self.decks}
+        self._signatures: dict[Path, Optional[_Signature]] = {}
+        self._started = False
+
+    def start(self) -> list[WatchEvent]:
+        """
+        Take the initial snapshot and render every deck.
+
+        Returns:
+            One WatchEvent per deck
+        """
+        self._signatures = self._snapshot()
+        self._started = True
+        return [self._render_deck(deck, []) for deck in self.decks]
+
+    def scan(self) -> set[Path]:
+        """
+        Stat every watched file once and record what changed.
+
+        Returns:
+            Decks and templates added, modified or removed since the last scan
+        """
+        snapshot = self._snapshot()
+        changed = {
+            path
+            for path in snapshot.keys() | self._signatures.keys()
+            if snapshot.get(path) != self._signatures.get(path)
+        }
+        self._signatures = snapshot
+        return changed
+
+    def poll(self) -> list[WatchEvent]:
+        """
+        Scan once; on changes, wait for the burst to settle and re-render.
+
+        Returns:
+            One WatchEvent per affected deck (empty if nothing changed)
+        """
+        if not self._started:
+            return self.start()
+
+        changed = self.scan()
+        if not changed:
+            return []
+
+        # Editors often write a file in several steps, and a save-all touches
+        # many files: keep collecting until a whole quiet period passes
+        while True:
+            time.sleep(self.debounce)
+            more = self.scan()
+            if not more:
+                break
+            changed |= more
+
+        return self.refresh(changed)
+
+    def refresh(self, changed: Iterable[PathLike]) -> list[WatchEvent]:
+        """
+        Re-render the decks affected by a set of changed files.
+
+        Args:
+            changed: Changed deck and template files
+
+        Returns:
+            One WatchEvent per affected deck
+        """
+        changed = [Path(path) for path in changed]
+        template_dir = self.renderer.template_dir
+
+        events = []
+        for deck in self.decks:
+            slide_types = self._slide_types[deck]
+            triggers = [
+                path
+                for path in changed
+                if path == deck or (path.parent == template_dir and path.stem in slide_types)
+            ]
+            if triggers:
+                events.append(self._render_deck(deck, triggers))
+
+        return events
+
+    def run(
+        self,
+        callback: Optional[Callable[[WatchEvent], Any]] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Render every deck, then keep polling until stopped.
+
+        Args:
+            callback: Called with each WatchEvent (including the initial renders)
+            stop: Event that ends the loop when set (default: run until
+                KeyboardInterrupt)
+        """
+        stop = stop if stop is not None else threading.Event()
+
+        while not stop.is_set():
+            for event in self.poll():
+                if callback is not None:
+                    callback(event)
+            stop.wait(self.interval)
+
+    def _snapshot(self) -> dict[Path, Optional[_Signature]]:
+        """Signatures of all decks and templates (None = deck missing)."""
+        snapshot: dict[Path, Optional[_Signature]] = {}
+
+        for deck in self.decks:
+            try:
+                stat = os.stat(deck)
+            except FileNotFoundError:
+                snapshot[deck] = None
+            else:
+                snapshot[deck] = (stat.st_mtime_ns, stat.st_size)
+
+        # One scandir call covers every template, including newly added ones.
+        # Bundled templates (no template directory) never change.
+        template_dir = self.renderer.template_dir
+        if template_dir is None:
+            return snapshot
+        with os.scandir(template_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".jinja2") and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[template_dir / entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+    def _load_deck(self, deck: Path) -> list[Any]:
+        """Read a deck file as a list of slide dictionaries."""
+        if detect_input_format(deck, self.input_format) == "jsonl":
+            with open(deck, "rb") as f:
+                return list(iter_jsonl(f))
+
+        slides = _json.loads(deck.read_bytes())
+
+        if not isinstance(slides, list):
+            raise ValueError("JSON file must contain an array of slides")
+        return slides
+
+    def _render_deck(self, deck: Path, changed: list[Path]) -> WatchEvent:
+        """Re-render one deck and rewrite its output if the content changed."""
+        output = self.decks[deck]
+        event = WatchEvent(source=deck, output=output, changed=changed)
+        start = time.perf_counter()
+
+        try:
+            slides = self._load_deck(deck)
+            # Record types before rendering, so fixing a broken template
+            # re-triggers this deck even if this render fails
+            self._slide_types[deck] = {
+                slide["type"] for slide in slides if isinstance(slide, dict) and "type" in slide
+            }
+
+            patch = self._incremental[deck].update(slides)
+            event.rendered = patch.rendered
+            if patch.edits or not output.exists():
+                if self.theme_css is not None:
+                    # HTML export and font embedding only load for HTML output
+                    from slide_renderer.htmlexport import markdown_to_html
+
+                    document = markdown_to_html(patch.document, self.theme_css)
+                    if self.font_dir is not None:
+                        from slide_renderer.fonts import embed_fonts
+
+                        document = embed_fonts(
+                            document, self.font_dir, output=output if self.font_files else None
+                        )
+                    write_atomic(output, document)
+                else:
+                    write_atomic(output, patch.document)
+                event.written = True
+
+        except Exception as e:
+            event.error = f"{type(e).__name__}: {e}"
+
+        event.elapsed = time.perf_counter() - start
+        return event
+
@@ -0,0 +1,352 @@
+"""
+Atomic, buffered, optionally compressed output files.
+
+Every output goes to a temporary file in the target directory first and is
+renamed over the destination only once it is complete, so readers (and a
+crashed run) never see a partial file. Text is accepted chunk by chunk, so
+a presentation can be streamed to disk without building the whole string.
+
+Compression follows the file extension: ``.gz`` writes gzip, ``.zst``
+writes Zstandard (Python 3.14's ``compression.zstd`` or the ``zstandard``
+package, ``pip install slide-renderer[zstd]``).
+
+Usage:
+    from slide_renderer.writer import open_atomic, write_atomic
+
+    write_atomic("deck.md.gz", renderer.render_presentation_iter(slides))
+
+    with open_atomic("deck.md", buffer_size=1 << 20) as f:
+        for chunk in chunks:
+            f.write(chunk)
+"""
+
+import gzip
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Iterable, Optional, Union
+
+# Write buffer in bytes, before compression
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+# File suffix → compression used when compression="auto"
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+COMPRESSIONS = ("auto", "none", "gzip", "zstd")
+
+# Process umask, read on the first commit that needs it (see _default_mode)
+_umask: Optional[int] = None
+
+
+def compression_for(path: Union[str, Path], compression: str = "auto") -> Optional[str]:
+    """
+    Resolve the compression for an output path.
+
+    Args:
+        path: Output file path
+        compression: "auto" (by suffix), "none", "gzip" or "zstd"
+
+    Returns:
+        "gzip", "zstd", or None for uncompressed output
+
+    Raises:
+        ValueError: If compression is not a known value
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Invalid compression: {compression}. Valid values: {', '.join(COMPRESSIONS)}"
+        )
+
+    if compression == "auto":
+        return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+    if compression == "none":
+        return None
+    return compression
+
+
+class AtomicWriter:
+    """
+    Text file written to a temp file and renamed into place on commit.
+
+    Use as a context manager: the file is committed when the block exits
+    normally and discarded if it raises.
+
+    Attributes:
+        path: Destination file
+        compression: "gzip", "zstd" or None
+        written: Characters written so far
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: str = "auto",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        level: Optional[int] = None,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+        mode: Optional[int] = None,
+    ):
+        """
+        Create the temp file next to the destination.
+
+        Args:
+            path: Destination file (parent directories are created)
+            compression: "auto" (by suffix: .gz, .zst), "none", "gzip" or "zstd"
+            buffer_size: Write buffer size in bytes (default: 64 KiB)
+            level: Compression level (default: the codec's default)
+            encoding: Text encoding (default: utf-8)
+            fsync: Flush the file to stable storage before renaming
+                (default: False). Needed to survive power loss, not crashes.
+            mode: Permission bits of the finished file (default: 0o666
+                minus the process umask, like a file opened with open())
+
+        Raises:
+            ImportError: If zstd output is requested and no zstd module exists
+        """
+        self.path = Path(path)
+        self.compression = compression_for(self.path, compression)
+        self.encoding = encoding
+        self.fsync = fsync
+        self.mode = mode
+        self.written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._raw = os.fdopen(fd, "wb", buffering=buffer_size)
+        self._closed = False
+
+        try:
+            self._stream = self._open_compressor(level)
+        except BaseException:
+            self.abort()
+            raise
+
+    def _open_compressor(self, level: Optional[int]) -> IO[bytes]:
+        """Wrap the temp file in the configured compressor."""
+        if self.compression == "gzip":
+            # mtime=0 keeps output byte-identical across runs
+            return gzip.GzipFile(
+                fileobj=self._raw, mode="wb", compresslevel=9 if level is None else level, mtime=0
+            )
+        if self.compression == "zstd":
+            return _open_zstd(self._raw, level)
+        return self._raw
+
+    def write(self, text: str) -> int:
+        """
+        Append text to the file.
+
+        Args:
+            text: Text chunk
+
+        Returns:
+            Number of characters written
+        """
+        self._stream.write(text.encode(self.encoding))
+        self.written += len(text)
+        return len(text)
+
+    def write_bytes(self, data: bytes) -> int:
+        """
+        Append binary data to the file (``written`` counts bytes then).
+
+        Args:
+            data: Bytes to write
+
+        Returns:
+            Number of bytes written
+        """
+        self._stream.write(data)
+        self.written += len(data)
+        return len(data)
+
+    def writelines(self, chunks: Iterable[str]) -> None:
+        """Append every chunk of an iterable."""
+        for chunk in chunks:
+            self.write(chunk)
+
+    def commit(self) -> None:
+        """Finish the file and atomically rename it over the destination."""
+        if self._closed:
+            return
+
+        try:
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            if self.fsync:
+                os.fsync(self._raw.fileno())
+            self._raw.close()
+            # Temp files are created 0600
+            os.chmod(self._tmp_path, _default_mode() if self.mode is None else self.mode)
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+        self._closed = True
+
+    def abort(self) -> None:
+        """Discard the temp file, leaving any existing destination untouched."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._raw.close()
+        try:
+            os.unlink(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "AtomicWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+def _default_mode() -> int:
+    """0o666 minus the process umask, the mode open() gives new files."""
+    global _umask
+    if _umask is None:
+        _umask = _read_umask()
+    return 0o666 & ~_umask
+
+
+def _read_umask() -> int:
+    """Read the process umask, without changing it where the OS allows."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+
+    # os.umask can only be read by setting it; restore it right away
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def open_atomic(path: Union[str, Path], **kwargs) -> AtomicWriter:
+    """
+    Open an output file for atomic, buffered, optionally compressed writing.
+
+    Args:
+        path: Destination file
+        **kwargs: AtomicWriter options (compression, buffer_size, level, fsync)
+
+    Returns:
+        AtomicWriter, to be used as a context manager
+
+    Example:
+        >>> with open_atomic("deck.md.gz") as f:
+        ...     renderer.render_to_stream(slides, f)
+    """
+    return AtomicWriter(path, **kwargs)
+
+
+def write_atomic(path: Union[str, Path], chunks: Union[str, Iterable[str]], **kwargs) -> int:
+    """
+    Write a string or a stream of chunks to a file atomically.
+
+    The destination is only replaced once every chunk was written; if the
+    iterable raises (e.g. a slide fails to render), it is left untouched.
+
+    Args:
+        path: Destination file
+        chunks: Text, or an iterable of text chunks
+        **kwargs: AtomicWriter options (compression, buffer_size, level, fsync)
+
+    Returns:
+        Number of characters written
+
+    Example:
+        >>> write_atomic("deck.md", renderer.render_presentation_iter(slides))
+    """
+    with AtomicWriter(path, **kwargs) as f:
+        if isinstance(chunks, str):
+            f.write(chunks)
+        else:
+            f.writelines(chunks)
+        return f.written
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes, **kwargs) -> int:
+    """
+    Write binary data to a file atomically, uncompressed unless asked.
+
+    Args:
+        path: Destination file
+        data: File contents
+        **kwargs: AtomicWriter options (compression, buffer_size, level, fsync)
+
+    Returns:
+        Number of bytes written
+    """
+    kwargs.setdefault("compression", "none")
+    with AtomicWriter(path, **kwargs) as f:
+        return f.write_bytes(data)
+
+
+def read_text(path: Union[str, Path], encoding: str = "utf-8") -> str:
+    """
+    Read a file written by this module, decompressing by suffix.
+
+    Args:
+        path: File path (.gz and .zst are decompressed)
+        encoding: Text encoding (default: utf-8)
+
+    Returns:
+        File contents as text
+    """
+    compression = compression_for(path)
+    with open(path, "rb") as f:
+        if compression == "gzip":
+            data = gzip.GzipFile(fileobj=f).read()
+        elif compression == "zstd":
+            data = _read_zstd(f)
+        else:
+            data = f.read()
+    return data.decode(encoding)
+
+
+def _open_zstd(raw: IO[bytes], level: Optional[int]) -> IO[bytes]:
+    """Zstandard compressing writer over a binary file."""
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        pass
+    else:
+        return zstd.ZstdFile(raw, mode="wb", level=level)
+
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd output needs Python 3.14+ or the 'zstandard' package "
+            "(pip install slide-renderer[zstd])"
+        ) from None
+
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    return compressor.stream_writer(raw, closefd=False)
+
+
+def _read_zstd(f: IO[bytes]) -> bytes:
+    """Decompress a whole Zstandard file."""
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        import zstandard
+
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(f)).read()
+
+    return zstd.ZstdFile(f).read()
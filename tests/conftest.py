@@ -0,0 +1,22 @@
+"""
+Fixtures shared by the test modules.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def sample_data():
+    """Sample content for every slide type."""
+    package_root = Path(__file__).parent.parent
+    with open(package_root / "sample_data" / "sample_slides.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def deck(sample_data):
+    """Every sample slide type, in one deck."""
+    return [{"type": k, "content": v} for k, v in sample_data.items()]
@@ -0,0 +1,291 @@
+"""
+Pytest-based tests for the image asset cache.
+
+Images are served by a local HTTP stand-in running in a background thread,
+which counts requests and concurrent downloads, and from file:// URLs.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.assets import AssetCache, image_urls
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 100
+
+
+class ImageServer(ThreadingHTTPServer):
+    """HTTP stand-in serving a dict of path → (content type, body)."""
+
+    daemon_threads = True
+
+    def __init__(self, images: dict[str, tuple[str, bytes]], delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.images = images
+        self.delay = delay
+        self.requests: list[str] = []
+        # Path → event a request for it waits for
+        self.gates: dict[str, threading.Event] = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """Serves the server's images, 404 for anything else."""
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            if self.path in server.gates:
+                server.gates[self.path].wait(5)
+            if self.path not in server.images:
+                self.send_error(404)
+                return
+            content_type, body = server.images[self.path]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    """A running image server with two images of identical content."""
+    server = ImageServer(
+        {
+            "/figure.png": ("image/png", PNG),
+            "/mirror/figure": ("image/png", PNG),
+            "/photo.jpg": ("image/jpeg", b"\xff\xd8\xff" + b"1" * 300),
+        }
+    )
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def deck(image_url: str, *urls: str) -> list[dict]:
+    """A deck with one single-image slide and one two-image slide."""
+    return [
+        {
+            "type": "single_content_with_image",
+            "content": {
+                "title": "Figure",
+                "description": "A figure",
+                "image_url": image_url,
+                "image_alt": "figure",
+            },
+        },
+        {
+            "type": "image_with_description_2",
+            "content": {
+                "title": "Two figures",
+                "images": [{"url": url, "alt": "figure"} for url in urls],
+                "items": [
+                    {"title": "Left", "description": "The left figure"},
+                    {"title": "Right", "description": "The right figure"},
+                ],
+            },
+        },
+    ]
+
+
+def test_localize_rewrites_image_urls(server, tmp_path):
+    """image_url and images[].url point at cached files; each URL is fetched once."""
+    figure, photo = server.url("/figure.png"), server.url("/photo.jpg")
+    slides = deck(figure, figure, photo)
+    assets = AssetCache(tmp_path / "assets")
+
+    report = assets.localize(slides, relative_to=tmp_path / "site")
+
+    assert report.ok
+    assert sorted(server.requests) == ["/figure.png", "/photo.jpg"]
+    image_url = report.slides[0]["content"]["image_url"]
+    assert image_url.startswith("../assets/") and image_url.endswith(".png")
+    assert (tmp_path / "site" / image_url).resolve().read_bytes() == PNG
+    urls = [image["url"] for image in report.slides[1]["content"]["images"]]
+    assert urls[0] == image_url and urls[1].endswith(".jpg")
+    # The input is left alone
+    assert slides[0]["content"]["image_url"] == figure
+
+
+def test_cache_survives_restarts(server, tmp_path):
+    """A new cache on the same directory serves known URLs without fetching."""
+    slides = deck(server.url("/figure.png"), server.url("/photo.jpg"))
+    first = AssetCache(tmp_path).localize(slides)
+
+    assets = AssetCache(tmp_path)
+    second = assets.localize(slides)
+
+    assert second.slides == first.slides
+    assert len(server.requests) == 2
+    assert (assets.stats.hits, assets.stats.misses) == (2, 0)
+
+
+def test_identical_images_are_stored_once(server, tmp_path):
+    """Different URLs with the same content share one file."""
+    assets = AssetCache(tmp_path)
+
+    first = assets.fetch(server.url("/figure.png"))
+    second = assets.fetch(server.url("/mirror/figure"))
+
+    assert first == second
+    assert len(assets) == 1
+    assert assets.stats.deduplicated == 1
+
+
+def test_lru_eviction_by_size(server, tmp_path):
+    """Past max_bytes, the least recently used images are evicted."""
+    assets = AssetCache(tmp_path, max_bytes=len(PNG) + 10)
+
+    png = assets.fetch(server.url("/figure.png"))
+    jpg = assets.fetch(server.url("/photo.jpg"))
+
+    # The image just fetched is kept even though it alone exceeds the cap
+    assert not png.exists() and jpg.exists()
+    assert assets.stats.evictions == 1
+    assert assets.total_bytes == jpg.stat().st_size
+    assert assets.fetch(server.url("/figure.png")).exists()
+    assert server.requests.count("/figure.png") == 2
+
+
+def test_eviction_spares_images_of_calls_in_progress(server, tmp_path):
+    """A call finishing first doesn't evict images another call got as hits."""
+    assets = AssetCache(tmp_path, max_bytes=len(PNG) + 10)
+    figure = assets.fetch(server.url("/figure.png"))
+    server.images["/slow.png"] = ("image/png", PNG + b"slow")
+    server.gates["/slow.png"] = threading.Event()
+    reports = []
+    slow = threading.Thread(
+        target=lambda: reports.append(
+            assets.localize(deck(server.url("/figure.png"), server.url("/slow.png")))
+        )
+    )
+    slow.start()
+    while "/slow.png" not in server.requests:
+        time.sleep(0.01)
+
+    # Over the cap: the figure is least recently used, but the slow call holds it
+    assets.fetch(server.url("/photo.jpg"))
+
+    assert figure.exists()
+    server.gates["/slow.png"].set()
+    slow.join()
+    assert reports[0].ok
+    assert Path(reports[0].slides[0]["content"]["image_url"]).exists()
+
+
+def test_failed_images_stay_remote(server, tmp_path):
+    """Unfetchable images keep their URL and are reported; strict raises."""
+    missing = server.url("/missing.png")
+    slides = deck(missing, "images/local.png", "data:image/png;base64,AAAA")
+    assets = AssetCache(tmp_path)
+
+    report = assets.localize(slides)
+
+    assert report.slides == slides
+    assert list(report.failed) == [missing]
+    assert "404" in report.failed[missing]
+    with pytest.raises(OSError):
+        assets.localize(slides, strict=True)
+    assert image_urls(slides) == [missing, "images/local.png", "data:image/png;base64,AAAA"]
+
+
+def test_non_images_are_rejected(server, tmp_path):
+    """A response that isn't image/* (e.g. an HTML error page) is not stored."""
+    server.images["/figure.png"] = ("text/html", b"<h1>Sign in</h1>")
+    url = server.url("/figure.png")
+    assets = AssetCache(tmp_path)
+
+    report = assets.localize(deck(url, url))
+
+    assert list(report.failed) == [url]
+    assert "Not an image (text/html)" in report.failed[url]
+    assert len(assets) == 0
+
+
+def test_file_urls_are_opt_in(tmp_path):
+    """file:// URLs are left alone unless allow_file=True, and must be images."""
+    image = tmp_path / "figure.png"
+    image.write_bytes(PNG)
+    secret = tmp_path / "secret.txt"
+    secret.write_text("password")
+    slides = deck(image.as_uri(), secret.as_uri())
+
+    assets = AssetCache(tmp_path / "assets")
+    assert assets.localize(slides).slides == slides
+    with pytest.raises(ValueError, match="allow_file=True"):
+        assets.fetch(image.as_uri())
+    with pytest.raises(ValueError, match="Not an http"):
+        assets.fetch("figure.png")
+
+    assets = AssetCache(tmp_path / "assets", allow_file=True)
+    path = assets.fetch(image.as_uri())
+    assert path.read_bytes() == PNG
+    assert path.suffix == ".png"
+    report = assets.localize(slides)
+    assert list(report.failed) == [secret.as_uri()]
+    assert len(assets) == 1
+
+
+def test_bounded_concurrency(tmp_path):
+    """At most `workers` downloads run at once, and all URLs are fetched."""
+    images = {f"/{i}.png": ("image/png", PNG + bytes([i])) for i in range(8)}
+    server = ImageServer(images, delay=0.05)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    try:
+        paths, errors = AssetCache(tmp_path, workers=3).fetch_many(
+            server.url(path) for path in images
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert not errors
+    assert len(set(paths.values())) == 8
+    assert 1 < server.max_active <= 3
+
+
+def test_cli_asset_cache(server, tmp_path):
+    """--asset-cache renders decks with local image paths, fetched once for all decks."""
+    from slide_renderer.cli import EXIT_OK, main
+
+    figure, photo = server.url("/figure.png"), server.url("/photo.jpg")
+    slides = deck(figure, photo, figure)
+    inputs = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(slides), encoding="utf-8")
+        inputs.append(str(path))
+    site = tmp_path / "site"
+
+    assert main(inputs + ["-o", str(site), "--asset-cache", str(tmp_path / "cache")]) == EXIT_OK
+
+    markdown = (site / "a.md").read_text(encoding="utf-8")
+    assert "127.0.0.1" not in markdown
+    assert 'src="../cache/' in markdown
+    assert sorted(server.requests) == ["/figure.png", "/photo.jpg"]
+    assert (site / "b.md").read_text(encoding="utf-8") == markdown
+    localized = AssetCache(tmp_path / "cache").localize(slides, relative_to=site).slides
+    assert markdown == SlideRenderer().render_presentation(localized)
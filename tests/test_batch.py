@@ -0,0 +1,97 @@
+"""
+Pytest-based tests for multi-core batch rendering.
+"""
+
+import json
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.batch import render_many
+
+
+@pytest.fixture
+def decks(sample_data):
+    """Three small decks; the middle one is invalid."""
+    return [
+        [{"type": "title_slide", "content": sample_data["title_slide"]}],
+        [{"type": "quote", "content": {"quote": "Missing author"}}],
+        [{"type": k, "content": v} for k, v in sample_data.items()],
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_many_ordered(decks, workers):
+    """Results come back in input order and match render_presentation."""
+    renderer = SlideRenderer()
+
+    results = list(render_many(decks, workers=workers))
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].markdown == renderer.render_presentation(decks[0])
+    assert results[2].markdown == renderer.render_presentation(decks[2])
+
+
+def test_render_many_captures_errors(decks):
+    """A failing deck is reported without killing the batch."""
+    results = list(render_many(decks, workers=2, ordered=False))
+
+    by_index = {r.index: r for r in results}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[0].ok and by_index[2].ok
+    assert not by_index[1].ok
+    assert by_index[1].markdown is None
+    assert "slide 0 (quote)" in by_index[1].error
+
+
+def test_render_many_from_files_via_renderer(decks, tmp_path):
+    """SlideRenderer.render_many accepts paths to JSON files."""
+    paths = []
+    for i, deck in enumerate(decks):
+        path = tmp_path / f"deck{i}.json"
+        path.write_text(json.dumps(deck))
+        paths.append(path)
+
+    results = list(SlideRenderer().render_many(paths, workers=2, chunksize=2))
+
+    assert [r.ok for r in results] == [True, False, True]
+
+
+def test_render_many_forwards_renderer_settings(decks, tmp_path):
+    """Workers use the renderer's loader and cache; unsendable loaders raise."""
+    from jinja2 import FunctionLoader
+
+    from slide_renderer import RenderCache
+    from slide_renderer.loader import layered_loader
+
+    (tmp_path / "quote.jinja2").write_text("> {{ quote }}\n", encoding="utf-8")
+    cache = RenderCache(directory=tmp_path / "cache")
+    renderer = SlideRenderer(loader=layered_loader(tmp_path), cache=cache)
+    quote = [{"type": "quote", "content": {"quote": "Hi", "author": "Me"}}]
+
+    results = list(renderer.render_many([quote, decks[0]], workers=2))
+
+    assert results[0].markdown.endswith("> Hi\n")
+    assert results[1].markdown == SlideRenderer().render_presentation(decks[0])
+    assert any((tmp_path / "cache").iterdir())
+
+    unsendable = SlideRenderer(loader=FunctionLoader(lambda name: None))
+    with pytest.raises(ValueError, match="worker processes"):
+        list(unsendable.render_many([quote], workers=2))
+
+
+def test_cli_renders_decks_in_parallel(decks, tmp_path):
+    """slide-renderer renders several inputs through render_many and reports failures."""
+    from slide_renderer.cli import EXIT_INVALID_INPUT, main
+
+    paths = []
+    for i, deck in enumerate(decks):
+        path = tmp_path / f"deck{i}.json"
+        path.write_text(json.dumps(deck))
+        paths.append(str(path))
+
+    output_dir = tmp_path / "out"
+    exit_code = main([*paths, "-o", f"{output_dir}/", "-j", "2"])
+
+    assert exit_code == EXIT_INVALID_INPUT
+    assert sorted(p.name for p in output_dir.iterdir()) == ["deck0.md", "deck2.md"]
@@ -0,0 +1,132 @@
+"""
+Pytest-based tests for the content-addressed render cache.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import RenderCache, SlideRenderer
+
+
+@pytest.fixture
+def slides():
+    """All 14 sample slides."""
+    package_root = Path(__file__).parent.parent
+    with open(package_root / "sample_data" / "sample_slides.json") as f:
+        sample_data = json.load(f)
+    return [{"type": k, "content": v} for k, v in sample_data.items()]
+
+
+def test_cached_render_matches_uncached(slides):
+    """Cache hits return exactly what a fresh render produces."""
+    cache = RenderCache()
+    renderer = SlideRenderer(cache=cache)
+    expected = SlideRenderer().render_presentation(slides)
+
+    assert renderer.render_presentation(slides) == expected
+    assert cache.stats.misses == 14 and cache.stats.hits == 0
+
+    assert renderer.render_presentation(slides) == expected
+    assert cache.stats.hits == 14
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_changed_slide_misses(slides):
+    """Only the changed slide is re-rendered."""
+    cache = RenderCache()
+    renderer = SlideRenderer(cache=cache)
+    renderer.render_presentation(slides)
+
+    slides[0]["content"]["title"] = "A New Title"
+    result = renderer.render_presentation(slides)
+
+    assert "A New Title" in result
+    assert cache.stats.misses == 15
+    assert cache.stats.hits == 13
+
+
+def test_key_is_canonical():
+    """Key ignores dict ordering but not validation mode."""
+    a = RenderCache.make_key("title_slide", {"title": "t", "subtitle": "s"}, "fp")
+    b = RenderCache.make_key("title_slide", {"subtitle": "s", "title": "t"}, "fp")
+    c = RenderCache.make_key("title_slide", {"title": "t", "subtitle": "s"}, "fp", validate=False)
+
+    assert a == b
+    assert a != c
+
+
+def test_lru_eviction():
+    """Least recently used entries are evicted past maxsize."""
+    cache = RenderCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+def test_disk_tier_survives_new_cache(slides, tmp_path):
+    """A new cache over the same directory is served from disk."""
+    SlideRenderer(cache=RenderCache(directory=tmp_path)).render_presentation(slides)
+
+    cache = RenderCache(directory=tmp_path)
+    SlideRenderer(cache=cache).render_presentation(slides)
+
+    assert cache.stats.hits == 14
+    assert cache.stats.disk_hits == 14
+
+    cache.clear()
+    assert not list(tmp_path.glob("*/*.md"))
+
+
+def test_disk_tier_is_bounded(tmp_path):
+    """Past max_disk_bytes, least recently used disk entries are deleted, across restarts."""
+    cache = RenderCache(maxsize=1, directory=tmp_path, max_disk_bytes=25)
+    for key in ("a", "b"):
+        cache.put(key * 64, key * 10)
+    # A disk hit refreshes "a", so "b" is the oldest entry when "c" arrives
+    assert cache.get("a" * 64) == "a" * 10
+    cache.put("c" * 64, "c" * 10)
+
+    assert sorted(path.stem[0] for path in tmp_path.glob("*/*.md")) == ["a", "c"]
+    assert cache.disk_bytes == 20
+    assert cache.stats.disk_evictions == 1
+
+    restarted = RenderCache(directory=tmp_path, max_disk_bytes=10)
+    assert restarted.disk_bytes == 10
+    assert restarted.get("c" * 64) == "c" * 10
+    assert restarted.get("a" * 64) is None
+
+
+def test_template_edit_invalidates(tmp_path):
+    """Editing a template changes its fingerprint, so cached output misses."""
+    template = tmp_path / "section_title.jinja2"
+    template.write_text("# {{ title }}")
+
+    cache = RenderCache()
+    renderer = SlideRenderer(template_dir=tmp_path, cache=cache)
+    assert renderer.render("section_title", {"title": "Hi"}) == "# Hi"
+
+    template.write_text("## {{ title }}")
+    stat = template.stat()
+    os.utime(template, (stat.st_atime, stat.st_mtime + 10))
+
+    assert renderer.render("section_title", {"title": "Hi"}) == "## Hi"
+    assert cache.stats.hits == 0
+
+
+def test_invalid_content_is_not_cached():
+    """Validation errors are raised and nothing is stored."""
+    cache = RenderCache()
+    renderer = SlideRenderer(cache=cache)
+
+    with pytest.raises(ValueError):
+        renderer.render("title_slide", {"title": "x" * 1000, "subtitle": "s"})
+    assert len(cache) == 0
@@ -0,0 +1,179 @@
+"""
+Pytest-based tests for the slide-renderer command line.
+"""
+
+import io
+import json
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.cli import EXIT_INVALID_INPUT, EXIT_IO_ERROR, EXIT_OK, EXIT_USAGE, main
+
+
+@pytest.fixture
+def deck_file(deck, tmp_path):
+    """The sample deck written to a JSON file."""
+    path = tmp_path / "deck.json"
+    path.write_text(json.dumps(deck), encoding="utf-8")
+    return path
+
+
+class _Stdin:
+    """Minimal stand-in for sys.stdin with a binary buffer."""
+
+    def __init__(self, data: bytes):
+        self.buffer = io.BytesIO(data)
+
+    def isatty(self) -> bool:
+        return False
+
+
+def test_file_to_stdout(deck, deck_file, capsys):
+    """A single input is streamed to stdout."""
+    exit_code = main([str(deck_file)])
+
+    assert exit_code == EXIT_OK
+    assert capsys.readouterr().out == SlideRenderer().render_presentation(deck)
+
+
+def test_stdin_to_output_file(deck, tmp_path, monkeypatch):
+    """`cat slides.json | slide-renderer -o out.md` reads the deck from stdin."""
+    monkeypatch.setattr("sys.stdin", _Stdin(json.dumps(deck).encode("utf-8")))
+    output = tmp_path / "presentation.md"
+
+    exit_code = main(["-o", str(output)])
+
+    assert exit_code == EXIT_OK
+    assert output.read_text(encoding="utf-8") == SlideRenderer().render_presentation(deck)
+
+
+def test_fragment_format(deck, deck_file, capsys):
+    """--format fragment omits the Marp frontmatter."""
+    exit_code = main(["-i", str(deck_file), "--format", "fragment"])
+
+    assert exit_code == EXIT_OK
+    expected = SlideRenderer().render_presentation(deck, include_frontmatter=False)
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_glob_to_output_dir(deck, tmp_path, jobs):
+    """A glob over several inputs renders one markdown file per deck."""
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.json").write_text(json.dumps(deck), encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    exit_code = main([str(tmp_path / "*.json"), "-o", str(output_dir), "--jobs", jobs])
+
+    assert exit_code == EXIT_OK
+    assert sorted(p.name for p in output_dir.iterdir()) == ["a.md", "b.md", "c.md"]
+    assert (output_dir / "b.md").read_text(encoding="utf-8") == (
+        SlideRenderer().render_presentation(deck)
+    )
+
+
+def test_same_stem_inputs_are_rejected(deck, tmp_path, capsys):
+    """Inputs that would write the same output file are a usage error."""
+    for name in ("x", "y"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "deck.json").write_text(json.dumps(deck), encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    exit_code = main([str(tmp_path / "*" / "deck.json"), "-o", str(output_dir)])
+
+    assert exit_code == EXIT_USAGE
+    assert "deck.md" in capsys.readouterr().err
+    assert not output_dir.exists()
+
+
+def test_invalid_deck_exit_code(tmp_path, capsys):
+    """Validation errors exit with 1 and name the failing slide."""
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps([{"type": "quote", "content": {"quote": "No author"}}]))
+
+    exit_code = main([str(path)])
+
+    assert exit_code == EXIT_INVALID_INPUT
+    assert "slide 0 (quote)" in capsys.readouterr().err
+
+
+def test_malformed_json_exit_code(tmp_path):
+    """Malformed JSON exits with 1."""
+    path = tmp_path / "broken.json"
+    path.write_text("[{")
+
+    assert main([str(path)]) == EXIT_INVALID_INPUT
+
+
+def test_missing_file_exit_code(tmp_path):
+    """A missing input file exits with 3."""
+    assert main([str(tmp_path / "missing.json")]) == EXIT_IO_ERROR
+
+
+def test_usage_errors(deck_file, tmp_path):
+    """Unmatched globs and several inputs without -o are usage errors."""
+    assert main([str(tmp_path / "*.nothing")]) == EXIT_USAGE
+    assert main([str(deck_file), str(deck_file)]) == EXIT_USAGE
+
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--format", "pdf", str(deck_file)])
+    assert excinfo.value.code == EXIT_USAGE
+
+
+def test_jsonl_from_stdin(deck, monkeypatch, capsys):
+    """--input-format jsonl streams one slide per line from stdin."""
+    lines = "\n".join(json.dumps(slide) for slide in deck)
+    monkeypatch.setattr("sys.stdin", _Stdin(lines.encode("utf-8")))
+
+    exit_code = main(["--input-format", "jsonl"])
+
+    assert exit_code == EXIT_OK
+    assert capsys.readouterr().out == SlideRenderer().render_presentation(deck)
+
+
+def test_stream_json_to_file(deck, deck_file, tmp_path):
+    """--stream parses the JSON array incrementally and writes the same output."""
+    output = tmp_path / "presentation.md"
+
+    assert main([str(deck_file), "--stream", "-o", str(output)]) == EXIT_OK
+    assert output.read_text(encoding="utf-8") == SlideRenderer().render_presentation(deck)
+
+
+def test_failed_render_leaves_no_output_file(tmp_path):
+    """A deck failing mid-stream doesn't leave a partial output file."""
+    path = tmp_path / "bad.jsonl"
+    path.write_text(
+        json.dumps({"type": "title_slide", "content": {"title": "T", "subtitle": "S"}})
+        + "\n"
+        + json.dumps({"type": "quote", "content": {"quote": "No author"}})
+    )
+    output = tmp_path / "presentation.md"
+
+    assert main([str(path), "-o", str(output)]) == EXIT_INVALID_INPUT
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_watch_needs_output(deck_file):
+    """--watch without an output is a usage error (it never writes to stdout)."""
+    assert main([str(deck_file), "--watch"]) == EXIT_USAGE
+
+
+def test_compressed_outputs(deck, deck_file, tmp_path):
+    """--compress adds the suffix in output directories; -o FILE.gz compresses."""
+    from slide_renderer.writer import read_text
+
+    expected = SlideRenderer().render_presentation(deck)
+
+    assert main([str(deck_file), "-o", str(tmp_path / "single.md.gz")]) == EXIT_OK
+    assert read_text(tmp_path / "single.md.gz") == expected
+
+    other_file = tmp_path / "other.json"
+    other_file.write_text(deck_file.read_text(encoding="utf-8"), encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    exit_code = main([str(deck_file), str(other_file), "-o", str(output_dir), "--compress", "gzip"])
+
+    assert exit_code == EXIT_OK
+    assert sorted(p.name for p in output_dir.iterdir()) == ["deck.md.gz", "other.md.gz"]
+    assert read_text(output_dir / "other.md.gz") == expected
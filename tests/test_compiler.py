@@ -0,0 +1,60 @@
+"""
+Pytest-based tests for the ahead-of-time template compiler.
+"""
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.compiler import compile_templates, load_compiled_module
+
+
+def test_compiled_matches_jinja2_without_validation(tmp_path):
+    """Compiled functions mirror Jinja2 for dicts, missing keys and None."""
+    module = load_compiled_module(compile_templates(output=tmp_path / "compiled.py"))
+    jinja = SlideRenderer(backend="jinja2")
+
+    contents = [
+        {"title": "T", "items": [{"title": "a", "description": None}, {"title": "b"}]},
+        {},
+    ]
+    for content in contents:
+        for slide_type in ["two_column_list", "metrics_grid", "quote"]:
+            expected = jinja.render(slide_type, content, validate=False)
+            assert module.RENDERERS[slide_type](content) == expected
+
+
+def test_stale_templates_fall_back_to_jinja2(tmp_path):
+    """A template edited after compiling is rendered by Jinja2."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "section_title.jinja2").write_text("# {{ title }}")
+    (template_dir / "title_slide.jinja2").write_text("# {{ title }}\n## {{ subtitle }}")
+    module_path = compile_templates(template_dir, tmp_path / "compiled.py")
+
+    (template_dir / "section_title.jinja2").write_text("## {{ title }}")
+    renderer = SlideRenderer(template_dir, backend="compiled", compiled_module=module_path)
+
+    assert sorted(renderer._compiled) == ["title_slide"]
+    assert renderer.render("section_title", {"title": "Hi"}) == "## Hi"
+
+
+def test_auto_backend_uses_compiled_only_in_production(tmp_path):
+    """Dev mode keeps Jinja2 (hot reload); production picks up the module."""
+    module_path = compile_templates(output=tmp_path / "compiled.py")
+
+    assert not SlideRenderer(compiled_module=module_path)._compiled
+    assert len(SlideRenderer(production=True, compiled_module=module_path)._compiled) == 14
+
+
+def test_missing_module_required_for_compiled_backend(tmp_path):
+    """backend='compiled' requires the generated module."""
+    with pytest.raises(FileNotFoundError):
+        SlideRenderer(backend="compiled", compiled_module=tmp_path / "missing.py")
+
+
+def test_unsupported_construct(tmp_path):
+    """Templates beyond output and plain loops are rejected with a clear error."""
+    (tmp_path / "custom.jinja2").write_text("{{ title | upper }}")
+
+    with pytest.raises(ValueError, match="custom.jinja2"):
+        compile_templates(tmp_path, tmp_path / "compiled.py")
@@ -0,0 +1,190 @@
+"""
+Pytest-based tests for incremental directory rendering.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.cli import EXIT_OK, main
+from slide_renderer.directory import MANIFEST_NAME, render_directory
+from slide_renderer.loader import TEMPLATE_DIR
+from slide_renderer.writer import read_text
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    """A private copy of the templates, safe to edit."""
+    return Path(shutil.copytree(TEMPLATE_DIR, tmp_path / "templates"))
+
+
+@pytest.fixture
+def src(tmp_path, sample_data):
+    """A tree of three decks; only talks/a.json has a quote slide."""
+    src = tmp_path / "decks"
+    (src / "talks").mkdir(parents=True)
+
+    quote = [{"type": "quote", "content": sample_data["quote"]}]
+    title = [{"type": "title_slide", "content": sample_data["title_slide"]}]
+    (src / "talks" / "a.json").write_text(json.dumps(title + quote), encoding="utf-8")
+    (src / "talks" / "b.json").write_text(json.dumps(title), encoding="utf-8")
+    (src / "c.jsonl").write_text("\n".join(json.dumps(s) for s in title), encoding="utf-8")
+    return src
+
+
+def run(src, dst, template_dir, **kwargs):
+    return render_directory(src, dst, workers=1, template_dir=template_dir, **kwargs)
+
+
+def test_first_run_renders_everything(src, tmp_path, template_dir):
+    """Every deck is mirrored to a markdown file and recorded in the manifest."""
+    dst = tmp_path / "site"
+
+    report = run(src, dst, template_dir)
+
+    assert report.ok
+    assert report.rendered == ["c.jsonl", "talks/a.json", "talks/b.json"]
+    slides = json.loads((src / "talks" / "a.json").read_text(encoding="utf-8"))
+    assert (dst / "talks" / "a.md").read_text(encoding="utf-8") == (
+        SlideRenderer(template_dir).render_presentation(slides)
+    )
+    manifest = json.loads((dst / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert sorted(manifest["entries"]["talks/a.json"]["templates"]) == ["quote", "title_slide"]
+
+
+def test_second_run_skips_unchanged(src, tmp_path, template_dir):
+    """Nothing is rendered again when nothing changed, even after a touch."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+    os.utime(src / "talks" / "b.json")
+
+    report = run(src, dst, template_dir)
+
+    assert report.rendered == []
+    assert len(report.skipped) == 3
+
+
+def test_input_edit_rerenders_that_deck(src, tmp_path, template_dir, sample_data):
+    """An edited deck is the only one rendered."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+    highlight = [{"type": "highlight", "content": sample_data["highlight"]}]
+    (src / "talks" / "b.json").write_text(json.dumps(highlight), encoding="utf-8")
+
+    report = run(src, dst, template_dir)
+
+    assert report.rendered == ["talks/b.json"]
+    assert sample_data["highlight"]["title"] in (dst / "talks" / "b.md").read_text(encoding="utf-8")
+
+
+def test_edited_output_is_rendered_again(src, tmp_path, template_dir):
+    """An output changed since it was written doesn't count as up to date."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+    expected = (dst / "c.md").read_text(encoding="utf-8")
+    (dst / "c.md").write_text("edited by hand", encoding="utf-8")
+
+    report = run(src, dst, template_dir)
+
+    assert report.rendered == ["c.jsonl"]
+    assert (dst / "c.md").read_text(encoding="utf-8") == expected
+
+
+def test_input_edited_during_render_is_rendered_again(src, tmp_path, template_dir, monkeypatch):
+    """The manifest records the input as it was read, not as it is after rendering."""
+    dst = tmp_path / "site"
+    deck = src / "talks" / "b.json"
+    original = SlideRenderer.render_presentation
+
+    def render_then_edit(self, slides, **kwargs):
+        markdown = original(self, slides, **kwargs)
+        deck.write_text(deck.read_text(encoding="utf-8") + " ", encoding="utf-8")
+        return markdown
+
+    monkeypatch.setattr(SlideRenderer, "render_presentation", render_then_edit)
+    run(src, dst, template_dir)
+    monkeypatch.undo()
+
+    report = run(src, dst, template_dir)
+
+    assert report.rendered == ["talks/b.json"]
+
+
+def test_inputs_sharing_an_output_fail(src, tmp_path, template_dir):
+    """a.json and a.jsonl would both write a.md: both fail, the rest renders."""
+    dst = tmp_path / "site"
+    (src / "c.json").write_text("[]", encoding="utf-8")
+
+    report = run(src, dst, template_dir)
+
+    assert sorted(report.failed) == ["c.json", "c.jsonl"]
+    assert "c.md would also be written from c.jsonl" in report.failed["c.json"]
+    assert report.rendered == ["talks/a.json", "talks/b.json"]
+    assert not (dst / "c.md").exists()
+
+
+def test_template_edit_rerenders_decks_using_it(src, tmp_path, template_dir):
+    """Editing a template re-renders only the decks with that slide type."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+    template = template_dir / "quote.jinja2"
+    template.write_text(template.read_text(encoding="utf-8") + "<!-- v2 -->\n", encoding="utf-8")
+
+    report = run(src, dst, template_dir)
+
+    assert report.rendered == ["talks/a.json"]
+    assert "<!-- v2 -->" in (dst / "talks" / "a.md").read_text(encoding="utf-8")
+
+
+def test_removed_inputs_remove_outputs(src, tmp_path, template_dir):
+    """Outputs of deleted inputs are removed, along with emptied directories."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+    shutil.rmtree(src / "talks")
+
+    report = run(src, dst, template_dir)
+
+    assert sorted(report.removed) == ["talks/a.md", "talks/b.md"]
+    assert not (dst / "talks").exists()
+    assert (dst / "c.md").exists()
+
+
+def test_failed_deck_is_retried(src, tmp_path, template_dir):
+    """A failing deck is reported and tried again on the next run."""
+    dst = tmp_path / "site"
+    (src / "bad.json").write_text(json.dumps([{"type": "quote", "content": {}}]))
+
+    first = run(src, dst, template_dir)
+    second = run(src, dst, template_dir)
+
+    assert list(first.failed) == ["bad.json"] and not first.ok
+    assert list(second.failed) == ["bad.json"]
+    assert second.rendered == []
+
+
+def test_option_change_rerenders_and_renames(src, tmp_path, template_dir):
+    """Switching to gzip re-renders everything and drops the old .md files."""
+    dst = tmp_path / "site"
+    run(src, dst, template_dir)
+
+    report = run(src, dst, template_dir, compression="gzip")
+
+    assert len(report.rendered) == 3
+    assert not (dst / "c.md").exists()
+    assert read_text(dst / "c.md.gz").startswith("---\nmarp: true")
+
+
+def test_parallel_and_cli(src, tmp_path, template_dir):
+    """The CLI renders a directory input with worker processes."""
+    dst = tmp_path / "site"
+
+    args = [str(src), "-o", str(dst), "--jobs", "2", "--template-dir", str(template_dir)]
+    assert main(args) == EXIT_OK
+    assert (dst / "talks" / "a.md").exists()
+
+    report = render_directory(src, dst, workers=2, template_dir=template_dir, force=True)
+    assert len(report.rendered) == 3
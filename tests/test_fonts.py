@@ -0,0 +1,212 @@
+"""
+Pytest-based tests for offline font bundling and subsetting.
+"""
+
+import base64
+import io
+import json
+import re
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.fonts import (
+    bundle_fonts,
+    document_text,
+    embed_fonts,
+    font_faces,
+    select_faces,
+    used_weights,
+)
+from slide_renderer.htmlexport import load_theme
+
+QUOTE = {"quote": "배움에는 끝이 없다", "author": "Steve Jobs"}
+
+CSS = """
+@font-face { font-family: 'Sans'; src: url('https://cdn/Sans-Light.woff2') format('woff2');
+  font-weight: 300; }
+@font-face { font-family: 'Sans'; src: url('https://cdn/Sans-Regular.woff2'); font-weight: 400; }
+@font-face { font-family: 'Sans'; src: url("https://cdn/Sans-Bold.woff2?v=2"); font-weight: 700; }
+@font-face { font-family: 'Sans'; src: url('https://cdn/Sans-Black.woff2'); font-weight: 900; }
+section { font-family: 'Sans'; }
+h1 { font-weight: 800; }
+"""
+
+
+def _has_fonttools() -> bool:
+    try:
+        import fontTools.subset  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.fixture
+def font_dir(tmp_path):
+    """Fake font files named like the CSS's URLs; their bytes identify them."""
+    directory = tmp_path / "fonts"
+    directory.mkdir()
+    for name in ("Sans-Light", "Sans-Regular", "Sans-Bold", "Sans-Black"):
+        (directory / f"{name}.woff2").write_bytes(name.encode())
+    return directory
+
+
+def test_weights_select_faces():
+    """Only the faces the used weights match are kept, per CSS font matching."""
+    faces = font_faces(CSS)
+
+    assert [face.file_name for face in faces] == [
+        "Sans-Light.woff2",
+        "Sans-Regular.woff2",
+        "Sans-Bold.woff2",
+        "Sans-Black.woff2",
+    ]
+    assert used_weights(CSS) == {400, 700, 800}
+    # 800 has no face of its own: the next heavier one (900) is used
+    selected = select_faces(faces, used_weights(CSS))
+    assert [face.weight for face in selected] == [(400, 400), (700, 700), (900, 900)]
+    assert used_weights("p { font-weight: bolder; }") is None
+
+
+def test_bundle_inlines_local_fonts(font_dir):
+    """Kept faces point at inlined local files; unused faces are dropped."""
+    css = bundle_fonts(CSS, "Hi", font_dir, subset=False)
+
+    urls = re.findall(r"url\('data:font/woff2;base64,([^']*)'\)", css)
+    fonts = [base64.b64decode(url) for url in urls]
+    assert fonts == [b"Sans-Regular", b"Sans-Bold", b"Sans-Black"]
+    assert "cdn" not in css
+    assert css.count("@font-face") == 3
+    assert "font-weight: 900;" in css
+    assert "h1 { font-weight: 800; }" in css
+
+
+def test_bundle_writes_font_files(font_dir, tmp_path):
+    """With fonts_dir, fonts are written once, named by content."""
+    out = tmp_path / "site" / "fonts"
+
+    first = bundle_fonts(CSS, "Hi", font_dir, subset=False, fonts_dir=out)
+    second = bundle_fonts(CSS, "Ho", font_dir, subset=False, fonts_dir=out)
+
+    assert first == second
+    names = sorted(path.name for path in out.iterdir())
+    assert len(names) == 3
+    assert all(f"url('fonts/{name}') format('woff2')" in first for name in names)
+
+
+def test_missing_font(font_dir):
+    """A kept face without a local file raises FileNotFoundError."""
+    (font_dir / "Sans-Bold.woff2").unlink()
+
+    with pytest.raises(FileNotFoundError, match="Sans-Bold.woff2"):
+        bundle_fonts(CSS, "Hi", font_dir, subset=False)
+
+
+def test_document_text():
+    """Only slide text counts, entities decoded, digits added for page numbers."""
+    document = (
+        "<style>@font-face{}</style>"
+        '<div class="marpit"><section data-marpit-pagination="1">'
+        '<h1 class="x">A &amp; 가</h1></section></div>'
+    )
+
+    text = document_text(document)
+
+    assert set(text) == set("A & 가0123456789")
+
+
+def test_render_html_embeds_theme_fonts(tmp_path):
+    """render_html(font_dir=...) leaves no CDN font URL in the deck."""
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    for face in font_faces(load_theme()):
+        (font_dir / face.file_name).write_bytes(b"font")
+
+    html = SlideRenderer().render_html(
+        [{"type": "quote", "content": QUOTE}], tree_shake=True, font_dir=font_dir
+    )
+
+    assert "cdn.jsdelivr.net" not in html
+    assert html.count("data:font/woff2;base64,") == 3
+
+
+@pytest.mark.skipif(_has_fonttools(), reason="fontTools is installed")
+def test_subset_needs_fonttools(font_dir):
+    """Asking for subsetting without fontTools raises ImportError."""
+    with pytest.raises(ImportError, match="fontTools"):
+        bundle_fonts(CSS, "Hi", font_dir, subset=True)
+
+
+@pytest.mark.skipif(not _has_fonttools(), reason="fontTools is not installed")
+def test_subset_to_deck_glyphs(tmp_path):
+    """Fonts are subset to the deck's characters and cached by glyph set."""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTFont
+
+    from slide_renderer.fonts import cache_info
+
+    characters = "ABCDEFGH가나다"
+    glyph_names = [".notdef"] + [f"g{ord(c)}" for c in characters]
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((500, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_names)
+    builder.setupCharacterMap({ord(c): f"g{ord(c)}" for c in characters})
+    builder.setupGlyf({name: glyph for name in glyph_names})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_names})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Sans", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    builder.save(str(font_dir / "Sans-Regular.ttf"))
+
+    css = "@font-face { font-family: 'Sans'; src: url('https://cdn/Sans-Regular.woff2'); }"
+    cache_dir = tmp_path / "cache"
+    bundled = bundle_fonts(css, "AB가", font_dir, subset=True, cache_dir=cache_dir)
+    hits = cache_info().hits
+    assert bundle_fonts(css, "BA가A", font_dir, subset=True, cache_dir=cache_dir) == bundled
+    assert cache_info().hits == hits + 1
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    data = base64.b64decode(re.search(r"base64,([^']*)", bundled).group(1))
+    subset = TTFont(io.BytesIO(data))
+    assert set(subset.getBestCmap()) == {ord("A"), ord("B"), ord("가")}
+
+
+def test_embed_fonts_rewrites_style_blocks(font_dir, tmp_path):
+    """embed_fonts rewrites every <style> block and writes files next to output."""
+    document = f'<style>{CSS}</style><div class="marpit"><section>Hi</section></div>'
+
+    html = embed_fonts(document, font_dir, subset=False, output=tmp_path / "site" / "deck.html")
+
+    assert "cdn" not in html
+    assert len(list((tmp_path / "site" / "fonts").iterdir())) == 3
+
+
+def test_cli_font_files(tmp_path):
+    """--font-dir --font-files writes fonts next to the HTML output."""
+    from slide_renderer.cli import EXIT_OK, EXIT_USAGE, main
+
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    for face in font_faces(load_theme()):
+        (font_dir / face.file_name).write_bytes(face.file_name.encode())
+    deck = tmp_path / "deck.json"
+    deck.write_text(json.dumps([{"type": "quote", "content": QUOTE}]), encoding="utf-8")
+    output = tmp_path / "site" / "deck.html"
+
+    args = [str(deck), "-o", str(output), "--format", "html", "--font-dir", str(font_dir)]
+    assert main(args + ["--font-files"]) == EXIT_OK
+
+    html = output.read_text(encoding="utf-8")
+    assert "cdn.jsdelivr.net" not in html
+    assert len(list((tmp_path / "site" / "fonts").iterdir())) == 3
+    assert main(args + ["--stream"]) == EXIT_USAGE
@@ -0,0 +1,151 @@
+"""
+Pytest-based tests for the standalone HTML exporter.
+"""
+
+import json
+import re
+from importlib import resources
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.cli import EXIT_OK, main
+from slide_renderer.htmlexport import bundled_theme, iter_html, load_theme, markdown_to_html
+
+THEME = "section { color: red; }"
+
+
+def sections(document: str) -> list[str]:
+    """Opening <section> tags of a document."""
+    return re.findall(r"<section[^>]*>", document)
+
+
+def test_one_section_per_slide(deck):
+    """Each rendered slide becomes one <section>, numbered from 1."""
+    document = SlideRenderer().render_html(deck, theme_css=THEME)
+
+    tags = sections(document)
+    assert len(tags) == len(deck)
+    assert [re.search(r'id="(\d+)"', tag).group(1) for tag in tags] == [
+        str(i) for i in range(1, len(deck) + 1)
+    ]
+    assert document.startswith("<!DOCTYPE html>")
+    assert '<div class="marpit">' in document
+    assert document.rstrip().endswith("</html>")
+
+
+def test_class_directive(deck):
+    """`<!-- _class: center -->` applies to its own slide only, like Marp."""
+    section_title = next(s for s in deck if s["type"] == "section_title")
+    document = SlideRenderer().render_html([deck[0], section_title, deck[0]], theme_css=THEME)
+
+    tags = sections(document)
+    assert 'class="center"' not in tags[0]
+    assert 'class="center"' in tags[1]
+    assert 'data-class="center"' in tags[1]
+    assert 'class="center"' not in tags[2]
+    assert "<!--" not in document
+
+
+def test_inherited_directives():
+    """Directives without "_" carry over to later slides; frontmatter sets them all."""
+    markdown = (
+        "---\nmarp: true\npaginate: true\nbackgroundColor: '#fff'\n---\n\n"
+        "# One\n\n---\n\n<!-- class: lead -->\n# Two\n\n---\n\n# Three\n"
+    )
+
+    tags = sections(markdown_to_html(markdown, THEME))
+
+    assert all('data-marpit-pagination="' in tag for tag in tags)
+    assert all("background-color:#fff" in tag for tag in tags)
+    assert "lead" not in tags[0]
+    assert 'class="lead"' in tags[1] and 'class="lead"' in tags[2]
+
+
+def test_markdown_blocks():
+    """Headings, paragraphs, lists, quotes, code and inline syntax are converted."""
+    markdown = (
+        "# Title *here*\n\nSome **bold** `a<b` [link](https://x.y) & <span>raw</span>\n"
+        "next line\n\n- one\n- two\n\n1. first\n\n> quoted\n\n```python\nx < 1\n```\n"
+    )
+
+    document = markdown_to_html(markdown, THEME)
+
+    assert "<h1>Title <em>here</em></h1>" in document
+    assert (
+        '<p>Some <strong>bold</strong> <code>a&lt;b</code> <a href="https://x.y">link</a> '
+        "&amp; <span>raw</span><br />\nnext line</p>"
+    ) in document
+    assert "<ul>\n<li>one</li>\n<li>two</li>\n</ul>" in document
+    assert "<ol>\n<li>first</li>\n</ol>" in document
+    assert "<blockquote>\n<p>quoted</p>\n</blockquote>" in document
+    assert '<pre><code class="language-python">x &lt; 1\n</code></pre>' in document
+
+
+def test_html_blocks_kept(deck):
+    """Template HTML passes through unchanged, with markdown in it left alone."""
+    renderer = SlideRenderer()
+    slide = next(s for s in deck if s["type"] == "metrics_grid")
+    fragment = renderer.render(slide["type"], slide["content"])
+
+    document = markdown_to_html(fragment, THEME)
+
+    html_lines = [line for line in fragment.splitlines() if line.lstrip().startswith("<")]
+    for line in html_lines:
+        if not line.lstrip().startswith("<!--"):
+            assert line in document
+
+
+def test_title():
+    """The title comes from the argument, the title directive, or the first heading."""
+    assert "<title>Deck one</title>" in markdown_to_html("# Deck *one*\n", THEME)
+    assert "<title>Set</title>" in markdown_to_html("---\ntitle: Set\n---\n\n# Deck\n", THEME)
+    assert "<title>Arg</title>" in markdown_to_html("# Deck\n", THEME, title="Arg")
+
+
+def test_streaming_matches_whole(deck):
+    """Chunked input of any size gives the same document as the whole text."""
+    markdown = SlideRenderer().render_presentation(deck)
+    whole = markdown_to_html(markdown, THEME)
+
+    for size in (1, 7, 4096):
+        chunks = [markdown[i : i + size] for i in range(0, len(markdown), size)]
+        assert "".join(iter_html(chunks, THEME)) == whole
+
+
+def test_load_theme(tmp_path):
+    """Marp's built-in theme imports are dropped; missing files raise."""
+    theme = tmp_path / "theme.css"
+    theme.write_text('/* @theme t */\n@import "default";\nsection { color: red; }\n')
+
+    css = load_theme(theme)
+
+    assert "@import" not in css
+    assert "section { color: red; }" in css
+    assert "@theme custom-style" in load_theme()
+    with pytest.raises(FileNotFoundError):
+        load_theme(tmp_path / "missing.css")
+
+
+def test_default_theme_is_package_data():
+    """The default theme is read from the package, so installed copies find it."""
+    assert (resources.files("slide_renderer") / "custom-style.css").is_file()
+    assert load_theme() is bundled_theme()
+    assert "@import" not in load_theme()
+
+
+def test_cli_html_format(deck, tmp_path):
+    """`--format html` writes the same document as render_html."""
+    deck_file = tmp_path / "deck.json"
+    deck_file.write_text(json.dumps(deck), encoding="utf-8")
+    theme = tmp_path / "theme.css"
+    theme.write_text(THEME)
+    output = tmp_path / "out"
+    output.mkdir()
+
+    exit_code = main([str(deck_file), "-f", "html", "--theme", str(theme), "-o", str(output)])
+
+    assert exit_code == EXIT_OK
+    assert (output / "deck.html").read_text(encoding="utf-8") == SlideRenderer().render_html(
+        deck, theme_css=load_theme(theme)
+    )
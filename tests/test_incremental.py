@@ -0,0 +1,88 @@
+"""
+Pytest-based tests for incremental deck re-rendering.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import IncrementalRenderer, SlideRenderer
+
+
+@pytest.fixture
+def slides():
+    """All 14 sample slides, with a non-ASCII title to exercise byte offsets."""
+    package_root = Path(__file__).parent.parent
+    with open(package_root / "sample_data" / "sample_slides.json") as f:
+        sample_data = json.load(f)
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+    slides[0]["content"]["title"] = "발표 제목"
+    return slides
+
+
+def check_patch(incremental, previous, new_slides):
+    """Update, then verify the document and that the edits reproduce it."""
+    patch = incremental.update(new_slides)
+    assert patch.document == SlideRenderer().render_presentation(new_slides)
+    assert patch.apply(previous) == patch.document
+    return patch
+
+
+def test_first_update_renders_everything(slides):
+    """The first update renders every slide and sends one full edit."""
+    incremental = IncrementalRenderer()
+    patch = check_patch(incremental, "", slides)
+
+    assert patch.rendered == 14
+    assert len(patch.edits) == 1
+    assert incremental.document == patch.document
+
+
+def test_changed_slide(slides):
+    """Only the edited slide is re-rendered and patched."""
+    incremental = IncrementalRenderer()
+    previous = incremental.update(slides).document
+
+    new_slides = copy.deepcopy(slides)
+    new_slides[5]["content"]["title"] = "새 제목"
+    patch = check_patch(incremental, previous, new_slides)
+
+    assert patch.rendered == 1
+    assert patch.changed == [5]
+    assert patch.inserted == [] and patch.removed == []
+    assert len(patch.edits) == 1
+    assert "새 제목" in patch.edits[0].text
+
+
+def test_insert_and_remove(slides):
+    """Inserted slides are rendered; removed and moved-up slides are reused."""
+    incremental = IncrementalRenderer()
+    previous = incremental.update(slides).document
+
+    new_slides = copy.deepcopy(slides)
+    del new_slides[0]
+    new_slides.insert(7, {"type": "section_title", "content": {"title": "Inserted"}})
+    patch = check_patch(incremental, previous, new_slides)
+
+    assert patch.rendered == 1
+    assert patch.inserted == [7]
+    assert patch.removed == [0]
+
+
+def test_failed_update_keeps_previous_state(slides):
+    """A failing update leaves the previous deck as the diff base."""
+    incremental = IncrementalRenderer()
+    previous = incremental.update(slides).document
+
+    bad_slides = copy.deepcopy(slides)
+    bad_slides[3]["content"]["title"] = "x" * 1000
+    with pytest.raises(ValueError, match="slide 3"):
+        incremental.update(bad_slides)
+
+    assert incremental.document == previous
+    new_slides = copy.deepcopy(slides)
+    new_slides.append({"type": "section_title", "content": {"title": "The End"}})
+    patch = check_patch(incremental, previous, new_slides)
+    assert patch.inserted == [14]
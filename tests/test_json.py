@@ -0,0 +1,44 @@
+"""
+Pytest-based tests for the JSON parsing backend.
+"""
+
+import json
+
+import pytest
+
+from slide_renderer import SlideRenderer, _json
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run with the installed backend, and again forcing the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_loads_accepts_buffers(backend):
+    """str, bytes and bytearray inputs all parse to the same object."""
+    text = '[{"type": "quote", "content": {"quote": "é", "author": "A"}}]'
+    expected = json.loads(text)
+
+    assert _json.loads(text) == expected
+    assert _json.loads(text.encode("utf-8")) == expected
+    assert _json.loads(bytearray(text.encode("utf-8"))) == expected
+
+
+def test_loads_error_type(backend):
+    """Malformed JSON raises json.JSONDecodeError on every backend."""
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads(b"[{")
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_render_from_file(deck, tmp_path, backend, validate):
+    """render_from_file gives the same output on every backend."""
+    path = tmp_path / "deck.json"
+    path.write_text(json.dumps(deck), encoding="utf-8")
+
+    renderer = SlideRenderer()
+    expected = renderer.render_presentation(deck, validate=validate)
+    assert renderer.render_from_file(path, validate=validate) == expected
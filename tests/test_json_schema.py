@@ -0,0 +1,183 @@
+"""
+Pytest-based tests for memoized JSON schemas and the schema bundle.
+"""
+
+import json
+import warnings
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, Field
+
+from slide_renderer.schemas import SLIDE_CONTENT_MODELS, get_json_schema, get_json_schema_text
+from slide_renderer.schemas.content import MetricsGridContent, QuoteContent
+from slide_renderer.schemas.json_schema import (
+    clear_schema_cache,
+    load_schema_bundle,
+    meta_path,
+    model_schema,
+    model_schema_json,
+    schema_content_hash,
+    schemas_fingerprint,
+    write_schema_bundle,
+)
+
+BUNDLE_FILE = Path(__file__).parent.parent / "sample_data" / "all_schemas.json"
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start and end every test with an empty schema cache."""
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+@pytest.fixture
+def count_generation(monkeypatch):
+    """Count model_json_schema() calls on QuoteContent."""
+    calls = []
+    original = QuoteContent.model_json_schema
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(QuoteContent, "model_json_schema", counting)
+    return calls
+
+
+def test_model_schema_matches_pydantic():
+    """Cached schemas are exactly what pydantic generates."""
+    for model in SLIDE_CONTENT_MODELS.values():
+        assert model_schema(model) == model.model_json_schema()
+
+
+def test_schema_generated_once_per_model(count_generation):
+    """Repeated lookups, as dict or text, generate the schema once."""
+    for _ in range(3):
+        get_json_schema("quote")
+        get_json_schema_text("quote")
+        model_schema_json(QuoteContent, indent=2)
+
+    assert len(count_generation) == 1
+
+
+def test_model_schema_returns_copies():
+    """Mutating a returned schema does not corrupt the cache."""
+    schema = get_json_schema("metrics_grid")
+    schema["properties"].clear()
+
+    assert get_json_schema("metrics_grid") == MetricsGridContent.model_json_schema()
+
+
+def test_schema_text_is_cached_and_keeps_unicode():
+    """Schema text matches json.dumps(ensure_ascii=False) and is reused."""
+    text = model_schema_json(MetricsGridContent)
+
+    assert text == json.dumps(MetricsGridContent.model_json_schema(), ensure_ascii=False)
+    assert model_schema_json(MetricsGridContent) is text
+    assert json.loads(model_schema_json(MetricsGridContent, indent=2)) == json.loads(text)
+
+
+def test_bundle_round_trip(tmp_path, count_generation):
+    """A loaded bundle serves every schema without generating any."""
+    expected = QuoteContent.model_json_schema()
+    bundle = tmp_path / "schemas.json"
+    write_schema_bundle(bundle)
+    clear_schema_cache()
+    count_generation.clear()
+
+    assert load_schema_bundle(bundle) is True
+    assert get_json_schema("quote") == expected
+    assert get_json_schema_text("quote") == json.dumps(expected, ensure_ascii=False)
+    assert count_generation == []
+    # The bundle is a plain slide type → schema mapping; fingerprints live beside it
+    assert set(json.loads(bundle.read_text(encoding="utf-8"))) == set(SLIDE_CONTENT_MODELS)
+    assert meta_path(bundle) == tmp_path / "schemas.meta.json"
+
+
+def test_stale_bundle_is_ignored(tmp_path, count_generation):
+    """A bundle written from other model definitions is not used."""
+
+    class Content(BaseModel):
+        quote: str = Field(..., max_length=200)
+
+    bundle = tmp_path / "schemas.json"
+    write_schema_bundle(bundle, {"quote": Content})
+
+    class Content(BaseModel):  # noqa: F811 - the model changed since
+        quote: str = Field(..., max_length=120)
+
+    with pytest.warns(UserWarning, match="stale"):
+        assert load_schema_bundle(bundle, {"quote": Content}) is False
+
+    # Schemas are generated from the models as usual
+    assert model_schema(Content)["properties"]["quote"]["maxLength"] == 120
+
+
+def test_edited_bundle_is_ignored(tmp_path):
+    """A bundle whose content no longer matches its hash, or lacks a sidecar, is stale."""
+    bundle = tmp_path / "schemas.json"
+    write_schema_bundle(bundle, {"quote": QuoteContent})
+    edited = json.loads(bundle.read_text(encoding="utf-8"))
+    edited["quote"]["title"] = "Edited"
+    bundle.write_text(json.dumps(edited), encoding="utf-8")
+
+    with pytest.warns(UserWarning, match="content was modified"):
+        assert load_schema_bundle(bundle, {"quote": QuoteContent}) is False
+
+    meta_path(bundle).unlink()
+    with pytest.warns(UserWarning, match="no readable schemas.meta.json"):
+        assert load_schema_bundle(bundle, {"quote": QuoteContent}) is False
+
+
+def test_unchecked_bundle_is_trusted(tmp_path):
+    """check=False skips the fingerprint comparison."""
+    bundle = tmp_path / "schemas.json"
+    bundle.write_text(json.dumps({"quote": {"title": "Prebuilt"}}), encoding="utf-8")
+
+    assert load_schema_bundle(bundle, {"quote": QuoteContent}, check=False) is True
+    assert get_json_schema("quote") == {"title": "Prebuilt"}
+
+
+def test_missing_bundle_warns(tmp_path):
+    """A missing bundle falls back to generating schemas."""
+    with pytest.warns(UserWarning, match="not found"):
+        assert load_schema_bundle(tmp_path / "missing.json") is False
+
+    assert get_json_schema("quote") == QuoteContent.model_json_schema()
+
+
+def test_fingerprint_covers_nested_models():
+    """Changing a model referenced from a content model changes the fingerprint."""
+
+    class Item(BaseModel):
+        title: str = Field(..., max_length=100)
+
+    class Content(BaseModel):
+        items: list[Item]
+
+    before = schemas_fingerprint({"list": Content})
+
+    class Item(BaseModel):  # noqa: F811
+        title: str = Field(..., max_length=50)
+
+    class Content(BaseModel):  # noqa: F811
+        items: list[Item]
+
+    assert schemas_fingerprint({"list": Content}) != before
+    assert schemas_fingerprint({"list": Content}) == schemas_fingerprint({"list": Content})
+
+
+def test_checked_in_bundle_is_up_to_date():
+    """sample_data/all_schemas.json matches the current model definitions."""
+    # Regenerate with: python -m slide_renderer.schemas.json_schema sample_data/all_schemas.json
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert load_schema_bundle(BUNDLE_FILE) is True
+
+    generated = {t: m.model_json_schema() for t, m in SLIDE_CONTENT_MODELS.items()}
+    assert json.loads(BUNDLE_FILE.read_text(encoding="utf-8")) == generated
+    meta = json.loads(meta_path(BUNDLE_FILE).read_text(encoding="utf-8"))
+    assert meta["schemas"] == schema_content_hash(generated)
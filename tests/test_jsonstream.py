@@ -0,0 +1,113 @@
+"""
+Pytest-based tests for incremental JSON / JSON Lines slide readers.
+"""
+
+import io
+import json
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.jsonstream import (
+    detect_input_format,
+    iter_json_array,
+    iter_jsonl,
+    iter_slides,
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_matches_json_load(deck, chunk_size, indent):
+    """Chunked parsing yields exactly the array elements, for any chunk size."""
+    text = json.dumps(deck, indent=indent, ensure_ascii=False)
+
+    from_bytes = list(iter_json_array(io.BytesIO(text.encode("utf-8")), chunk_size))
+    from_text = list(iter_json_array(io.StringIO(text), chunk_size))
+
+    assert from_bytes == deck
+    assert from_text == deck
+
+
+def test_iter_json_array_scalars_across_chunks():
+    """Numbers and literals split across chunk boundaries decode whole."""
+    values = [12345678, -1.5e10, True, None, "é" * 10, []]
+
+    assert list(iter_json_array(io.StringIO(json.dumps(values)), chunk_size=3)) == values
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("", "not closed"),
+        ('[{"type": "quote"}', "not closed"),
+        ('{"type": "quote"}', "must contain an array"),
+        ("[1 2]", "Expected ','"),
+        ("[1] 2", "Extra data"),
+        ("[1, ]", "Invalid JSON"),
+    ],
+)
+def test_iter_json_array_errors(text, message):
+    """Malformed input raises ValueError with a useful message."""
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_iter_json_array_fails_fast():
+    """A malformed element is reported without reading the rest of the input."""
+    stream = io.StringIO('[{"type": oops}' + " " * 1_000_000 + "]")
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        list(iter_json_array(stream, chunk_size=16))
+
+    assert stream.tell() < 1000
+
+
+def test_iter_jsonl(deck):
+    """JSON Lines yields one slide per non-blank line."""
+    lines = "\n\n".join(json.dumps(slide) for slide in deck) + "\n"
+
+    assert list(iter_jsonl(io.BytesIO(lines.encode("utf-8")))) == deck
+
+
+def test_iter_jsonl_names_bad_line():
+    """A malformed line is reported by number."""
+    stream = io.StringIO('{"type": "quote"}\n{broken\n')
+
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_jsonl(stream))
+
+
+def test_detect_input_format():
+    """'auto' picks JSON Lines by file suffix."""
+    assert detect_input_format("deck.jsonl") == "jsonl"
+    assert detect_input_format("deck.NDJSON") == "jsonl"
+    assert detect_input_format("deck.json") == "json"
+    assert detect_input_format("-") == "json"
+    assert detect_input_format("deck.json", "jsonl") == "jsonl"
+
+    with pytest.raises(ValueError, match="Invalid input format"):
+        detect_input_format("deck.json", "yaml")
+
+
+def test_streaming_render_matches_render_presentation(deck):
+    """Both readers feed render_presentation_iter to the same document."""
+    renderer = SlideRenderer()
+    expected = renderer.render_presentation(deck)
+
+    as_array = io.BytesIO(json.dumps(deck).encode("utf-8"))
+    as_lines = io.BytesIO("\n".join(json.dumps(s) for s in deck).encode("utf-8"))
+
+    out = io.StringIO()
+    renderer.render_to_stream(iter_slides(as_array, "json"), out)
+    assert out.getvalue() == expected
+    assert "".join(renderer.render_presentation_iter(iter_slides(as_lines, "jsonl"))) == expected
+
+
+def test_render_from_file_jsonl(deck, tmp_path):
+    """render_from_file reads .jsonl files line by line."""
+    path = tmp_path / "deck.jsonl"
+    path.write_text("\n".join(json.dumps(s) for s in deck), encoding="utf-8")
+
+    renderer = SlideRenderer()
+    assert renderer.render_from_file(path) == renderer.render_presentation(deck)
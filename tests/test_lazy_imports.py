@@ -0,0 +1,95 @@
+"""
+Pytest-based tests for lazy package imports.
+
+Each check runs in a fresh interpreter, since this test session has
+already imported everything.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter with the package on the path."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR)},
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import slide_renderer", "import slide_renderer.cli", "import slide_renderer.schemas"],
+)
+def test_import_does_not_load_heavy_dependencies(statement):
+    """Importing the package, CLI or schemas package loads neither Jinja2 nor pydantic."""
+    loaded = run_python(
+        f"{statement}; import sys; "
+        "print(sorted(m for m in ('jinja2', 'pydantic') if m in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_watch_loads_html_export_only_for_html():
+    """Watching markdown output loads neither the HTML exporter nor font bundling."""
+    loaded = run_python(
+        "import sys, slide_renderer.watch; "
+        "print(sorted(m for m in ('slide_renderer.htmlexport', 'slide_renderer.fonts') "
+        "if m in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_public_names_resolve_on_first_access():
+    """A public name imports its module on first access."""
+    loaded = run_python(
+        "import sys, slide_renderer; "
+        "before = 'slide_renderer.renderer' in sys.modules; "
+        "slide_renderer.SlideRenderer; "
+        "print(before, 'slide_renderer.renderer' in sys.modules)"
+    )
+
+    assert loaded == "False True"
+
+
+def test_slide_type_metadata_loaded_by_first_getter():
+    """SlideTypeEnum members exist without their metadata until a getter runs."""
+    loaded = run_python(
+        "import sys; from slide_renderer.types import SlideTypeEnum; "
+        "name = 'slide_renderer._slide_type_metadata'; "
+        "before = name in sys.modules; "
+        "SlideTypeEnum.QUOTE.get_file_reference(); "
+        "print(before, name in sys.modules)"
+    )
+
+    assert loaded == "False True"
+
+
+def test_lazy_names_match_all():
+    """Every name in __all__ resolves, and dir() lists them before import."""
+    import slide_renderer
+    import slide_renderer.schemas
+
+    for module in (slide_renderer, slide_renderer.schemas):
+        assert set(module.__all__) <= set(dir(module))
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+
+
+def test_unknown_name_raises_attribute_error():
+    """Unknown names raise AttributeError as for a regular module."""
+    import slide_renderer
+
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        slide_renderer.missing
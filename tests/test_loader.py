@@ -0,0 +1,67 @@
+"""
+Pytest-based tests for loading the bundled templates.
+"""
+
+import builtins
+import os
+
+import pytest
+from jinja2 import DictLoader, FileSystemLoader
+
+from slide_renderer import SlideRenderer
+from slide_renderer.loader import TEMPLATE_DIR, bundled_templates, template_loader
+
+
+def test_bundled_templates_match_package_files():
+    """Every template file in the package is bundled, with its exact source."""
+    sources = bundled_templates()
+
+    files = sorted(TEMPLATE_DIR.glob("*.jinja2"))
+    assert len(sources) == len(files) == 14
+    for path in files:
+        assert sources[path.name] == path.read_text(encoding="utf-8")
+    assert bundled_templates() is sources
+
+
+def test_template_loader():
+    """No directory means the bundled templates; a missing directory raises."""
+    assert isinstance(template_loader(), DictLoader)
+    assert isinstance(template_loader(TEMPLATE_DIR), FileSystemLoader)
+
+    with pytest.raises(FileNotFoundError):
+        template_loader(TEMPLATE_DIR / "missing")
+
+
+@pytest.mark.parametrize("production", [False, True])
+def test_render_without_template_file_io(deck, monkeypatch, production):
+    """The default renderer never opens or stats a template file."""
+    renderer = SlideRenderer(production=production, backend="jinja2")
+    assert renderer.template_dir is None
+    expected = SlideRenderer(TEMPLATE_DIR).render_presentation(deck)
+
+    real_open, real_stat = builtins.open, os.stat
+
+    def guarded(real):
+        def wrapper(path, *args, **kwargs):
+            if str(path).endswith(".jinja2"):
+                raise AssertionError(f"template file accessed: {path}")
+            return real(path, *args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(builtins, "open", guarded(real_open))
+    monkeypatch.setattr(os, "stat", guarded(real_stat))
+
+    assert renderer.render_presentation(deck) == expected
+    assert renderer.render_presentation(deck) == expected
+
+
+def test_template_dir_replaces_bundled_templates(tmp_path):
+    """A template directory is used instead of the bundled templates."""
+    (tmp_path / "quote.jinja2").write_text("> {{ quote }}")
+
+    renderer = SlideRenderer(template_dir=tmp_path)
+
+    assert renderer.render("quote", {"quote": "Hi", "author": "Me"}) == "> Hi"
+    with pytest.raises(ValueError, match="Template not found"):
+        renderer.render("title_slide", {"title": "T", "subtitle": "S"})
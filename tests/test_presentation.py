@@ -0,0 +1,159 @@
+"""
+Pytest-based tests for deck-level validation.
+
+Tests that the discriminated-union adapter agrees with the per-slide models.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from slide_renderer import (
+    SlideRenderer,
+    collect_slide_errors,
+    validate_presentation,
+    validate_presentation_json,
+)
+from slide_renderer.schemas import SLIDE_CONTENT_MODELS
+
+
+@pytest.fixture
+def sample_slides():
+    """Load sample data as a list of slides, one per slide type."""
+    package_root = Path(__file__).parent.parent
+    sample_file = package_root / "sample_data" / "sample_slides.json"
+    with open(sample_file) as f:
+        data = json.load(f)
+    return [{"type": slide_type, "content": content} for slide_type, content in data.items()]
+
+
+def test_validate_presentation_dispatches_on_type(sample_slides):
+    """Each slide is validated with the content model for its type."""
+    validated = validate_presentation(sample_slides)
+
+    assert len(validated) == 14
+    for slide, slide_data in zip(validated, sample_slides):
+        assert slide.type == slide_data["type"]
+        assert isinstance(slide.content, SLIDE_CONTENT_MODELS[slide_data["type"]])
+        assert slide.content.model_dump() == slide_data["content"]
+
+
+def test_validate_presentation_json_matches_python(sample_slides):
+    """Validating JSON bytes gives the same result as validating dicts."""
+    from_json = validate_presentation_json(json.dumps(sample_slides).encode())
+    from_python = validate_presentation(sample_slides)
+
+    assert from_json == from_python
+
+
+def test_validate_presentation_reports_slide_index(sample_slides):
+    """Errors are located by slide index and type tag."""
+    sample_slides[3]["content"]["title"] = "x" * 1000
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_presentation(sample_slides)
+
+    error = exc_info.value.errors()[0]
+    assert error["loc"][:3] == (3, "highlight", "content")
+    assert error["type"] == "string_too_long"
+
+
+def test_validate_presentation_rejects_unknown_type():
+    """Unknown slide types fail the discriminator."""
+    with pytest.raises(ValidationError):
+        validate_presentation([{"type": "unknown", "content": {}}])
+
+
+def test_render_from_file_matches_render_presentation(tmp_path, sample_slides):
+    """render_from_file (JSON bytes path) matches render_presentation."""
+    json_file = tmp_path / "slides.json"
+    json_file.write_text(json.dumps(sample_slides))
+
+    renderer = SlideRenderer()
+    assert renderer.render_from_file(json_file) == renderer.render_presentation(sample_slides)
+
+
+def test_render_presentation_invalid_slide_names_index(sample_slides):
+    """Invalid decks still report the failing slide index and type."""
+    del sample_slides[2]["content"]["image_url"]
+
+    with pytest.raises(ValueError, match=r"slide 2 \(single_content_with_image\)"):
+        SlideRenderer().render_presentation(sample_slides)
+
+
+def test_lenient_validation_keeps_invalid_slides(sample_slides):
+    """strict=False returns invalid slides as plain values instead of raising."""
+    sample_slides[1]["content"] = {}
+    data = json.dumps(sample_slides[:3] + [7]).encode()
+
+    slides = validate_presentation_json(data, strict=False)
+
+    assert slides[0] == validate_presentation(sample_slides[:1])[0]
+    assert slides[1] == sample_slides[1]
+    assert slides[2] == validate_presentation(sample_slides[2:3])[0]
+    assert slides[3] == 7
+
+
+def test_render_json_invalid_slide_parses_once(sample_slides, monkeypatch):
+    """An invalid deck is reported from the first parse; json.loads isn't called."""
+    from slide_renderer import _json
+
+    def no_second_parse(data):
+        raise AssertionError("JSON parsed twice")
+
+    monkeypatch.setattr(_json, "loads", no_second_parse)
+    del sample_slides[2]["content"]["image_url"]
+    chunks = SlideRenderer().render_json_iter(json.dumps(sample_slides).encode())
+
+    with pytest.raises(ValueError, match=r"slide 2 \(single_content_with_image\)"):
+        list(chunks)
+
+
+def test_collect_slide_errors_reports_every_failure(sample_slides):
+    """Every failing slide is reported with index, type, field and constraint."""
+    sample_slides[0]["content"]["title"] = "x" * 100
+    del sample_slides[4]["content"]["items"][1]["description"]
+    sample_slides[7] = {"type": "unknown", "content": {}}
+
+    errors = collect_slide_errors(sample_slides)
+
+    summary = [(e.index, e.slide_type, e.field, e.constraint) for e in errors]
+    assert summary == [
+        (0, "title_slide", "content.title", "string_too_long"),
+        (4, "two_column_list", "content.items.1.description", "missing"),
+        (7, "unknown", "", "union_tag_invalid"),
+    ]
+    assert errors[0].value == "x" * 100
+    assert errors[0].context == {"max_length": 80}
+
+
+def test_collect_slide_errors_valid_deck(sample_slides):
+    """A valid deck has no errors."""
+    assert collect_slide_errors(sample_slides) == []
+
+
+def test_render_presentation_report_renders_valid_slides(sample_slides):
+    """Valid slides are rendered even when others fail."""
+    renderer = SlideRenderer()
+    expected = renderer.render_presentation(sample_slides[1:3] + sample_slides[4:])
+
+    sample_slides[0]["content"]["title"] = "x" * 100
+    sample_slides[3]["content"] = {}
+    report = renderer.render_presentation_report(sample_slides)
+
+    assert not report.ok
+    assert report.failed == [0, 3]
+    assert len(report.errors) == 3  # title too long + highlight title/content missing
+    assert report.rendered == [1, 2] + list(range(4, 14))
+    assert report.markdown == expected
+
+
+def test_render_presentation_report_valid_deck(sample_slides):
+    """A valid deck renders exactly like render_presentation."""
+    renderer = SlideRenderer()
+    report = renderer.render_presentation_report(sample_slides)
+
+    assert report.ok
+    assert report.markdown == renderer.render_presentation(sample_slides)
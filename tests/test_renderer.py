@@ -10,13 +10,25 @@ from pathlib import Path
 import pytest
 
 from slide_renderer import SlideRenderer
+from slide_renderer.compiler import compile_templates
+from slide_renderer.loader import TEMPLATE_DIR
 
 
 # Pytest fixtures
-@pytest.fixture
-def renderer():
-    """Create SlideRenderer instance."""
-    return SlideRenderer()
+@pytest.fixture(scope="session")
+def compiled_module(tmp_path_factory):
+    """Compile the default templates to a pure-Python module."""
+    return compile_templates(output=tmp_path_factory.mktemp("compiled") / "compiled_templates.py")
+
+
+@pytest.fixture(params=["jinja2", "compiled"])
+def renderer(request, compiled_module):
+    """Create SlideRenderer instance for each template backend."""
+    if request.param == "compiled":
+        renderer = SlideRenderer(backend="compiled", compiled_module=compiled_module)
+        assert len(renderer._compiled) == 14
+        return renderer
+    return SlideRenderer(backend="jinja2")
 
 
 @pytest.fixture
@@ -171,6 +183,17 @@ def test_render_with_validation_disabled(renderer, sample_data):
     assert "Slide Deck Title" in rendered
 
 
+def test_render_slide_names_the_slide(renderer, sample_data):
+    """render_slide takes a deck's slide dict and names it in errors."""
+    slide = {"type": "quote", "content": sample_data["quote"]}
+
+    assert renderer.render_slide(slide) == renderer.render("quote", sample_data["quote"])
+    with pytest.raises(ValueError, match=r"slide 4 \(quote\)"):
+        renderer.render_slide({"type": "quote", "content": {}}, index=4)
+    with pytest.raises(ValueError, match="Missing 'type'"):
+        renderer.render_slide({"content": {}})
+
+
 def test_render_multiple_slides(renderer, sample_data):
     """Test rendering multiple slides."""
     slides = [
@@ -212,3 +235,119 @@ def test_complete_presentation_workflow(renderer, sample_data):
         for i, slide_type in enumerate(SLIDE_TYPE_FILES.keys())
         if i < 14
     )
+
+
+@pytest.mark.parametrize("slide_type", list(SLIDE_TYPE_FILES.keys()))
+def test_render_from_validated_model(renderer, sample_data, slide_type):
+    """Test rendering a validated model matches rendering its dumped dict."""
+    model = renderer.validate_content(slide_type, sample_data[slide_type])
+
+    from_model = renderer.render(slide_type, model, validate=False)
+    from_dict = renderer.render(slide_type, model.model_dump(), validate=False)
+
+    assert from_model == from_dict
+    assert renderer.render(slide_type, model) == from_model
+
+
+def test_render_presentation_iter_matches_render_presentation(renderer, sample_data):
+    """Test streamed chunks join to exactly the non-streamed presentation."""
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+
+    chunks = list(renderer.render_presentation_iter(iter(slides)))
+
+    assert chunks[0].startswith("---\nmarp: true")
+    assert len(chunks) == 1 + 2 * len(slides) - 1
+    assert "".join(chunks) == renderer.render_presentation(slides)
+
+
+def test_render_presentation_iter_is_lazy(renderer, sample_data):
+    """Test slides are pulled and rendered only as chunks are consumed."""
+    pulled = []
+
+    def slides():
+        for slide_type in ["title_slide", "section_title"]:
+            pulled.append(slide_type)
+            yield {"type": slide_type, "content": sample_data[slide_type]}
+        yield {"type": "title_slide", "content": {}}
+
+    chunks = renderer.render_presentation_iter(slides(), include_frontmatter=False)
+
+    assert "Slide Deck Title" in next(chunks)
+    assert pulled == ["title_slide"]
+    assert next(chunks) == "\n---\n\n"
+    assert "Section title" in next(chunks)
+    with pytest.raises(ValueError, match="slide 2"):
+        list(chunks)
+
+
+def test_render_to_stream(renderer, sample_data, tmp_path):
+    """Test render_to_stream writes the same presentation incrementally."""
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+    output_file = tmp_path / "presentation.md"
+
+    with open(output_file, "w") as f:
+        written = renderer.render_to_stream(slides, f)
+
+    expected = renderer.render_presentation(slides)
+    assert output_file.read_text() == expected
+    assert written == len(expected)
+
+
+def test_async_rendering_matches_sync(renderer, sample_data, tmp_path):
+    """Test arender/arender_presentation/asave_presentation match the sync API."""
+    import asyncio
+
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+    output_file = tmp_path / "presentation.md"
+
+    async def render_all():
+        rendered = await asyncio.gather(
+            *(renderer.arender(s["type"], s["content"]) for s in slides)
+        )
+        presentation = await renderer.arender_presentation(slides)
+        await renderer.asave_presentation(slides, output_file)
+        return rendered, presentation
+
+    rendered, presentation = asyncio.run(render_all())
+
+    assert rendered == [renderer.render(s["type"], s["content"]) for s in slides]
+    assert presentation == renderer.render_presentation(slides)
+    assert output_file.read_text() == presentation
+
+
+def test_production_mode_precompiles_templates(tmp_path, sample_data):
+    """Test production mode compiles all templates and never touches disk again."""
+    import shutil
+
+    template_dir = tmp_path / "templates"
+    shutil.copytree(TEMPLATE_DIR, template_dir)
+    bytecode_dir = tmp_path / "bytecode"
+
+    renderer = SlideRenderer(template_dir, production=True, bytecode_cache_dir=bytecode_dir)
+    assert len(list(bytecode_dir.iterdir())) == 14
+
+    # Templates are served from memory even if the files disappear
+    shutil.rmtree(template_dir)
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+    assert renderer.render_presentation(slides) == SlideRenderer().render_presentation(slides)
+
+    with pytest.raises(ValueError, match="Template not found"):
+        renderer.render("unknown_slide", {}, validate=False)
+
+
+def test_dev_mode_hot_reloads_templates(tmp_path):
+    """Test dev mode picks up template edits."""
+    import os
+
+    template = tmp_path / "section_title.jinja2"
+    template.write_text("# {{ title }}")
+    renderer = SlideRenderer(template_dir=tmp_path)
+    assert renderer.render("section_title", {"title": "Hi"}) == "# Hi"
+
+    template.write_text("## {{ title }}")
+    stat = template.stat()
+    os.utime(template, (stat.st_atime, stat.st_mtime + 10))
+    assert renderer.render("section_title", {"title": "Hi"}) == "## Hi"
+
+    with pytest.raises(ValueError, match="Template not found"):
+        renderer.render("title_slide", {"title": "t", "subtitle": "s"})
@@ -0,0 +1,237 @@
+"""
+Pytest-based tests for the HTTP render service.
+
+Servers bind to a free port on localhost and run in a background thread.
+"""
+
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.server import LatencyHistogram, RenderService, make_server
+
+
+def start_server(workers: int):
+    """Start a server on a free localhost port; returns (server, port)."""
+    server = make_server(port=0, workers=workers)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server, server.server_address[1]
+
+
+@pytest.fixture
+def port():
+    """Port of a running in-process (workers=1) server."""
+    server, port = start_server(workers=1)
+    yield port
+    server.shutdown()
+    server.server_close()
+
+
+def post(conn: http.client.HTTPConnection, path: str, payload) -> tuple[int, str, str]:
+    """POST JSON on a connection; returns (status, content type, body)."""
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    return response.status, response.getheader("Content-Type"), response.read().decode()
+
+
+def test_render_deck(port, deck):
+    """/render returns the same markdown as render_presentation."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+
+    status, content_type, body = post(conn, "/render", deck)
+
+    assert status == 200
+    assert content_type.startswith("text/markdown")
+    assert body == SlideRenderer().render_presentation(deck)
+
+
+def test_render_options(port, deck):
+    """Query parameters turn off validation and the frontmatter."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+
+    status, _, body = post(conn, "/render?frontmatter=false&validate=false", deck[:2])
+
+    assert status == 200
+    assert body == SlideRenderer().render_presentation(
+        deck[:2], validate=False, include_frontmatter=False
+    )
+
+
+def test_render_slide(port, deck):
+    """/render/slide renders a single slide."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+
+    status, _, body = post(conn, "/render/slide", deck[0])
+
+    assert status == 200
+    assert body == SlideRenderer().render(deck[0]["type"], deck[0]["content"])
+
+
+def test_validate(port, deck):
+    """/validate reports every failure with its slide index and field."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    broken = [deck[0], {"type": "quote", "content": {"quote": "x" * 300}}]
+
+    status, _, body = post(conn, "/validate", deck)
+    assert status == 200
+    assert json.loads(body) == {"valid": True, "errors": []}
+
+    status, _, body = post(conn, "/validate", broken)
+    result = json.loads(body)
+    assert status == 200
+    assert result["valid"] is False
+    assert {(e["index"], e["field"]) for e in result["errors"]} == {
+        (1, "content.quote"),
+        (1, "content.author"),
+    }
+
+
+def test_invalid_requests(port, deck):
+    """Malformed JSON is 400, invalid content 422 with errors, unknown paths 404."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+
+    status, content_type, body = post(conn, "/render", b"[{")
+    assert status == 400
+    assert content_type == "application/json"
+    assert "Invalid JSON" in json.loads(body)["error"]
+
+    status, _, body = post(conn, "/render", {"type": "quote"})
+    assert status == 400
+
+    status, _, body = post(conn, "/render", [{"type": "quote", "content": {}}])
+    assert status == 422
+    assert {e["field"] for e in json.loads(body)["errors"]} == {"content.quote", "content.author"}
+
+    status, _, body = post(conn, "/render/slide", {"type": "nope", "content": {}})
+    assert status == 422
+
+    status, _, _ = post(conn, "/nowhere", deck)
+    assert status == 404
+
+
+def test_negative_content_length(port):
+    """A negative Content-Length is rejected and the connection closed, without reading."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.putrequest("POST", "/render")
+    conn.putheader("Content-Length", "-1")
+    conn.endheaders()
+    conn.send(b"[]")
+
+    response = conn.getresponse()
+
+    assert response.status == 400
+    assert json.loads(response.read()) == {"error": "Invalid Content-Length"}
+    assert response.getheader("Connection") == "close"
+
+
+def test_keep_alive(port, deck):
+    """Many requests, including errors, share one connection."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+
+    statuses = [post(conn, "/render", deck)[0] for _ in range(3)]
+    statuses.append(post(conn, "/render", b"not json")[0])
+    statuses.append(post(conn, "/render/slide", deck[1])[0])
+    sock = conn.sock
+
+    assert statuses == [200, 200, 200, 400, 200]
+    assert sock is not None and conn.sock is sock
+
+
+def test_metrics(port, deck):
+    """/metrics reports latency histograms per endpoint and batching stats."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    post(conn, "/render", deck)
+    post(conn, "/render", b"[")
+    post(conn, "/validate", deck)
+
+    conn.request("GET", "/metrics")
+    metrics = json.loads(conn.getresponse().read())
+
+    render = metrics["endpoints"]["/render"]
+    assert render["count"] == 2
+    assert render["errors"] == 1
+    assert render["buckets"][-1] == ["+Inf", 2]
+    assert render["p50_ms"] is not None
+    assert metrics["endpoints"]["/validate"]["count"] == 1
+    assert metrics["endpoints"]["/render/slide"]["count"] == 0
+    assert metrics["batching"]["requests"] == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_concurrent_requests_are_batched(deck, workers):
+    """Requests arriving while workers are busy share batches; all are answered."""
+    server, port = start_server(workers=workers)
+    expected = SlideRenderer().render(deck[0]["type"], deck[0]["content"])
+
+    def request(_):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        try:
+            return post(conn, "/render/slide", deck[0])
+        finally:
+            conn.close()
+
+    try:
+        with ThreadPoolExecutor(16) as pool:
+            replies = list(pool.map(request, range(64)))
+        stats = server.service.batch_stats
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert all(status == 200 and body == expected for status, _, body in replies)
+    assert stats.requests == 64
+    assert stats.batches <= 64
+
+
+def test_service_batches_queued_jobs(deck):
+    """Jobs queued while the worker is busy go out as one batch."""
+    body = json.dumps(deck[0]).encode()
+    with RenderService(workers=1) as service:
+        futures = [service.submit(("/render/slide", body, True, True)) for _ in range(10)]
+        replies = [future.result(10) for future in futures]
+        stats = service.batch_stats
+
+    assert [status for status, _, _ in replies] == [200] * 10
+    assert stats.requests == 10
+    assert stats.batches < 10
+    assert stats.max_size > 1
+
+
+class _SilentPool:
+    """Pool stand-in whose tasks never answer, like a worker killed mid-batch."""
+
+    def apply_async(self, *args, **kwargs) -> None:
+        pass
+
+
+def test_unanswered_batch_frees_its_worker(deck):
+    """A batch the worker never answers times out instead of holding its slot."""
+    body = json.dumps(deck[0]).encode()
+    with RenderService(workers=2, batch_timeout=0.1) as service:
+        pool, service._pool = service._pool, _SilentPool()
+        try:
+            # More batches than workers: each needs a slot freed by a timeout
+            for _ in range(4):
+                future = service.submit(("/render/slide", body, True, True))
+                with pytest.raises(TimeoutError, match="No reply from the worker"):
+                    future.result(5)
+        finally:
+            service._pool = pool
+
+
+def test_latency_histogram_quantiles():
+    """Quantiles are reported as bucket upper bounds."""
+    histogram = LatencyHistogram(bounds=(1, 10, 100))
+    for ms in [0.5] * 50 + [5] * 40 + [50] * 9 + [500]:
+        histogram.observe(ms)
+
+    assert histogram.quantile(0.5) == 1
+    assert histogram.quantile(0.9) == 10
+    assert histogram.quantile(0.99) == 100
+    assert histogram.quantile(1.0) == float("inf")
+    assert histogram.snapshot()["buckets"] == [[1, 50], [10, 90], [100, 99], ["+Inf", 100]]
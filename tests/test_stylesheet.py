@@ -0,0 +1,121 @@
+"""
+Pytest-based tests for per-deck CSS tree-shaking.
+"""
+
+import re
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.htmlexport import load_theme
+from slide_renderer.stylesheet import (
+    cache_info,
+    deck_stylesheet,
+    shake_css,
+    slide_type_classes,
+    template_classes,
+)
+from slide_renderer.types import SlideTypeEnum
+
+
+@pytest.mark.parametrize("slide_type", [t.value for t in SlideTypeEnum])
+def test_classes_cover_rendered_slide(sample_data, slide_type):
+    """Every class a rendered slide uses is kept for its slide type."""
+    html = SlideRenderer().render_html(
+        [{"type": slide_type, "content": sample_data[slide_type]}], theme_css=""
+    )
+    used = set()
+    for value in re.findall(r'class="([^"]*)"', html.split('<div class="marpit">')[1]):
+        used.update(value.split())
+
+    assert used <= slide_type_classes(slide_type)
+    assert set(SlideTypeEnum(slide_type).get_css_classes()) <= slide_type_classes(slide_type)
+
+
+def test_shake_keeps_base_and_needed_rules():
+    """Rules are kept when every class of one selector is used; at-rules always."""
+    css = """
+    /* @theme t */
+    @font-face { font-family: 'X'; src: url('x.woff2'); }
+    section { color: #000; }
+    section.center { display: flex; }
+    .quote .avatar, .grid-3col { width: 80px; }
+    .grid-3col { gap: 20px; }
+    @media print { .quote { margin : 0 ; } .metric { margin: 0; } }
+    """
+
+    shaken = shake_css(css, {"quote", "avatar"})
+
+    assert shaken == (
+        "/* @theme t */\n"
+        "@font-face{font-family:'X';src:url('x.woff2')}"
+        "section{color:#000}"
+        ".quote .avatar{width:80px}"
+        "@media print{.quote{margin:0}}"
+    )
+
+
+def test_shake_selector_lists_are_either_or():
+    """One alternative of :is()/:where()/:has() is enough; :not() requires nothing."""
+    assert shake_css(".a:is(.b,.c) .d{color:red}", {"a", "b", "d"}) == ".a:is(.b,.c) .d{color:red}"
+    assert shake_css(".a:where(.b, :is(.c, .e)){color:red}", {"a", "e"}) != ""
+    assert shake_css(".a:not(.x):has(> .b){color:red}", {"a", "b"}) != ""
+    assert shake_css(".a:is(.b,.c) .d{color:red}", {"a", "d"}) == ""
+    assert shake_css(".a:where(.b,.c){color:red}", {"b"}) == ""
+
+
+def test_shake_minifies_without_changing_strings():
+    """Whitespace is collapsed outside strings only; selectors keep descendant spaces."""
+    css = (
+        "section  h1 > p ,  section :first-child "
+        "{ font-family : 'A  B', sans-serif !important ; }"
+    )
+
+    assert shake_css(css, None) == (
+        "section h1>p,section :first-child{font-family:'A  B',sans-serif!important}"
+    )
+
+
+def test_deck_stylesheet_drops_unused_layouts():
+    """A deck of two slide types gets a much smaller stylesheet."""
+    theme = load_theme()
+
+    css = deck_stylesheet(["title_slide", "quote", "quote"], theme)
+
+    assert ".quote .avatar{" in css
+    assert "section.center{" in css
+    assert "@font-face{" in css
+    assert ".grid-3col" not in css
+    assert ".two-column" not in css
+    assert len(css) < 0.6 * len(deck_stylesheet([t.value for t in SlideTypeEnum], theme))
+
+
+def test_deck_stylesheet_is_cached_by_slide_type_set():
+    """Decks with the same slide types share one cached stylesheet."""
+    theme = load_theme()
+    first = deck_stylesheet(["quote", "title_slide"], theme)
+    hits = cache_info().hits
+
+    assert deck_stylesheet(["title_slide", "quote", "title_slide"], theme) is first
+    assert cache_info().hits == hits + 1
+
+
+def test_unknown_classes_keep_everything(tmp_path):
+    """Unknown slide types and computed classes disable shaking."""
+    theme = load_theme()
+    (tmp_path / "quote.jinja2").write_text('<div class="{{ kind }}">{{ quote }}</div>')
+
+    assert template_classes('<p class="a b"></p><!-- _class: lead -->') == {"a", "b", "lead"}
+    assert slide_type_classes("nope") is None
+    assert deck_stylesheet(["quote", "nope"], theme) == shake_css(theme, None)
+    assert slide_type_classes("quote", SlideRenderer(tmp_path)) is None
+
+
+def test_render_html_tree_shake(sample_data):
+    """render_html(tree_shake=True) inlines the deck's stylesheet."""
+    slides = [{"type": "quote", "content": sample_data["quote"]}]
+
+    html = SlideRenderer().render_html(slides, tree_shake=True)
+
+    assert deck_stylesheet(["quote"], load_theme()) in html
+    assert ".two-column" not in html
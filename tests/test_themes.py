@@ -0,0 +1,162 @@
+"""
+Pytest-based tests for the theme registry and its renderer pool.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.themes import ThemeRegistry
+
+QUOTE = {"quote": "Stay hungry", "author": "Steve Jobs"}
+
+
+@pytest.fixture
+def acme(tmp_path):
+    """A tenant theme: its own CSS and one overridden template."""
+    template_dir = tmp_path / "acme"
+    template_dir.mkdir()
+    (template_dir / "quote.jinja2").write_text("> {{ quote }} ({{ author }})\n")
+    css = tmp_path / "acme.css"
+    css.write_text('@import "default";\nsection { color: navy; }\n')
+    return template_dir, css
+
+
+def touch(path: Path, text: str) -> None:
+    """Rewrite a file and move its mtime forward, so the change is visible."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_overrides_layer_over_bundled_templates(deck, acme):
+    """A theme overrides only its own templates; the rest are the bundled ones."""
+    template_dir, css = acme
+    registry = ThemeRegistry()
+    registry.register("acme", template_dir=template_dir, css=css)
+    registry.register("base")
+
+    renderer = registry.renderer("acme")
+
+    assert renderer.render("quote", QUOTE) == "> Stay hungry (Steve Jobs)\n"
+    assert renderer.render("title_slide", deck[0]["content"]) == SlideRenderer().render(
+        "title_slide", deck[0]["content"]
+    )
+    assert registry.renderer("base").render("quote", QUOTE) == SlideRenderer().render(
+        "quote", QUOTE
+    )
+    assert registry.css("acme") == "\nsection { color: navy; }\n"
+    assert "section { color: navy; }" in registry.render_html("acme", deck)
+
+
+def test_hits_reuse_the_compiled_renderer(acme):
+    """One renderer per theme is built; later lookups are hits."""
+    registry = ThemeRegistry()
+    registry.register("acme", template_dir=acme[0], css=acme[1])
+
+    first = registry.renderer("acme")
+    assert registry.renderer("acme") is first
+    assert registry.renderer("acme") is first
+
+    assert (registry.stats.hits, registry.stats.misses) == (2, 1)
+    metrics = registry.metrics()
+    assert metrics["themes"] == 1
+    assert metrics["bytes"] == metrics["pooled"]["acme"] > 0
+
+
+def test_lru_eviction_by_count(acme):
+    """Past max_themes, the least recently used theme is evicted."""
+    registry = ThemeRegistry(max_themes=2)
+    for name in ("a", "b", "c"):
+        registry.register(name, css=acme[1])
+
+    registry.renderer("a")
+    registry.renderer("b")
+    registry.renderer("a")
+    registry.renderer("c")
+
+    assert list(registry.metrics()["pooled"]) == ["a", "c"]
+    assert registry.stats.evictions == 1
+
+
+def test_memory_cap_keeps_most_recent_theme(acme):
+    """A pool over max_bytes keeps only the theme just used."""
+    registry = ThemeRegistry(max_bytes=1)
+    registry.register("a")
+    registry.register("b")
+
+    registry.renderer("a")
+    registry.renderer("b")
+
+    assert len(registry) == 1
+    assert list(registry.metrics()["pooled"]) == ["b"]
+    assert registry.stats.evictions == 1
+
+
+def test_file_changes_invalidate_theme(acme):
+    """Editing a theme's templates or CSS rebuilds it on next use."""
+    template_dir, css = acme
+    registry = ThemeRegistry(check_interval=0)
+    registry.register("acme", template_dir=template_dir, css=css)
+    first = registry.renderer("acme")
+
+    touch(template_dir / "quote.jinja2", "Q: {{ quote }}")
+    second = registry.renderer("acme")
+    assert second is not first
+    assert second.render("quote", QUOTE) == "Q: Stay hungry"
+
+    touch(css, "section { color: red; }")
+    assert registry.css("acme") == "section { color: red; }"
+
+    # A new override template counts as a change too
+    touch(template_dir / "section_title.jinja2", "## {{ title }}")
+    assert registry.renderer("acme").render("section_title", {"title": "S"}) == "## S"
+    assert registry.stats.invalidations == 3
+
+
+def test_explicit_invalidation(acme):
+    """invalidate() drops pooled themes without looking at files."""
+    registry = ThemeRegistry(check_interval=None)
+    registry.register("a", css=acme[1])
+    registry.register("b", css=acme[1])
+    first = registry.renderer("a")
+    registry.renderer("b")
+
+    assert registry.invalidate("a") == 1
+    assert registry.renderer("a") is not first
+    assert registry.invalidate() == 2
+    assert len(registry) == 0
+
+
+def test_unknown_theme(acme):
+    """Unknown themes and missing files raise."""
+    registry = ThemeRegistry()
+
+    with pytest.raises(ValueError, match="Unknown theme: nope"):
+        registry.renderer("nope")
+    with pytest.raises(FileNotFoundError):
+        registry.register("bad", css=acme[1].parent / "missing.css")
+    with pytest.raises(FileNotFoundError):
+        registry.register("bad", template_dir=acme[1].parent / "missing")
+
+
+def test_concurrent_misses_build_once(acme):
+    """Threads missing the same theme at once share one build."""
+    registry = ThemeRegistry()
+    registry.register("acme", template_dir=acme[0], css=acme[1])
+    renderers = []
+
+    threads = [
+        threading.Thread(target=lambda: renderers.append(registry.renderer("acme")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(renderer) for renderer in renderers}) == 1
+    assert registry.stats.misses == 1
@@ -0,0 +1,141 @@
+"""
+Pytest-based tests for watch mode.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.loader import TEMPLATE_DIR
+from slide_renderer.watch import DeckWatcher
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    """A private copy of the templates, safe to edit."""
+    return Path(shutil.copytree(TEMPLATE_DIR, tmp_path / "templates"))
+
+
+@pytest.fixture
+def decks(tmp_path, sample_data):
+    """Two decks: one with a quote slide, one without."""
+    with_quote = [
+        {"type": "title_slide", "content": sample_data["title_slide"]},
+        {"type": "quote", "content": sample_data["quote"]},
+    ]
+    without_quote = [{"type": "highlight", "content": sample_data["highlight"]}]
+
+    paths = {"talk": tmp_path / "talk.json", "other": tmp_path / "other.json"}
+    paths["talk"].write_text(json.dumps(with_quote), encoding="utf-8")
+    paths["other"].write_text(json.dumps(without_quote), encoding="utf-8")
+    return paths
+
+
+@pytest.fixture
+def watcher(decks, template_dir):
+    """Watcher over both decks, started."""
+    watcher = DeckWatcher(list(decks.values()), renderer=SlideRenderer(template_dir), debounce=0)
+    watcher.start()
+    return watcher
+
+
+def edit(path: Path, text: str) -> None:
+    """Rewrite a file and move its mtime forward, as a later save would."""
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_start_renders_every_deck(decks, template_dir):
+    """The first poll renders all decks next to their JSON files."""
+    renderer = SlideRenderer(template_dir)
+    events = DeckWatcher(decks.values(), renderer=renderer).poll()
+
+    assert [e.ok for e in events] == [True, True]
+    for path in decks.values():
+        slides = json.loads(path.read_text(encoding="utf-8"))
+        assert path.with_suffix(".md").read_text(encoding="utf-8") == (
+            renderer.render_presentation(slides)
+        )
+
+
+def test_no_changes_no_events(watcher):
+    """Polling without edits does nothing."""
+    assert watcher.poll() == []
+
+
+def test_deck_edit_rerenders_only_that_deck(watcher, decks, sample_data):
+    """Editing one deck re-renders just that deck, and just the changed slide."""
+    slides = json.loads(decks["talk"].read_text(encoding="utf-8"))
+    slides[1]["content"]["author"] = "Someone Else"
+    edit(decks["talk"], json.dumps(slides))
+
+    events = watcher.poll()
+
+    assert [e.source for e in events] == [decks["talk"]]
+    assert events[0].rendered == 1 and events[0].written
+    assert "Someone Else" in decks["talk"].with_suffix(".md").read_text(encoding="utf-8")
+
+
+def test_template_edit_rerenders_decks_using_it(watcher, decks, template_dir):
+    """A template edit only re-renders decks containing that slide type."""
+    template = template_dir / "quote.jinja2"
+    edit(template, template.read_text(encoding="utf-8") + "<!-- edited -->\n")
+
+    events = watcher.poll()
+
+    assert [e.source for e in events] == [decks["talk"]]
+    assert events[0].changed == [template]
+    assert events[0].rendered == 1
+    assert "<!-- edited -->" in decks["talk"].with_suffix(".md").read_text(encoding="utf-8")
+
+
+def test_unchanged_output_is_not_rewritten(watcher, decks):
+    """Re-saving a deck without changes doesn't touch the output."""
+    edit(decks["other"], decks["other"].read_text(encoding="utf-8"))
+
+    events = watcher.poll()
+
+    assert len(events) == 1
+    assert events[0].ok and not events[0].written and events[0].rendered == 0
+
+
+def test_errors_keep_previous_output(watcher, decks):
+    """A broken edit is reported; the output stays until the deck is fixed."""
+    output = decks["other"].with_suffix(".md")
+    before = output.read_text(encoding="utf-8")
+    good = decks["other"].read_text(encoding="utf-8")
+
+    edit(decks["other"], "[{")
+    events = watcher.poll()
+    assert not events[0].ok
+    assert output.read_text(encoding="utf-8") == before
+
+    edit(decks["other"], good)
+    assert watcher.poll()[0].ok
+
+
+def test_run_until_stopped(decks, template_dir):
+    """run() reports events to the callback and returns once stop is set."""
+    stop = threading.Event()
+    events = []
+
+    def callback(event):
+        events.append(event)
+        stop.set()
+
+    watcher = DeckWatcher(decks.values(), renderer=SlideRenderer(template_dir), interval=0)
+    watcher.run(callback=callback, stop=stop)
+
+    assert len(events) == 2
+
+
+def test_production_renderer_rejected(decks):
+    """Production renderers never re-read templates, so they can't watch."""
+    with pytest.raises(ValueError, match="dev-mode"):
+        DeckWatcher(decks.values(), renderer=SlideRenderer(production=True))
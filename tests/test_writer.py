@@ -0,0 +1,148 @@
+"""
+Pytest-based tests for atomic, compressed output files.
+"""
+
+import gzip
+import importlib.util
+import json
+import os
+import stat
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from slide_renderer import SlideRenderer
+from slide_renderer.writer import compression_for, open_atomic, read_text, write_atomic
+
+
+def _has_zstd() -> bool:
+    for name in ("compression.zstd", "zstandard"):
+        try:
+            if importlib.util.find_spec(name) is not None:
+                return True
+        except ModuleNotFoundError:
+            pass
+    return False
+
+
+def test_write_string_and_chunks(tmp_path):
+    """Strings and chunk iterables produce the same file."""
+    path = tmp_path / "out" / "deck.md"
+
+    assert write_atomic(path, "héllo world") == 11
+    assert path.read_text(encoding="utf-8") == "héllo world"
+
+    assert write_atomic(path, iter(["héllo", " ", "world"]), buffer_size=4) == 11
+    assert path.read_text(encoding="utf-8") == "héllo world"
+    assert os.listdir(path.parent) == ["deck.md"]
+
+
+def test_failure_keeps_previous_file(tmp_path):
+    """If the chunk stream raises, the old file stays and no temp file is left."""
+    path = tmp_path / "deck.md"
+    path.write_text("previous", encoding="utf-8")
+
+    def chunks():
+        yield "partial"
+        raise ValueError("slide 3 failed")
+
+    with pytest.raises(ValueError, match="slide 3"):
+        write_atomic(path, chunks())
+
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert os.listdir(tmp_path) == ["deck.md"]
+
+
+def test_context_manager(tmp_path):
+    """open_atomic commits on success and discards on error."""
+    path = tmp_path / "deck.md"
+
+    with pytest.raises(RuntimeError):
+        with open_atomic(path) as f:
+            f.write("never seen")
+            raise RuntimeError
+    assert not path.exists()
+
+    with open_atomic(path) as f:
+        f.writelines(["a", "b"])
+    assert path.read_text(encoding="utf-8") == "ab"
+
+
+def test_file_mode_follows_umask(tmp_path):
+    """Finished files don't keep the temp file's 0600 mode."""
+    path = tmp_path / "deck.md"
+    write_atomic(path, "x")
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    write_atomic(path, "y", mode=0o640)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_import_leaves_umask_alone():
+    """Importing the writer doesn't touch the process umask."""
+    code = (
+        "import os; calls = []; real = os.umask; "
+        "os.umask = lambda m: calls.append(m) or real(m); "
+        "import slide_renderer.writer; print(len(calls))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "0"
+
+
+def test_gzip_by_suffix(tmp_path):
+    """.gz outputs are gzip-compressed, byte-identical across runs."""
+    path = tmp_path / "deck.md.gz"
+    text = "# Slide\n" * 1000
+
+    write_atomic(path, text)
+    first = path.read_bytes()
+    write_atomic(path, text)
+
+    assert gzip.decompress(first).decode("utf-8") == text
+    assert path.read_bytes() == first
+    assert len(first) < len(text)
+    assert read_text(path) == text
+
+
+@pytest.mark.skipif(not _has_zstd(), reason="no zstd module available")
+def test_zstd_by_suffix(tmp_path):
+    """.zst outputs round-trip through read_text."""
+    path = tmp_path / "deck.md.zst"
+    text = "# Slide\n" * 1000
+
+    write_atomic(path, text)
+
+    assert read_text(path) == text
+    assert path.stat().st_size < len(text)
+
+
+def test_compression_for():
+    """Compression is chosen by suffix unless forced."""
+    assert compression_for("deck.md") is None
+    assert compression_for("deck.md.gz") == "gzip"
+    assert compression_for("deck.md.zst") == "zstd"
+    assert compression_for("deck.md.gz", "none") is None
+    assert compression_for("deck.md", "gzip") == "gzip"
+
+    with pytest.raises(ValueError, match="Invalid compression"):
+        compression_for("deck.md", "brotli")
+
+
+def test_save_presentation_compressed(tmp_path):
+    """save_presentation streams to a compressed file by suffix."""
+    package_root = Path(__file__).parent.parent
+    with open(package_root / "sample_data" / "sample_slides.json") as f:
+        sample_data = json.load(f)
+    slides = [{"type": k, "content": v} for k, v in sample_data.items()]
+    renderer = SlideRenderer()
+
+    renderer.save_presentation(slides, tmp_path / "deck.md.gz")
+
+    assert read_text(tmp_path / "deck.md.gz") == renderer.render_presentation(slides)